@@ -7,6 +7,6 @@ from .prompt_compression import PromptCompressionMiddleware
 
 __all__ = ["PromptCompressionMiddleware"]
 
-# Initialize the middleware instance
+# Initialize the middleware instance (the LLMLingua model loads in a background thread)
 prompt_compression_middleware = PromptCompressionMiddleware()
 
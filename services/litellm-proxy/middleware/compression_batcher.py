@@ -0,0 +1,130 @@
+"""
+Micro-batching stage for prompt compression
+Coalesces concurrent compression jobs into one worker call per batch
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from . import compression_worker
+from .compression_executor import CompressionExecutor, CompressionQueueFull
+
+
+@dataclass
+class CompressionJob:
+    """A single request's compression inputs and the future awaiting its result"""
+    context: List[str]
+    instruction: str
+    question: str
+    options: Dict[str, Any]
+    future: asyncio.Future = field(repr=False)
+
+
+class CompressionBatcher:
+    """
+    Collects pending compression jobs and dispatches them to the worker pool in batches.
+
+    A batch is flushed once ``max_batch_size`` jobs are waiting or ``max_wait_seconds``
+    after its first job arrived, whichever comes first. The worker scores all
+    jobs of a batch together (see compression_worker.compress_batch) and each
+    result is routed back to the request awaiting it.
+    """
+
+    def __init__(
+        self,
+        executor: CompressionExecutor,
+        max_batch_size: int = 8,
+        max_wait_seconds: float = 0.005,
+        max_queue_size: int = 32
+    ):
+        self.executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max_wait_seconds
+        self.max_queue_size = max_queue_size
+
+        self._queue: List[CompressionJob] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Strong references to in-flight dispatch tasks (the loop only keeps weak ones)
+        self._dispatching: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        context: List[str],
+        instruction: str,
+        question: str,
+        options: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Queue a compression job and wait for its batch to complete.
+
+        Cancelling the caller (e.g. via asyncio.wait_for) drops the job from its
+        batch if the batch has not been dispatched yet.
+
+        Args:
+            context: Context segments to compress
+            instruction: Instruction (system prompt)
+            question: Latest user question
+            options: Extra compress_prompt keyword arguments (rate, ...)
+
+        Returns:
+            LLMLingua-style result dict for this job
+
+        Raises:
+            CompressionQueueFull: If max_queue_size jobs are already waiting
+        """
+        if len(self._queue) >= self.max_queue_size:
+            raise CompressionQueueFull(
+                f"Compression batch queue full ({len(self._queue)}/{self.max_queue_size})"
+            )
+
+        loop = asyncio.get_running_loop()
+        job = CompressionJob(context, instruction, question, options, loop.create_future())
+        self._queue.append(job)
+
+        if len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait_seconds, self._flush)
+
+        return await job.future
+
+    def _flush(self) -> None:
+        """Move up to max_batch_size live jobs from the queue into a dispatched batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._queue:
+            batch = [job for job in self._queue[:self.max_batch_size] if not job.future.done()]
+            del self._queue[:self.max_batch_size]
+            if batch:
+                task = asyncio.ensure_future(self._dispatch(batch))
+                self._dispatching.add(task)
+                task.add_done_callback(self._dispatching.discard)
+            if len(self._queue) < self.max_batch_size:
+                break
+
+        if self._queue:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.max_wait_seconds, self._flush)
+
+    async def _dispatch(self, batch: List[CompressionJob]) -> None:
+        """Run one batch in the worker pool and resolve each job's future"""
+        payload = [(job.context, job.instruction, job.question, job.options) for job in batch]
+
+        try:
+            results = await self.executor.run(compression_worker.compress_batch, payload)
+        except Exception as e:
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            return
+
+        for job, result in zip(batch, results):
+            if job.future.done():
+                continue
+            if isinstance(result, Exception):
+                job.future.set_exception(result)
+            else:
+                job.future.set_result(result)
@@ -0,0 +1,169 @@
+"""
+Content-addressed cache for compressed prompts
+Two tiers: an in-process LRU with a byte budget, backed by Redis shared across proxies
+"""
+
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+from .metrics import CompressionMetrics
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry"""
+    return " ".join(text.split())
+
+
+class CompressionCache:
+    """
+    Caches LLMLingua results keyed by a hash of the compression inputs.
+
+    Lookups check the local LRU first, then Redis; Redis hits are promoted into
+    the LRU. Writes go to the LRU immediately and to Redis in the background so
+    the request path never waits on the network for a store. Redis failures are
+    treated as misses.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        redis_host: Optional[str] = None,
+        redis_port: int = 6379,
+        ttl_seconds: int = 3600,
+        namespace: str = "litellm:compression",
+        metrics: Optional[CompressionMetrics] = None
+    ):
+        self.max_bytes = max_bytes
+        self.metrics = metrics
+        self.ttl_seconds = ttl_seconds
+        self.namespace = namespace
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._background: Set[asyncio.Task] = set()
+
+        self._redis = None
+        if redis_host:
+            try:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.Redis(
+                    host=redis_host,
+                    port=redis_port,
+                    socket_timeout=0.05,
+                    socket_connect_timeout=0.05
+                )
+            except ImportError:
+                print("Warning: redis not available. Compression cache is in-process only.")
+
+    @staticmethod
+    def make_key(
+        context: List[str],
+        instruction: str,
+        question: str,
+        rate: float,
+        model: str
+    ) -> str:
+        """
+        Build the content address for a compression request.
+
+        Args:
+            context: Context segments
+            instruction: Instruction (system prompt)
+            question: Latest user question
+            rate: Target compression rate
+            model: Compression model name
+
+        Returns:
+            Hex SHA-256 digest of the normalized inputs
+        """
+        digest = hashlib.sha256()
+        for part in (model, repr(rate), _normalize(instruction), _normalize(question)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        for segment in context:
+            digest.update(_normalize(segment).encode("utf-8"))
+            digest.update(b"\x1e")
+        return digest.hexdigest()
+
+    @property
+    def size_bytes(self) -> int:
+        """Bytes currently held by the in-process tier"""
+        return self._size
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached compression result.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached result dict, or None on a miss
+        """
+        raw = self._entries.get(key)
+        if raw is not None:
+            self._entries.move_to_end(key)
+            if self.metrics is not None:
+                self.metrics.record_cache_hit("memory")
+            return json.loads(raw)
+
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(self._redis_key(key))
+            except Exception as e:
+                print(f"Compression cache Redis lookup failed: {e}")
+                raw = None
+
+            if raw is not None:
+                self._store_local(key, raw)
+                if self.metrics is not None:
+                    self.metrics.record_cache_hit("redis")
+                return json.loads(raw)
+
+        if self.metrics is not None:
+            self.metrics.record_cache_miss()
+        return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a compression result in both tiers.
+
+        Args:
+            key: Key from make_key()
+            value: JSON-serializable result dict
+        """
+        raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        self._store_local(key, raw)
+
+        if self._redis is not None:
+            task = asyncio.ensure_future(self._store_remote(key, raw))
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+
+    def _store_local(self, key: str, raw: bytes) -> None:
+        if len(raw) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+        self._entries[key] = raw
+        self._size += len(raw)
+
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    async def _store_remote(self, key: str, raw: bytes) -> None:
+        try:
+            await self._redis.set(self._redis_key(key), raw, ex=self.ttl_seconds)
+        except Exception as e:
+            print(f"Compression cache Redis store failed: {e}")
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
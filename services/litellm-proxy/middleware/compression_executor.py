@@ -0,0 +1,125 @@
+"""
+Bounded worker pool for prompt compression
+Keeps CPU-bound LLMLingua inference off the LiteLLM proxy event loop
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+
+class CompressionQueueFull(RuntimeError):
+    """Raised when the compression pool already holds its maximum number of jobs"""
+
+
+class CompressionExecutor:
+    """
+    Thread or process pool with a bounded backlog for compression jobs.
+
+    Jobs are counted from submission until they finish (running or waiting).
+    Once ``max_queue_size`` jobs are outstanding, new submissions are rejected
+    immediately with CompressionQueueFull instead of queueing behind slow work.
+    """
+
+    def __init__(
+        self,
+        mode: str = "thread",
+        max_workers: int = 2,
+        max_queue_size: int = 32,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = ()
+    ):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported compression executor mode: {mode}")
+        if max_queue_size < max_workers:
+            raise ValueError("max_queue_size must be at least max_workers")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+
+        self._pending = 0
+        self._lock = threading.Lock()
+
+        if mode == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=initializer,
+                initargs=initargs
+            )
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="compression",
+                initializer=initializer,
+                initargs=initargs
+            )
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs currently running or waiting for a worker"""
+        return self._pending
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Execute fn(*args) in the pool and await its result.
+
+        Cancelling the awaiting task (e.g. via asyncio.wait_for) drops the job if
+        it has not started yet; a job that is already running keeps its slot
+        until it completes.
+
+        Args:
+            fn: Callable to execute (must be picklable in process mode)
+            *args: Positional arguments for fn
+
+        Returns:
+            Result of fn(*args)
+
+        Raises:
+            CompressionQueueFull: If max_queue_size jobs are already outstanding
+        """
+        with self._lock:
+            if self._pending >= self.max_queue_size:
+                raise CompressionQueueFull(
+                    f"Compression queue full ({self._pending}/{self.max_queue_size})"
+                )
+            self._pending += 1
+
+        try:
+            future = self._pool.submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def submit_sync(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Submit fn(*args) from a non-async context (e.g. a startup thread).
+
+        Bypasses the backlog limit; intended for warm-up jobs before traffic
+        is admitted.
+
+        Args:
+            fn: Callable to execute (must be picklable in process mode)
+            *args: Positional arguments for fn
+
+        Returns:
+            concurrent.futures.Future for the result
+        """
+        return self._pool.submit(fn, *args)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop accepting jobs and release pool workers.
+
+        Args:
+            wait: Block until running jobs have finished
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._pending -= 1
@@ -0,0 +1,200 @@
+"""
+Adaptive compression policy
+Decides per request whether compression pays off, and at which rate, from observed cost and latency
+"""
+
+import json
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+from .metrics import CompressionMetrics
+
+
+@dataclass(frozen=True)
+class CompressionDecision:
+    """Outcome of a policy evaluation, kept for auditing"""
+    compress: bool
+    reason: str
+    rate: float
+    tenant_id: Optional[str]
+    model: Optional[str]
+    tokens: int
+    expected_saved_tokens: int
+    expected_token_savings_usd: float
+    expected_latency_seconds: float
+    expected_overhead_usd: float
+
+
+class CompressionPolicy:
+    """
+    Cost/latency model for prompt compression.
+
+    For each request the policy estimates:
+
+    - tokens saved: ``tokens * observed savings ratio`` (EWMA, seeded from
+      the profile's target rate)
+    - token savings: tokens saved * the model's input price per token
+    - overhead: expected compression latency (EWMA of seconds per input
+      token) valued at the CPU cost per second plus a latency value per
+      second
+
+    Compression runs only when savings exceed ``min_benefit_ratio`` times the
+    overhead; models without a known price are always compressed. When savings
+    exceed ``aggressive_benefit_ratio`` times the overhead and the profile
+    defines an ``aggressive_rate``, that rate is used instead. Every decision
+    is counted in Prometheus and kept in a bounded audit log.
+    """
+
+    def __init__(
+        self,
+        cpu_cost_per_hour: float = 0.04,
+        latency_value_per_second: float = 0.0001,
+        min_benefit_ratio: float = 1.0,
+        aggressive_benefit_ratio: float = 20.0,
+        initial_seconds_per_token: float = 0.0002,
+        smoothing: float = 0.1,
+        audit_size: int = 1000,
+        log_decisions: bool = False,
+        metrics: Optional[CompressionMetrics] = None
+    ):
+        self.cpu_cost_per_second = cpu_cost_per_hour / 3600
+        self.latency_value_per_second = latency_value_per_second
+        self.min_benefit_ratio = min_benefit_ratio
+        self.aggressive_benefit_ratio = aggressive_benefit_ratio
+        self.smoothing = smoothing
+        self.log_decisions = log_decisions
+        self.metrics = metrics
+
+        self.seconds_per_token = initial_seconds_per_token
+        self.savings_ratio: Dict[float, float] = {}
+
+        self._prices: Dict[str, Optional[float]] = {}
+        self._audit: "deque[CompressionDecision]" = deque(maxlen=audit_size)
+        self._lock = threading.Lock()
+
+    def decide(
+        self,
+        tenant_id: Optional[str],
+        model: Optional[str],
+        tokens: int,
+        profile: Mapping[str, Any]
+    ) -> CompressionDecision:
+        """
+        Decide whether to compress a request and at which rate.
+
+        Args:
+            tenant_id: Tenant identifier
+            model: Target model name
+            tokens: Prompt token count
+            profile: Resolved compression profile
+
+        Returns:
+            CompressionDecision (also recorded in the audit log)
+        """
+        rate = profile["rate"]
+        saving_ratio = self.savings_ratio.get(rate, 1 - rate)
+        saved_tokens = int(tokens * saving_ratio)
+        latency = tokens * self.seconds_per_token
+        overhead = latency * (self.cpu_cost_per_second + self.latency_value_per_second)
+
+        price = profile.get("input_cost_per_token")
+        if price is None:
+            price = self._input_price(model)
+        savings = saved_tokens * price if price is not None else 0.0
+
+        if price is None:
+            compress, reason = True, "unknown_price"
+        elif savings < overhead * self.min_benefit_ratio:
+            compress, reason = False, "not_worth_it"
+        elif savings >= overhead * self.aggressive_benefit_ratio and "aggressive_rate" in profile:
+            compress, reason = True, "aggressive"
+            rate = profile["aggressive_rate"]
+        else:
+            compress, reason = True, "worth_it"
+
+        decision = CompressionDecision(
+            compress=compress,
+            reason=reason,
+            rate=rate,
+            tenant_id=tenant_id,
+            model=model,
+            tokens=tokens,
+            expected_saved_tokens=saved_tokens,
+            expected_token_savings_usd=savings,
+            expected_latency_seconds=latency,
+            expected_overhead_usd=overhead
+        )
+        self._record(decision)
+        return decision
+
+    def observe(
+        self,
+        rate: float,
+        original_tokens: int,
+        compressed_tokens: int,
+        compression_seconds: float
+    ) -> None:
+        """
+        Feed back an actual compression so estimates track reality.
+
+        Args:
+            rate: Rate the compression ran at
+            original_tokens: Prompt tokens before compression
+            compressed_tokens: Prompt tokens after compression
+            compression_seconds: Wall time spent compressing (incl. cache hits)
+        """
+        if original_tokens <= 0:
+            return
+
+        alpha = self.smoothing
+        with self._lock:
+            self.seconds_per_token += alpha * (
+                compression_seconds / original_tokens - self.seconds_per_token
+            )
+            ratio = 1 - compressed_tokens / original_tokens
+            previous = self.savings_ratio.get(rate, 1 - rate)
+            self.savings_ratio[rate] = previous + alpha * (ratio - previous)
+
+    def recent_decisions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Most recent decisions, newest last.
+
+        Args:
+            limit: Maximum number of decisions to return
+
+        Returns:
+            List of decision dicts
+        """
+        decisions = list(self._audit)
+        if limit is not None:
+            decisions = decisions[-limit:]
+        return [asdict(decision) for decision in decisions]
+
+    def _record(self, decision: CompressionDecision) -> None:
+        self._audit.append(decision)
+        if self.metrics is not None:
+            self.metrics.record_decision(decision.compress, decision.reason)
+        if self.log_decisions:
+            print(json.dumps({"event": "compression_decision", **asdict(decision)}))
+
+    def _input_price(self, model: Optional[str]) -> Optional[float]:
+        """Input price per token from LiteLLM's model cost map (cached per model)"""
+        if not model:
+            return None
+        if model in self._prices:
+            return self._prices[model]
+
+        price = None
+        try:
+            import litellm
+
+            info = litellm.model_cost.get(model) or litellm.model_cost.get(model.split("/", 1)[-1])
+            if info:
+                price = info.get("input_cost_per_token")
+        except Exception:
+            price = None
+
+        self._prices[model] = price
+        return price
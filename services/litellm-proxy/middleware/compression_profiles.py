@@ -0,0 +1,215 @@
+"""
+Compression profile resolution
+Maps tenant, model and request metadata to a compression profile from an in-memory snapshot
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+# Request metadata key that selects a use-case profile (e.g. "rag_queries", "chat")
+PROFILE_METADATA_KEY = "compression_profile"
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    """
+    Immutable, pre-merged view of all compression profiles.
+
+    ``table`` holds the fully merged profile for every (tenant, use case) pair
+    that has tenant overrides; ``defaults`` holds the base profile per use case.
+    Snapshots are swapped atomically, so readers never see a partial update.
+    """
+    version: str
+    defaults: Mapping[str, Mapping[str, Any]]
+    table: Mapping[Tuple[str, str], Mapping[str, Any]] = field(default_factory=dict)
+    model_use_cases: Mapping[str, str] = field(default_factory=dict)
+
+
+def build_snapshot(
+    base_profiles: Dict[str, Dict[str, Any]],
+    document: Optional[Dict[str, Any]] = None
+) -> ProfileSnapshot:
+    """
+    Merge base profiles with a platform-api profile document.
+
+    Document shape (all keys optional)::
+
+        {
+          "version": "2024-06-01T12:00:00Z",
+          "profiles": {"rag_queries": {"rate": 0.3}},
+          "models": {"gpt-4o-mini": "chat"},
+          "tenants": {
+            "tenant-a": {"enabled": false},
+            "tenant-b": {"profiles": {"chat": {"rate": 0.7, "min_tokens": 800}}}
+          }
+        }
+
+    Args:
+        base_profiles: Built-in profiles keyed by use case
+        document: Profile document from platform-api (or a file)
+
+    Returns:
+        Compiled ProfileSnapshot
+    """
+    document = document or {}
+
+    defaults: Dict[str, Dict[str, Any]] = {}
+    for name, profile in base_profiles.items():
+        defaults[name] = {**profile, "name": name}
+    for name, overrides in document.get("profiles", {}).items():
+        defaults[name] = {**defaults.get(name, defaults["default"]), **overrides, "name": name}
+
+    table: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+    for tenant_id, tenant_doc in document.get("tenants", {}).items():
+        tenant_wide = {k: v for k, v in tenant_doc.items() if k != "profiles"}
+        per_use_case = tenant_doc.get("profiles", {})
+        for name, profile in defaults.items():
+            merged = {**profile, **tenant_wide, **per_use_case.get(name, {}), "name": name}
+            table[(tenant_id, name)] = MappingProxyType(merged)
+
+    return ProfileSnapshot(
+        version=str(document.get("version", "builtin")),
+        defaults=MappingProxyType({k: MappingProxyType(v) for k, v in defaults.items()}),
+        table=MappingProxyType(table),
+        model_use_cases=MappingProxyType(dict(document.get("models", {})))
+    )
+
+
+class ProfileResolver:
+    """
+    Resolves the compression profile for a request without I/O.
+
+    The hot path reads the current snapshot reference and performs a single
+    dict lookup (plus a fallback lookup for tenants without overrides). A
+    daemon thread refreshes the snapshot from ``source`` (a platform-api URL or
+    a local JSON file) every ``refresh_seconds`` and swaps it in atomically.
+    """
+
+    def __init__(
+        self,
+        base_profiles: Dict[str, Dict[str, Any]],
+        source: Optional[str] = None,
+        refresh_seconds: float = 30.0
+    ):
+        self.base_profiles = base_profiles
+        self.source = source
+        self.refresh_seconds = refresh_seconds
+
+        self._snapshot = build_snapshot(base_profiles)
+        self._etag: Optional[str] = None
+        self._file_mtime: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> ProfileSnapshot:
+        """Currently active snapshot"""
+        return self._snapshot
+
+    def resolve(
+        self,
+        tenant_id: Optional[str],
+        model: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Mapping[str, Any]:
+        """
+        Pick the compression profile for a request.
+
+        The use case comes from ``metadata["compression_profile"]``, then from
+        the snapshot's model mapping, then "default".
+
+        Args:
+            tenant_id: Tenant (LiteLLM team) identifier
+            model: Requested model name
+            metadata: Request metadata
+
+        Returns:
+            Read-only merged profile (enabled, rate, min_tokens, ...)
+        """
+        snapshot = self._snapshot
+
+        use_case = metadata.get(PROFILE_METADATA_KEY) if metadata else None
+        if use_case is None:
+            use_case = snapshot.model_use_cases.get(model, "default") if model else "default"
+
+        profile = snapshot.table.get((tenant_id, use_case))
+        if profile is None:
+            profile = snapshot.defaults.get(use_case) or snapshot.defaults["default"]
+        return profile
+
+    def load(self, document: Dict[str, Any]) -> None:
+        """
+        Replace the active snapshot with one built from a profile document.
+
+        Args:
+            document: Profile document (see build_snapshot)
+        """
+        self._snapshot = build_snapshot(self.base_profiles, document)
+
+    def start(self) -> None:
+        """Start background refreshing (no-op without a source)"""
+        if not self.source or self._thread is not None:
+            return
+
+        self._thread = threading.Thread(
+            target=self._refresh_loop,
+            name="compression-profiles",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background refreshing"""
+        self._stop.set()
+
+    def refresh(self) -> bool:
+        """
+        Fetch the profile document once and swap it in if it changed.
+
+        Returns:
+            True if a new snapshot was installed
+        """
+        document = self._fetch()
+        if document is None:
+            return False
+        self.load(document)
+        return True
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.refresh():
+                    print(f"Compression profiles updated (version {self._snapshot.version})")
+            except Exception as e:
+                # Keep serving the last good snapshot
+                print(f"Failed to refresh compression profiles: {e}")
+            self._stop.wait(self.refresh_seconds)
+
+    def _fetch(self) -> Optional[Dict[str, Any]]:
+        """Read the document from the source; None when unchanged"""
+        if self.source.startswith(("http://", "https://")):
+            import httpx
+
+            headers = {"If-None-Match": self._etag} if self._etag else {}
+            token = os.getenv("PLATFORM_API_TOKEN")
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+
+            response = httpx.get(self.source, headers=headers, timeout=5.0)
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            self._etag = response.headers.get("ETag")
+            return response.json()
+
+        mtime = os.path.getmtime(self.source)
+        if mtime == self._file_mtime:
+            return None
+        with open(self.source) as f:
+            document = json.load(f)
+        self._file_mtime = mtime
+        return document
@@ -0,0 +1,202 @@
+"""
+Compression worker entry points
+Module-level functions executed inside the compression thread or process pool
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# (context, instruction, question, options) for one request in a batch
+BatchItem = Tuple[List[str], str, str, Dict[str, Any]]
+
+# Compressor used by jobs running in this process. In thread mode the middleware
+# hands over its already-loaded instance; in process mode each worker builds its
+# own copy from init_worker().
+_compressor = None
+
+
+def set_compressor(compressor) -> None:
+    """
+    Register the compressor used by jobs executed in this process.
+
+    Args:
+        compressor: Loaded LLMLingua PromptCompressor (or compatible object)
+    """
+    global _compressor
+    _compressor = compressor
+
+
+def init_worker(
+    model_name: str,
+    device_map: str,
+    use_llmlingua2: bool = False,
+    backend: str = "torch"
+) -> None:
+    """
+    Process pool initializer: load LLMLingua once per worker process.
+
+    Args:
+        model_name: HuggingFace model id of the compression model
+        device_map: Torch device map (e.g. "cpu", "cuda")
+        use_llmlingua2: Load the model as an LLMLingua-2 token classifier
+        backend: Scoring backend (see scoring_backends.BACKENDS)
+    """
+    from .scoring_backends import load_compressor
+
+    set_compressor(load_compressor(model_name, device_map, use_llmlingua2, backend))
+
+
+def warm_up(sample_prompt: str = "") -> bool:
+    """
+    Run one compression on a sample prompt so the first real request does not
+    pay for lazy initialisation (kernel selection, allocator growth).
+
+    Args:
+        sample_prompt: Text to compress; empty skips the inference
+
+    Returns:
+        True once the worker's compressor is loaded
+    """
+    if _compressor is None:
+        raise RuntimeError("Compression worker has no compressor loaded")
+
+    if sample_prompt:
+        _compressor.compress_prompt([sample_prompt], rate=0.5)
+    return True
+
+
+def compress_prompt(
+    context: List[str],
+    instruction: str,
+    question: str,
+    options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run a single LLMLingua compression with the worker's compressor.
+
+    With ``options["context_only"]`` the instruction and question only
+    condition the compression: they are removed from the returned prompt and
+    token counts, so the caller can keep them verbatim. LLMLingua-2 never adds
+    them to its prompt or counts, so its result is returned as is.
+
+    Args:
+        context: Context segments to compress
+        instruction: Instruction (system prompt) to condition on
+        question: Latest user question
+        options: Extra keyword arguments forwarded to compress_prompt
+
+    Returns:
+        LLMLingua result dict (compressed_prompt, origin_tokens, ...)
+    """
+    if _compressor is None:
+        raise RuntimeError("Compression worker has no compressor loaded")
+
+    options = dict(options or {})
+    context_only = options.pop("context_only", False)
+    result = _compressor.compress_prompt(
+        context,
+        instruction=instruction,
+        question=question,
+        **options
+    )
+    if context_only and not getattr(_compressor, "use_llmlingua2", False):
+        return _strip_conditioning(result, instruction, question)
+    return result
+
+
+def _strip_conditioning(result: Dict[str, Any], instruction: str, question: str) -> Dict[str, Any]:
+    """Remove the instruction and question LLMLingua wraps around the compressed context"""
+    prompt = result["compressed_prompt"]
+    if instruction and prompt.startswith(instruction):
+        prompt = prompt[len(instruction):].lstrip("\n")
+    if question and prompt.endswith(question):
+        prompt = prompt[:-len(question)].rstrip("\n")
+    overhead = _token_length(instruction) + _token_length(question)
+    return {
+        **result,
+        "compressed_prompt": prompt,
+        "origin_tokens": max(result["origin_tokens"] - overhead, 0),
+        "compressed_tokens": max(result["compressed_tokens"] - overhead, 0)
+    }
+
+
+def compress_batch(batch: List[BatchItem]) -> List[Any]:
+    """
+    Compress several requests in one worker call.
+
+    With an LLMLingua-2 compressor, all requests sharing a rate are scored in a
+    single compress_prompt call, so their chunks go through the token classifier
+    together in batched forward passes (a batch of one takes the same path, so
+    results are counted the same way). Other compressors fall back to one call
+    per request inside this same worker hop.
+
+    Args:
+        batch: List of (context, instruction, question, options) tuples
+
+    Returns:
+        One result dict per item, or the Exception raised for that item
+    """
+    if _compressor is None:
+        raise RuntimeError("Compression worker has no compressor loaded")
+
+    results: List[Any] = [None] * len(batch)
+
+    if getattr(_compressor, "use_llmlingua2", False):
+        groups: Dict[Any, List[int]] = {}
+        for index, (_, _, _, options) in enumerate(batch):
+            groups.setdefault(options.get("rate"), []).append(index)
+
+        for rate, indices in groups.items():
+            try:
+                _compress_llmlingua2_group(batch, indices, rate, results)
+            except Exception as e:
+                for index in indices:
+                    results[index] = e
+
+        return results
+
+    for index, (context, instruction, question, options) in enumerate(batch):
+        try:
+            results[index] = compress_prompt(context, instruction, question, options)
+        except Exception as e:
+            results[index] = e
+
+    return results
+
+
+def _compress_llmlingua2_group(
+    batch: List[BatchItem],
+    indices: List[int],
+    rate: Optional[float],
+    results: List[Any]
+) -> None:
+    """Score one same-rate group of requests with a single LLMLingua-2 call"""
+    texts = ["\n\n".join(batch[index][0]) for index in indices]
+
+    combined = _compressor.compress_prompt(
+        texts,
+        rate=rate,
+        use_context_level_filter=False
+    )
+    compressed_texts = combined.get("compressed_prompt_list")
+
+    if not compressed_texts or len(compressed_texts) != len(texts):
+        # Unexpected result shape: compress each request on its own
+        for index in indices:
+            context, instruction, question, options = batch[index]
+            results[index] = compress_prompt(context, instruction, question, options)
+        return
+
+    for index, text, compressed in zip(indices, texts, compressed_texts):
+        # LLMLingua-2 scores tokens without the question; append it unless the
+        # caller keeps it separately
+        question = "" if batch[index][3].get("context_only") else batch[index][2]
+        prompt = "\n\n".join(part for part in (compressed, question) if part)
+        results[index] = {
+            "compressed_prompt": prompt,
+            "origin_tokens": _compressor.get_token_length(text) + _token_length(question),
+            "compressed_tokens": _compressor.get_token_length(compressed) + _token_length(question)
+        }
+
+
+def _token_length(text: str) -> int:
+    return _compressor.get_token_length(text) if text else 0
@@ -0,0 +1,194 @@
+"""
+Prometheus metrics for the compression middleware
+Metric objects are created once per registry; per-tenant label children are pre-bound
+"""
+
+import os
+from typing import Dict, Optional, Tuple
+
+# Try to import prometheus_client, but make it optional for development
+try:
+    from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+# Label value used once max_tenants distinct tenants have been seen
+OVERFLOW_TENANT = "other"
+
+SAVINGS_BUCKETS = (0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)
+
+
+class CompressionMetrics:
+    """
+    Compression metrics bound to a single Prometheus registry.
+
+    Label children are resolved once per tenant and kept in a dict, so the
+    recording path is a dict lookup plus one inc/observe per metric. At most
+    ``max_tenants`` tenant label values are tracked; further tenants are
+    recorded under the "other" label to bound series cardinality.
+    """
+
+    def __init__(self, registry: Optional["CollectorRegistry"] = None, max_tenants: int = 500):
+        self.max_tenants = max_tenants
+        self.enabled = PROMETHEUS_AVAILABLE
+        self._tenants: Dict[Optional[str], Tuple] = {}
+        self._overflow: Optional[Tuple] = None
+
+        if not self.enabled:
+            return
+
+        registry = registry if registry is not None else REGISTRY
+
+        self.requests = Counter(
+            'litellm_compression_requests_total',
+            'Total number of compression requests',
+            ['tenant_id'],
+            registry=registry
+        )
+        self.savings = Histogram(
+            'litellm_compression_savings_percent',
+            'Compression savings percentage',
+            ['tenant_id'],
+            buckets=SAVINGS_BUCKETS,
+            registry=registry
+        )
+        self.latency = Histogram(
+            'litellm_compression_latency_seconds',
+            'Compression operation latency',
+            ['tenant_id'],
+            buckets=LATENCY_BUCKETS,
+            registry=registry
+        )
+        self.original_tokens = Histogram(
+            'litellm_compression_original_tokens',
+            'Original token count before compression',
+            ['tenant_id'],
+            buckets=TOKEN_BUCKETS,
+            registry=registry
+        )
+        self.compressed_tokens = Histogram(
+            'litellm_compression_compressed_tokens',
+            'Token count after compression',
+            ['tenant_id'],
+            buckets=TOKEN_BUCKETS,
+            registry=registry
+        )
+        self.skipped = Counter(
+            'litellm_compression_skipped_total',
+            'Compressions skipped to protect request latency',
+            ['reason'],
+            registry=registry
+        )
+        self.cache_hits = Counter(
+            'litellm_compression_cache_hits_total',
+            'Compression cache hits',
+            ['tier'],
+            registry=registry
+        )
+        self.decisions = Counter(
+            'litellm_compression_decisions_total',
+            'Compression policy decisions',
+            ['decision', 'reason'],
+            registry=registry
+        )
+        self.cache_misses = Counter(
+            'litellm_compression_cache_misses_total',
+            'Compression cache misses (both tiers)',
+            registry=registry
+        )
+
+        self.ready = Gauge(
+            'litellm_compression_ready',
+            'Whether the compression model is loaded (1) or still warming up (0)',
+            registry=registry
+        )
+
+        self._cache_hit_children = {
+            tier: self.cache_hits.labels(tier=tier) for tier in ("memory", "redis")
+        }
+
+    def record(
+        self,
+        tenant_id: Optional[str],
+        original_tokens: int,
+        compressed_tokens: int,
+        savings_percent: float,
+        compression_time: float
+    ) -> None:
+        """
+        Record one compression.
+
+        Args:
+            tenant_id: Tenant identifier
+            original_tokens: Original prompt token count
+            compressed_tokens: Compressed prompt token count
+            savings_percent: Percentage of tokens saved
+            compression_time: Time taken to compress in seconds
+        """
+        if not self.enabled:
+            return
+
+        children = self._tenants.get(tenant_id)
+        if children is None:
+            children = self._bind_tenant(tenant_id)
+
+        requests, savings, latency, original, compressed = children
+        requests.inc()
+        savings.observe(savings_percent)
+        latency.observe(compression_time)
+        original.observe(original_tokens)
+        compressed.observe(compressed_tokens)
+
+    def record_skipped(self, reason: str) -> None:
+        """Count a compression skipped because of queue pressure or deadline"""
+        if self.enabled:
+            self.skipped.labels(reason=reason).inc()
+
+    def record_decision(self, compress: bool, reason: str) -> None:
+        """Count a compression policy decision (compress or skip) and its reason"""
+        if self.enabled:
+            self.decisions.labels(decision="compress" if compress else "skip", reason=reason).inc()
+
+    def set_ready(self, ready: bool) -> None:
+        """Publish the compression model readiness"""
+        if self.enabled:
+            self.ready.set(1 if ready else 0)
+
+    def record_cache_hit(self, tier: str) -> None:
+        """Count a compression cache hit in the given tier ("memory" or "redis")"""
+        if self.enabled:
+            self._cache_hit_children[tier].inc()
+
+    def record_cache_miss(self) -> None:
+        """Count a lookup that missed both cache tiers"""
+        if self.enabled:
+            self.cache_misses.inc()
+
+    def _bind_tenant(self, tenant_id: Optional[str]) -> Tuple:
+        """Resolve and cache the label children for a tenant"""
+        if len(self._tenants) >= self.max_tenants:
+            if self._overflow is None:
+                self._overflow = self._children(OVERFLOW_TENANT)
+            return self._overflow
+
+        children = self._children(tenant_id or "default")
+        self._tenants[tenant_id] = children
+        return children
+
+    def _children(self, label: str) -> Tuple:
+        return (
+            self.requests.labels(tenant_id=label),
+            self.savings.labels(tenant_id=label),
+            self.latency.labels(tenant_id=label),
+            self.original_tokens.labels(tenant_id=label),
+            self.compressed_tokens.labels(tenant_id=label)
+        )
+
+
+# Process-wide instance registered with the default registry that LiteLLM exposes
+compression_metrics = CompressionMetrics(
+    max_tenants=int(os.getenv("COMPRESSION_METRICS_MAX_TENANTS", "500"))
+)
@@ -3,11 +3,24 @@ Prompt Compression Middleware using LLMLingua
 Integrates with LiteLLM's custom logger system to compress prompts before LLM calls
 """
 
+import asyncio
+import os
+import threading
 import time
-from typing import Optional, Literal, Dict, Any, List
+from typing import Optional, Literal, Dict, Any, List, Mapping
 import litellm
 from litellm.integrations.custom_logger import CustomLogger
 
+from . import compression_worker
+from .compression_batcher import CompressionBatcher
+from .compression_cache import CompressionCache
+from .compression_executor import CompressionExecutor, CompressionQueueFull
+from .compression_policy import CompressionPolicy
+from .compression_profiles import ProfileResolver
+from .metrics import compression_metrics
+from .scoring_backends import load_compressor
+from .token_counter import TokenCounter
+
 # Try to import LLMLingua, but make it optional for development
 try:
     from llmlingua import PromptCompressor
@@ -16,6 +29,17 @@ except ImportError:
     LLMLINGUA_AVAILABLE = False
     print("Warning: LLMLingua not available. Prompt compression will be disabled.")
 
+LLMLINGUA_MODEL_NAME = os.getenv(
+    "LLMLINGUA_MODEL_NAME",
+    "microsoft/llmlingua-2-bert-base-multilingual-cased-meetingbank"
+)
+LLMLINGUA_DEVICE_MAP = os.getenv("LLMLINGUA_DEVICE_MAP", "cpu")
+LLMLINGUA_USE_V2 = os.getenv(
+    "LLMLINGUA_USE_V2",
+    str("llmlingua-2" in LLMLINGUA_MODEL_NAME)
+).lower() == "true"
+COMPRESSION_BACKEND = os.getenv("COMPRESSION_BACKEND", "torch")
+
 
 class PromptCompressionMiddleware(CustomLogger):
     """
@@ -23,20 +47,82 @@ class PromptCompressionMiddleware(CustomLogger):
     
     Implements LiteLLM's CustomLogger interface to hook into the request lifecycle.
     Compression is applied in the async_pre_call_hook before the LLM API call.
+    
+    LLMLingua inference runs in a bounded thread or process pool so the proxy's
+    event loop never blocks on a forward pass. When the pool is saturated or a
+    request's compression deadline passes, the original request is forwarded.
+    A cost/latency policy skips compression when the target model is cheap
+    enough that the compression overhead outweighs the tokens saved.
+    Concurrent requests are micro-batched so one worker call scores several
+    prompts together.
+    
+    The model loads in a background thread at startup. Until it is ready
+    (see ``ready``), requests are forwarded uncompressed.
     """
     
     def __init__(self):
         super().__init__()
         
-        # Initialize compressor if LLMLingua is available
+        # Worker pool configuration (thread or process pool, bounded backlog)
+        self.executor_config = {
+            "mode": os.getenv("COMPRESSION_EXECUTOR_MODE", "thread"),
+            "max_workers": int(os.getenv("COMPRESSION_MAX_WORKERS", "2")),
+            "max_queue_size": int(os.getenv("COMPRESSION_MAX_QUEUE_SIZE", "32")),
+            "timeout_seconds": float(os.getenv("COMPRESSION_TIMEOUT_MS", "500")) / 1000,
+            "max_batch_size": int(os.getenv("COMPRESSION_BATCH_SIZE", "8")),
+            "max_batch_wait_seconds": float(os.getenv("COMPRESSION_BATCH_WAIT_MS", "5")) / 1000
+        }
+        
+        # Prometheus metrics (created once per process, shared by all requests)
+        self.metrics = compression_metrics
+        self.log_requests = os.getenv("COMPRESSION_LOG_REQUESTS", "false").lower() == "true"
+        
+        # Content-addressed cache of compressed segments (LRU + Redis)
+        self.cache = CompressionCache(
+            max_bytes=int(os.getenv("COMPRESSION_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            redis_host=os.getenv("COMPRESSION_CACHE_REDIS_HOST", os.getenv("REDIS_HOST", "redis")) or None,
+            redis_port=int(os.getenv("REDIS_PORT", "6379")),
+            ttl_seconds=int(os.getenv("COMPRESSION_CACHE_TTL_SECONDS", "3600")),
+            metrics=self.metrics
+        )
+        
+        # Token counting with per-model tokenizers and memoized counts
+        self.token_counter = TokenCounter()
+        
+        # Per-segment compression: short segments are kept verbatim
+        self.segment_config = {
+            "min_segment_tokens": int(os.getenv("COMPRESSION_MIN_SEGMENT_TOKENS", "64"))
+        }
+        
+        # Background model warm-up
+        self.warmup_config = {
+            "enabled": os.getenv("COMPRESSION_WARMUP", "true").lower() == "true",
+            "sample_prompt": os.getenv(
+                "COMPRESSION_WARMUP_PROMPT",
+                " ".join(["Warm-up sample sentence for the compression model."] * 40)
+            ),
+            "tokenizer_models": ["gpt-4o", "gpt-3.5-turbo"]
+        }
+        
+        # Set once the model is loaded (and warmed up); compression is skipped until then
+        self.ready = threading.Event()
+        self.metrics.set_ready(False)
+        
+        # Initialize worker pool if LLMLingua is available; the model loads in the background
         self.compressor = None
+        self.executor = None
+        self.batcher = None
+        self._warmup_thread = None
         if LLMLINGUA_AVAILABLE:
             try:
-                self.compressor = PromptCompressor(
-                    model_name="microsoft/llmlingua-2-bert-base-multilingual-cased-meetingbank",
-                    device_map="cpu"  # Use CPU for now, can be configured for GPU
+                self.executor = self._create_executor()
+                self.batcher = self._create_batcher(self.executor)
+                self._warmup_thread = threading.Thread(
+                    target=self._load_model,
+                    name="compression-warmup",
+                    daemon=True
                 )
-                print("PromptCompressionMiddleware initialized with LLMLingua")
+                self._warmup_thread.start()
             except Exception as e:
                 print(f"Failed to initialize LLMLingua compressor: {e}")
         
@@ -61,6 +147,25 @@ class PromptCompressionMiddleware(CustomLogger):
                 "rate": 0.6
             }
         }
+        
+        # Per-tenant / per-use-case profile overrides, refreshed from platform-api
+        self.profiles = ProfileResolver(
+            self.compression_config,
+            source=os.getenv("COMPRESSION_PROFILES_SOURCE") or None,
+            refresh_seconds=float(os.getenv("COMPRESSION_PROFILES_REFRESH_SECONDS", "30"))
+        )
+        self.profiles.start()
+        
+        # Cost/latency model deciding per request whether compression pays off
+        self.policy = CompressionPolicy(
+            cpu_cost_per_hour=float(os.getenv("COMPRESSION_CPU_COST_PER_HOUR", "0.04")),
+            latency_value_per_second=float(os.getenv("COMPRESSION_LATENCY_VALUE_PER_SECOND", "0.0001")),
+            min_benefit_ratio=float(os.getenv("COMPRESSION_MIN_BENEFIT_RATIO", "1.0")),
+            aggressive_benefit_ratio=float(os.getenv("COMPRESSION_AGGRESSIVE_BENEFIT_RATIO", "20")),
+            audit_size=int(os.getenv("COMPRESSION_POLICY_AUDIT_SIZE", "1000")),
+            log_decisions=os.getenv("COMPRESSION_POLICY_LOG", "false").lower() == "true",
+            metrics=self.metrics
+        )
     
     async def async_pre_call_hook(
         self,
@@ -87,15 +192,15 @@ class PromptCompressionMiddleware(CustomLogger):
         if call_type != "completion":
             return data
         
-        # Skip compression if LLMLingua not available
-        if not self.compressor:
+        # Skip compression if LLMLingua not available or the model is still loading
+        if not self.batcher or not self.ready.is_set():
             return data
         
-        # Check if compression is enabled for this user/tenant
+        # Resolve the tenant's compression profile (in-memory snapshot, no I/O)
         tenant_id = getattr(user_api_key_dict, 'team_id', 'default')
-        compression_enabled = self._check_compression_enabled(tenant_id)
+        profile = self.profiles.resolve(tenant_id, data.get("model"), data.get("metadata"))
         
-        if not compression_enabled:
+        if not profile.get("enabled", True):
             return data
         
         # Extract messages from request
@@ -106,9 +211,18 @@ class PromptCompressionMiddleware(CustomLogger):
         try:
             # Compress the prompt
             compression_start = time.time()
-            compressed_data = await self._compress_messages(messages, data)
+            compressed_data = await self._compress_messages(messages, data, profile, tenant_id)
             compression_time = time.time() - compression_start
             
+            # Feed actual cost and savings back into the policy
+            if compressed_data.get("rate") is not None:
+                self.policy.observe(
+                    compressed_data["rate"],
+                    compressed_data["original_tokens"],
+                    compressed_data["compressed_tokens"],
+                    compression_time
+                )
+            
             # Log compression metrics
             await self._log_compression_metrics(
                 tenant_id=tenant_id,
@@ -120,50 +234,77 @@ class PromptCompressionMiddleware(CustomLogger):
             
             return compressed_data["data"]
         
+        except CompressionQueueFull:
+            self.metrics.record_skipped("queue_full")
+            return data
+        
+        except asyncio.TimeoutError:
+            self.metrics.record_skipped("timeout")
+            return data
+        
         except Exception as e:
             # Log error but don't fail the request - return original data
             print(f"Compression failed for tenant {tenant_id}: {e}")
             return data
     
-    async def _compress_messages(self, messages: List[dict], data: dict) -> Dict[str, Any]:
+    async def _compress_messages(
+        self,
+        messages: List[dict],
+        data: dict,
+        profile: Optional[Mapping[str, Any]] = None,
+        tenant_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Compress message content while preserving structure.
         
+        Every earlier conversation turn is compressed as its own context segment,
+        conditioned on the instruction (system prompt) and the latest question,
+        and memoized by content hash, so a new turn of a growing chat only
+        compresses the messages added since the previous turn. The instruction
+        and the question themselves are passed through uncompressed (a chat of
+        a single user message is compressed as context).
+        
         Args:
             messages: List of message dicts with role and content
             data: Full request data
+            profile: Resolved compression profile (defaults to "default")
+            tenant_id: Tenant identifier (for the policy audit log)
         
         Returns:
-            Dict containing compressed data and metrics
+            Dict containing compressed data and metrics (``rate`` is set only
+            when compression actually ran)
         """
         
-        # Separate system, user, and assistant messages
+        # Separate system messages from the conversation
         system_msgs = [m for m in messages if m.get("role") == "system"]
-        user_msgs = [m for m in messages if m.get("role") == "user"]
-        assistant_msgs = [m for m in messages if m.get("role") == "assistant"]
+        conversation = [m for m in messages if m.get("role") in ("user", "assistant")]
         
-        # Extract content for compression
-        # Context: previous conversation turns (exclude the latest question)
-        context = []
-        if len(user_msgs) > 1:
-            context = [m["content"] for m in user_msgs[:-1]]
-        if assistant_msgs:
-            context.extend([m["content"] for m in assistant_msgs])
+        # Get token count for the target model
+        model = data.get("model")
+        original_tokens = self._estimate_tokens(messages, model)
         
-        # Question: latest user message
-        question = user_msgs[-1]["content"] if user_msgs else ""
+        # Compression settings from the resolved profile
+        config = profile if profile is not None else self.compression_config["default"]
         
-        # Instruction: system message
-        instruction = system_msgs[0]["content"] if system_msgs else ""
-        
-        # Get token count estimate
-        original_tokens = self._estimate_tokens(messages)
-        
-        # Get compression config (default for now, can be made dynamic)
-        config = self.compression_config["default"]
+        # Only compress if above threshold. Multimodal messages and tool turns
+        # are left alone: merging them into one text message would drop their
+        # non-text parts or split tool calls from their results.
+        if (
+            original_tokens < config["min_tokens"]
+            or not conversation
+            or len(system_msgs) + len(conversation) != len(messages)
+            or any(not isinstance(m.get("content"), str) for m in conversation)
+        ):
+            return {
+                "data": data,
+                "original_tokens": original_tokens,
+                "compressed_tokens": original_tokens,
+                "savings_percent": 0
+            }
         
-        # Only compress if above threshold
-        if original_tokens < config["min_tokens"]:
+        # Skip when the expected savings do not cover the compression overhead
+        decision = self.policy.decide(tenant_id, model, original_tokens, config)
+        if not decision.compress:
             return {
                 "data": data,
                 "original_tokens": original_tokens,
@@ -171,46 +312,67 @@ class PromptCompressionMiddleware(CustomLogger):
                 "savings_percent": 0
             }
         
-        # Compress using LLMLingua
+        # Context segments in conversation order; the latest user message (the
+        # question) and the instruction are kept verbatim and condition the rest.
+        # A single-message prompt has no separate question and is the context.
+        segments = [m["content"] for m in conversation]
+        question = ""
+        if len(conversation) > 1 and conversation[-1].get("role") == "user":
+            question = segments.pop()
+        instruction = "\n\n".join(
+            m["content"] for m in system_msgs if isinstance(m.get("content"), str)
+        )
+        question_tokens = self.token_counter.count_text(question, model) if question else 0
+        
         try:
-            compressed_result = self.compressor.compress_prompt(
-                context,
-                instruction=instruction,
-                question=question,
-                rate=config["rate"],
-                condition_compare=True,
-                condition_in_question="after",
-                rank_method="longllmlingua",
-                use_sentence_level_filter=True,
-                context_budget="+100",
-                dynamic_context_compression_ratio=0.4,
-                reorder_context="sort"
+            # Compress new segments in the worker pool, bounded by the deadline.
+            # Segments finished before a timeout stay memoized for the next turn.
+            segment_results = await asyncio.wait_for(
+                asyncio.gather(*[
+                    self._compress_segment(segment, decision.rate, model, instruction, question)
+                    for segment in segments
+                ]),
+                timeout=self.executor_config["timeout_seconds"]
             )
             
-            # Reconstruct messages with compressed content
-            compressed_messages = []
-            
-            # Keep system message if present
-            if system_msgs:
-                compressed_messages.append(system_msgs[0])
-            
-            # Add compressed user message
-            compressed_messages.append({
+            # Reconstruct messages: every system message stays where it was and
+            # the conversation becomes one compressed user message in the
+            # place of its last turn
+            compressed_user_msg = {
                 "role": "user",
-                "content": compressed_result["compressed_prompt"]
-            })
+                "content": "\n\n".join(
+                    [result["compressed_prompt"] for result in segment_results
+                     if result["compressed_prompt"]]
+                    + ([question] if question else [])
+                )
+            }
+            compressed_messages = [
+                m if m.get("role") == "system" else compressed_user_msg
+                for m in messages
+                if m.get("role") == "system" or m is conversation[-1]
+            ]
             
             # Update data with compressed messages
             compressed_data = data.copy()
             compressed_data["messages"] = compressed_messages
             
+            origin_tokens = question_tokens + sum(result["origin_tokens"] for result in segment_results)
+            compressed_tokens = question_tokens + sum(
+                result["compressed_tokens"] for result in segment_results
+            )
+            
             return {
                 "data": compressed_data,
-                "original_tokens": compressed_result["origin_tokens"],
-                "compressed_tokens": compressed_result["compressed_tokens"],
-                "savings_percent": (1 - compressed_result["ratio"]) * 100
+                "original_tokens": origin_tokens,
+                "compressed_tokens": compressed_tokens,
+                "savings_percent": (1 - compressed_tokens / origin_tokens) * 100 if origin_tokens else 0,
+                "rate": decision.rate
             }
         
+        except (CompressionQueueFull, asyncio.TimeoutError):
+            # Let the hook skip compression without recording metrics
+            raise
+        
         except Exception as e:
             print(f"LLMLingua compression failed: {e}")
             # Return original data if compression fails
@@ -221,38 +383,173 @@ class PromptCompressionMiddleware(CustomLogger):
                 "savings_percent": 0
             }
     
-    def _estimate_tokens(self, messages: List[dict]) -> int:
+    async def _compress_segment(
+        self,
+        segment: str,
+        rate: float,
+        model: Optional[str] = None,
+        instruction: str = "",
+        question: str = ""
+    ) -> Dict[str, Any]:
         """
-        Estimate token count for messages using rough heuristic.
-        More accurate counting can be done with tiktoken if needed.
+        Compress a single context segment, reusing memoized results.
+        
+        Segments below min_segment_tokens (acknowledgements, short replies)
+        are passed through verbatim. The instruction and question condition
+        the compression but are not part of the result. LLMLingua-2 scores
+        tokens without them, so its memo key leaves them out and earlier
+        segments stay memoized when the question changes.
         
         Args:
-            messages: List of message dicts
+            segment: Message content
+            rate: Target compression rate
+            model: Target model name (for token counting)
+            instruction: System prompt the segment is compressed for
+            question: Latest user question the segment is compressed for
+        
+        Returns:
+            Dict with compressed_prompt, origin_tokens and compressed_tokens
+        """
+        segment_tokens = self.token_counter.count_text(segment, model)
+        if segment_tokens < self.segment_config["min_segment_tokens"]:
+            return {
+                "compressed_prompt": segment,
+                "origin_tokens": segment_tokens,
+                "compressed_tokens": segment_tokens
+            }
+        
+        if LLMLINGUA_USE_V2:
+            cache_key = self.cache.make_key([segment], "", "", rate, LLMLINGUA_MODEL_NAME)
+        else:
+            cache_key = self.cache.make_key([segment], instruction, question, rate, LLMLINGUA_MODEL_NAME)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        compressed_result = await self.batcher.submit(
+            [segment], instruction, question, {"rate": rate, "context_only": True}
+        )
+        result = {
+            "compressed_prompt": compressed_result["compressed_prompt"],
+            "origin_tokens": compressed_result["origin_tokens"],
+            "compressed_tokens": compressed_result["compressed_tokens"]
+        }
+        self.cache.set(cache_key, result)
+        return result
+    
+    @property
+    def is_ready(self) -> bool:
+        """True once the compression model is loaded and requests may be compressed"""
+        return self.ready.is_set()
+    
+    def _load_model(self) -> None:
+        """
+        Load (and optionally warm up) the compression model off the startup path.
+        
+        Runs in a daemon thread. In thread mode the model is loaded here and
+        shared with the worker threads; in process mode the worker processes
+        load their own copies when the warm-up jobs start them.
+        """
+        start = time.time()
+        try:
+            sample = self.warmup_config["sample_prompt"] if self.warmup_config["enabled"] else ""
+            
+            if self.executor_config["mode"] == "process":
+                futures = [
+                    self.executor.submit_sync(compression_worker.warm_up, sample)
+                    for _ in range(self.executor_config["max_workers"])
+                ]
+                for future in futures:
+                    future.result()
+            else:
+                self.compressor = load_compressor(
+                    LLMLINGUA_MODEL_NAME,
+                    LLMLINGUA_DEVICE_MAP,
+                    LLMLINGUA_USE_V2,
+                    COMPRESSION_BACKEND
+                )
+                compression_worker.set_compressor(self.compressor)
+                compression_worker.warm_up(sample)
+            
+            # Tokenizers load lazily too; pay for that here rather than on a request
+            for model in self.warmup_config["tokenizer_models"]:
+                self.token_counter.count_text("warm-up", model)
+            
+            self.ready.set()
+            self.metrics.set_ready(True)
+            print(
+                f"PromptCompressionMiddleware ready with LLMLingua "
+                f"({COMPRESSION_BACKEND} backend, "
+                f"{self.executor_config['mode']} pool, "
+                f"{self.executor_config['max_workers']} workers, "
+                f"loaded in {time.time() - start:.1f}s)"
+            )
+        except Exception as e:
+            print(f"Failed to initialize LLMLingua compressor: {e}")
+    
+    def _create_executor(self) -> CompressionExecutor:
+        """
+        Build the compression worker pool.
+        
+        In thread mode the workers share the model loaded by _load_model; in
+        process mode every worker process loads its own copy.
         
         Returns:
-            Estimated token count
+            Configured CompressionExecutor
         """
-        total = 0
-        for msg in messages:
-            content = msg.get("content", "")
-            # Rough estimate: 1 token ≈ 4 characters (average for English)
-            total += len(content) // 4
-        return total
+        config = self.executor_config
+        
+        if config["mode"] == "process":
+            return CompressionExecutor(
+                mode="process",
+                max_workers=config["max_workers"],
+                max_queue_size=config["max_queue_size"],
+                initializer=compression_worker.init_worker,
+                initargs=(
+                    LLMLINGUA_MODEL_NAME,
+                    LLMLINGUA_DEVICE_MAP,
+                    LLMLINGUA_USE_V2,
+                    COMPRESSION_BACKEND
+                )
+            )
+        
+        return CompressionExecutor(
+            mode="thread",
+            max_workers=config["max_workers"],
+            max_queue_size=config["max_queue_size"]
+        )
     
-    def _check_compression_enabled(self, tenant_id: str) -> bool:
+    def _create_batcher(self, executor: CompressionExecutor) -> CompressionBatcher:
         """
-        Check if compression is enabled for tenant.
-        In production, this would check feature flags via Flagsmith or Platform API.
+        Build the micro-batching stage in front of the worker pool.
         
         Args:
-            tenant_id: Tenant identifier
+            executor: Worker pool that runs each batch
+        
+        Returns:
+            Configured CompressionBatcher
+        """
+        config = self.executor_config
+        return CompressionBatcher(
+            executor,
+            max_batch_size=config["max_batch_size"],
+            max_wait_seconds=config["max_batch_wait_seconds"],
+            max_queue_size=config["max_queue_size"]
+        )
+    
+    def _estimate_tokens(self, messages: List[dict], model: Optional[str] = None) -> int:
+        """
+        Count tokens for messages with the tokenizer of the target model family.
+        Handles list-style (multimodal) content; counts are memoized per message.
+        
+        Args:
+            messages: List of message dicts
+            model: Target model name
         
         Returns:
-            True if compression should be applied
+            Token count
         """
-        # For R1, enable for all tenants
-        # In R2+, integrate with Flagsmith/Platform API
-        return True
+        return self.token_counter.count_messages(messages, model)
     
     async def _log_compression_metrics(
         self,
@@ -263,7 +560,7 @@ class PromptCompressionMiddleware(CustomLogger):
         compression_time: float
     ):
         """
-        Log compression metrics to Prometheus and console.
+        Record compression metrics in Prometheus and optionally log to console.
         
         Args:
             tenant_id: Tenant identifier
@@ -272,49 +569,17 @@ class PromptCompressionMiddleware(CustomLogger):
             savings_percent: Percentage of tokens saved
             compression_time: Time taken to compress in seconds
         """
-        try:
-            # Import prometheus metrics
-            from prometheus_client import Counter, Histogram
-            
-            # Define metrics (these will be created once)
-            compression_requests = Counter(
-                'litellm_compression_requests_total',
-                'Total number of compression requests',
-                ['tenant_id']
-            )
-            compression_savings = Histogram(
-                'litellm_compression_savings_percent',
-                'Compression savings percentage',
-                ['tenant_id']
-            )
-            compression_latency = Histogram(
-                'litellm_compression_latency_seconds',
-                'Compression operation latency',
-                ['tenant_id']
-            )
-            original_tokens_metric = Histogram(
-                'litellm_compression_original_tokens',
-                'Original token count before compression',
-                ['tenant_id']
-            )
-            compressed_tokens_metric = Histogram(
-                'litellm_compression_compressed_tokens',
-                'Token count after compression',
-                ['tenant_id']
-            )
-            
-            # Record metrics
-            compression_requests.labels(tenant_id=tenant_id).inc()
-            compression_savings.labels(tenant_id=tenant_id).observe(savings_percent)
-            compression_latency.labels(tenant_id=tenant_id).observe(compression_time)
-            original_tokens_metric.labels(tenant_id=tenant_id).observe(original_tokens)
-            compressed_tokens_metric.labels(tenant_id=tenant_id).observe(compressed_tokens)
-            
-        except Exception as e:
-            # Don't fail request if metrics logging fails
-            print(f"Failed to log compression metrics: {e}")
+        self.metrics.record(
+            tenant_id,
+            original_tokens,
+            compressed_tokens,
+            savings_percent,
+            compression_time
+        )
         
-        # Also log to console for debugging
+        # Also log to console for debugging (off by default: stdout is synchronous)
+        if not self.log_requests:
+            return
         print(
             f"Compression for tenant {tenant_id}: "
             f"{original_tokens} → {compressed_tokens} tokens "
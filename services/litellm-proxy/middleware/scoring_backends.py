@@ -0,0 +1,152 @@
+"""
+Scoring backends for the LLMLingua compressor
+Selects how the compression model runs: full-precision PyTorch, int8 PyTorch or ONNX Runtime
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+import threading
+
+# torch: reference full-precision model (what PromptCompressor loads by default)
+# torch-int8: dynamic int8 quantization of Linear layers (CPU only)
+# onnx: model exported to ONNX and run by ONNX Runtime (requires optimum[onnxruntime])
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+# Exported ONNX models, one directory per model; shared by workers and restarts
+ONNX_CACHE_DIR = os.getenv(
+    "COMPRESSION_ONNX_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "llmlingua-onnx")
+)
+
+# load_compressor swaps module globals of llmlingua while it builds an onnx compressor
+_load_lock = threading.Lock()
+
+
+def load_compressor(
+    model_name: str,
+    device_map: str = "cpu",
+    use_llmlingua2: bool = False,
+    backend: str = "torch"
+):
+    """
+    Load an LLMLingua PromptCompressor with the requested scoring backend.
+
+    The tokenizer and LLMLingua's pre/post-processing are unchanged; only the
+    module that produces per-token scores is replaced, so every backend can be
+    compared token-for-token against the reference (see
+    scripts/compare_backends.py).
+
+    Args:
+        model_name: HuggingFace model id of the compression model
+        device_map: Torch device map (int8 and onnx backends run on CPU)
+        use_llmlingua2: Load the model as an LLMLingua-2 token classifier
+        backend: One of BACKENDS
+
+    Returns:
+        PromptCompressor ready for compress_prompt()
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown compression backend '{backend}', expected one of {BACKENDS}")
+    if backend != "torch" and device_map != "cpu":
+        raise ValueError(f"Compression backend '{backend}' only runs on CPU")
+
+    from llmlingua import PromptCompressor
+
+    if backend == "onnx":
+        compressor = _onnx_compressor(PromptCompressor, model_name, use_llmlingua2)
+    else:
+        compressor = PromptCompressor(
+            model_name=model_name,
+            device_map=device_map,
+            use_llmlingua2=use_llmlingua2
+        )
+
+    if backend == "torch-int8":
+        compressor.model = _quantize_int8(compressor.model)
+        # Drop the full-precision weights the reference load left behind
+        gc.collect()
+
+    compressor.scoring_backend = backend
+    return compressor
+
+
+def _quantize_int8(model):
+    """Dynamically quantize Linear layers to int8 (weights int8, activations quantized on the fly)"""
+    import torch
+
+    model = model.to("cpu")
+    model.eval()
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _onnx_compressor(prompt_compressor, model_name: str, use_llmlingua2: bool):
+    """
+    Build a PromptCompressor whose model is the ONNX Runtime session.
+
+    PromptCompressor.load_model() loads the config and tokenizer and then the
+    model through the transformers auto classes it imported; those names are
+    pointed at the ONNX loader for the duration of the constructor, so the
+    PyTorch weights are never materialized next to the session.
+    """
+    import llmlingua.prompt_compressor as module
+
+    class OnnxModel:
+        @staticmethod
+        def from_pretrained(*args, **kwargs):
+            return _load_onnx(model_name, use_llmlingua2)
+
+    names = ("AutoModelForCausalLM", "AutoModelForTokenClassification")
+    with _load_lock:
+        originals = {name: getattr(module, name) for name in names}
+        try:
+            for name in names:
+                setattr(module, name, OnnxModel)
+            return prompt_compressor(
+                model_name=model_name,
+                device_map="cpu",
+                use_llmlingua2=use_llmlingua2
+            )
+        finally:
+            for name, original in originals.items():
+                setattr(module, name, original)
+
+
+def _load_onnx(model_name: str, use_llmlingua2: bool, cache_dir: str = ONNX_CACHE_DIR):
+    """
+    Load the model for ONNX Runtime on CPU from the export cache.
+
+    The first load of a model exports it (which does load the PyTorch weights
+    once) into ``cache_dir``; every later load, in any worker or after a
+    restart, reads the exported graph directly.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForCausalLM, ORTModelForTokenClassification
+    except ImportError as e:
+        raise RuntimeError(
+            "COMPRESSION_BACKEND=onnx requires optimum[onnxruntime]"
+        ) from e
+
+    model_class = ORTModelForTokenClassification if use_llmlingua2 else ORTModelForCausalLM
+    export_dir = os.path.join(cache_dir, model_name.replace("/", "--"))
+
+    if not os.path.isdir(export_dir):
+        model = model_class.from_pretrained(
+            model_name,
+            export=True,
+            provider="CPUExecutionProvider"
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+        staging_dir = tempfile.mkdtemp(dir=cache_dir)
+        model.save_pretrained(staging_dir)
+        try:
+            # Atomic, so a concurrent worker never loads a half-written export
+            os.rename(staging_dir, export_dir)
+        except OSError:
+            # Another worker published its export first
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        del model
+        gc.collect()
+
+    return model_class.from_pretrained(export_dir, provider="CPUExecutionProvider")
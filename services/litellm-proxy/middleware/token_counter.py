@@ -0,0 +1,198 @@
+"""
+Token counting for the compression middleware
+Picks a tokenizer per model family, caches loaded tokenizers and memoizes counts
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Try to import tiktoken for exact OpenAI counts, fall back to approximation
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Fixed cost charged for non-text parts of multimodal content (OpenAI low-detail image)
+IMAGE_PART_TOKENS = 85
+
+# Per-message framing overhead (role, separators) in chat formats
+MESSAGE_OVERHEAD_TOKENS = 4
+
+OPENAI_MODEL_PREFIXES = ("gpt-", "o1", "o3", "o4", "chatgpt-", "text-embedding-", "openai/")
+
+
+def content_text(content: Any) -> Tuple[str, int]:
+    """
+    Extract the text of a message content field.
+
+    Args:
+        content: String content or a list of OpenAI-style content parts
+
+    Returns:
+        Tuple of (concatenated text, number of non-text parts)
+    """
+    if content is None:
+        return "", 0
+    if isinstance(content, str):
+        return content, 0
+
+    texts = []
+    other_parts = 0
+    for part in content:
+        if isinstance(part, dict) and part.get("type") == "text":
+            texts.append(part.get("text") or "")
+        elif isinstance(part, str):
+            texts.append(part)
+        else:
+            other_parts += 1
+    return "\n".join(texts), other_parts
+
+
+def approximate_tokens(text: str) -> int:
+    """
+    Fast tokenizer-free estimate.
+
+    ASCII text averages ~4 characters per token for BPE vocabularies, while CJK
+    and most other non-Latin characters cost about one token each.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+class TokenCounter:
+    """
+    Counts prompt tokens with the right tokenizer for each model family.
+
+    OpenAI models use tiktoken's BPE (texts longer than ``chunk_chars`` are
+    encoded in whitespace-aligned chunks and the counts summed, which bounds
+    the encoder's working set without estimating). Other families use
+    approximate_tokens(). Tokenizers are loaded once
+    per encoding and counts are memoized per (family, content hash) in a
+    bounded LRU, so repeated messages in multi-turn chats cost a dict lookup.
+    """
+
+    def __init__(self, memo_size: int = 8192, chunk_chars: int = 32768):
+        self.memo_size = memo_size
+        self.chunk_chars = chunk_chars
+
+        self._encoders: Dict[str, Optional[Callable[[str], int]]] = {}
+        self._family_by_model: Dict[str, str] = {}
+        self._memo: "OrderedDict[Tuple[str, int, int], int]" = OrderedDict()
+
+    def count_messages(self, messages: List[dict], model: Optional[str] = None) -> int:
+        """
+        Count tokens for a list of chat messages.
+
+        Args:
+            messages: List of message dicts (string or list-style content)
+            model: Target model name used to pick the tokenizer
+
+        Returns:
+            Token count
+        """
+        total = 0
+        for msg in messages:
+            text, other_parts = content_text(msg.get("content"))
+            total += self.count_text(text, model) + other_parts * IMAGE_PART_TOKENS
+            total += MESSAGE_OVERHEAD_TOKENS
+        return total
+
+    def count_text(self, text: str, model: Optional[str] = None) -> int:
+        """
+        Count tokens for a single text.
+
+        Args:
+            text: Text to count
+            model: Target model name used to pick the tokenizer
+
+        Returns:
+            Token count
+        """
+        if not text:
+            return 0
+
+        family = self._family(model)
+        key = (family, hash(text), len(text))
+
+        count = self._memo.get(key)
+        if count is not None:
+            self._memo.move_to_end(key)
+            return count
+
+        count = self._count(family, text)
+
+        self._memo[key] = count
+        if len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return count
+
+    def _count(self, family: str, text: str) -> int:
+        encoder = self._encoder(family)
+        if encoder is None:
+            return approximate_tokens(text)
+        return sum(encoder(chunk) for chunk in self._chunks(text))
+
+    def _chunks(self, text: str) -> Iterator[str]:
+        """
+        Split text into pieces of at most chunk_chars characters.
+
+        Cuts go just before a whitespace character that follows a
+        non-whitespace one, where BPE pre-tokenization starts a new word anyway,
+        so the summed counts match encoding the whole text. A window with no
+        such boundary (e.g. base64) is cut hard at chunk_chars.
+        """
+        start = 0
+        while len(text) - start > self.chunk_chars:
+            end = start + self.chunk_chars
+            cut = end
+            while cut > start + 1 and not (text[cut].isspace() and not text[cut - 1].isspace()):
+                cut -= 1
+            if cut <= start + 1:
+                cut = end
+            yield text[start:cut]
+            start = cut
+        yield text[start:]
+
+    def _family(self, model: Optional[str]) -> str:
+        """Map a model name to its tokenizer family (cached per model)"""
+        if not model:
+            return "approx"
+
+        family = self._family_by_model.get(model)
+        if family is not None:
+            return family
+
+        name = model.lower().split("/", 1)[-1] if model.lower().startswith("openai/") else model.lower()
+        if model.lower().startswith(OPENAI_MODEL_PREFIXES):
+            if name.startswith(("gpt-4o", "o1", "o3", "o4", "chatgpt-", "gpt-4.1", "gpt-5")):
+                family = "o200k_base"
+            else:
+                family = "cl100k_base"
+        else:
+            family = "approx"
+
+        self._family_by_model[model] = family
+        return family
+
+    def _encoder(self, family: str) -> Optional[Callable[[str], int]]:
+        """Load (once) the tokenizer for a family; None means approximate"""
+        if family in self._encoders:
+            return self._encoders[family]
+
+        encoder = None
+        if family != "approx" and TIKTOKEN_AVAILABLE:
+            try:
+                encoding = tiktoken.get_encoding(family)
+                encoder = lambda text: len(encoding.encode_ordinary(text))
+            except Exception as e:
+                print(f"Failed to load tokenizer {family}, using approximation: {e}")
+
+        self._encoders[family] = encoder
+        return encoder
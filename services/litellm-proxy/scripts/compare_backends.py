@@ -0,0 +1,164 @@
+"""
+Compare compression scoring backends against the full-precision reference
+
+For each backend this reports:
+  - token-keep agreement: share of words whose keep/drop label matches the
+    reference torch backend (LLMLingua-2 word labels)
+  - compression latency (mean / p95 per prompt)
+  - resident memory of a worker after the model is loaded
+
+Every backend runs in its own spawned process so memory numbers are not
+polluted by the other models.
+
+Usage:
+    python scripts/compare_backends.py
+    python scripts/compare_backends.py --backends torch torch-int8 onnx --prompts prompts.txt
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+DEFAULT_PROMPTS = [
+    " ".join([
+        "The quarterly planning meeting covered the migration of the billing service,",
+        "the new on-call rotation, and open questions about the data retention policy.",
+        "Alice will draft the retention proposal by Friday, and Bob owns the rollout plan."
+    ] * 12),
+    " ".join([
+        "Retrieved passage: The LiteLLM proxy routes requests to OpenAI, Anthropic and",
+        "Google models, caches responses in Redis and compresses long prompts before",
+        "they are sent upstream, reducing cost for retrieval-augmented workloads."
+    ] * 12),
+]
+
+WORD_SEP = "\t\t|\t\t"
+LABEL_SEP = " "
+
+
+def _rss_mb() -> float:
+    """Peak resident set size of the current process in MB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_backend(backend: str, args: Dict, prompts: List[str], queue) -> None:
+    """Load one backend, compress every prompt and report labels, latency and memory"""
+    try:
+        from middleware.scoring_backends import load_compressor
+
+        compressor = load_compressor(args["model"], "cpu", True, backend)
+        rss_loaded = _rss_mb()
+
+        compressor.compress_prompt([prompts[0]], rate=args["rate"])  # warm-up
+
+        labels, latencies = [], []
+        for prompt in prompts:
+            start = time.perf_counter()
+            result = compressor.compress_prompt(
+                [prompt],
+                rate=args["rate"],
+                return_word_label=True,
+                word_sep=WORD_SEP,
+                label_sep=LABEL_SEP
+            )
+            latencies.append(time.perf_counter() - start)
+            labels.append([
+                word.rsplit(LABEL_SEP, 1)[-1]
+                for word in result["fn_labeled_original_prompt"].split(WORD_SEP)
+            ])
+
+        queue.put({"backend": backend, "labels": labels, "latencies": latencies, "rss_mb": rss_loaded})
+    except Exception as e:
+        queue.put({"backend": backend, "error": str(e)})
+
+
+def _agreement(reference: List[List[str]], candidate: List[List[str]]) -> float:
+    matched = total = 0
+    for ref_labels, cand_labels in zip(reference, candidate):
+        total += max(len(ref_labels), len(cand_labels))
+        matched += sum(1 for a, b in zip(ref_labels, cand_labels) if a == b)
+    return matched / total if total else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--model",
+        default=os.getenv(
+            "LLMLINGUA_MODEL_NAME",
+            "microsoft/llmlingua-2-bert-base-multilingual-cased-meetingbank"
+        )
+    )
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch-int8", "onnx"])
+    parser.add_argument("--prompts", help="File with one prompt per line (defaults to built-in samples)")
+    parser.add_argument("--rate", type=float, default=0.5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    prompts = DEFAULT_PROMPTS
+    if args.prompts:
+        with open(args.prompts) as f:
+            prompts = [line.strip() for line in f if line.strip()]
+
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for backend in backends:
+        queue = context.Queue()
+        process = context.Process(
+            target=_run_backend,
+            args=(backend, {"model": args.model, "rate": args.rate}, prompts, queue)
+        )
+        process.start()
+        results[backend] = queue.get()
+        process.join()
+
+    reference = results["torch"]
+    if "error" in reference:
+        sys.exit(f"Reference backend failed: {reference['error']}")
+
+    report = []
+    for backend in backends:
+        result = results[backend]
+        if "error" in result:
+            report.append({"backend": backend, "error": result["error"]})
+            continue
+        latencies = sorted(result["latencies"])
+        report.append({
+            "backend": backend,
+            "agreement": round(_agreement(reference["labels"], result["labels"]), 4),
+            "latency_mean_ms": round(statistics.mean(latencies) * 1000, 1),
+            "latency_p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 1),
+            "rss_mb": round(result["rss_mb"], 1),
+            "latency_vs_reference": round(
+                statistics.mean(latencies) / statistics.mean(reference["latencies"]), 2
+            ),
+            "rss_vs_reference": round(result["rss_mb"] / reference["rss_mb"], 2)
+        })
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'backend':<12} {'agreement':>9} {'mean ms':>9} {'p95 ms':>8} {'rss MB':>8} {'lat x':>6} {'rss x':>6}")
+    for row in report:
+        if "error" in row:
+            print(f"{row['backend']:<12} error: {row['error']}")
+            continue
+        print(
+            f"{row['backend']:<12} {row['agreement']:>9.2%} {row['latency_mean_ms']:>9} "
+            f"{row['latency_p95_ms']:>8} {row['rss_mb']:>8} "
+            f"{row['latency_vs_reference']:>6} {row['rss_vs_reference']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
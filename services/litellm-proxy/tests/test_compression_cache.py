@@ -0,0 +1,223 @@
+"""
+Unit tests for the compressed prompt cache
+"""
+
+import pytest
+
+from middleware import compression_worker
+from middleware.compression_batcher import CompressionBatcher
+from middleware.compression_cache import CompressionCache
+from middleware.compression_executor import CompressionExecutor
+from middleware.prompt_compression import PromptCompressionMiddleware
+
+
+RESULT = {"compressed_prompt": "short", "origin_tokens": 1000, "compressed_tokens": 400}
+
+
+class FakeRedis:
+    """Minimal async stand-in for redis.asyncio.Redis"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+@pytest.mark.unit
+class TestCompressionCache:
+    """Two-tier cache behaviour"""
+
+    def test_key_ignores_whitespace_differences(self):
+        key_a = CompressionCache.make_key(["a  b\nc"], "sys", "q?", 0.5, "m")
+        key_b = CompressionCache.make_key([" a b c "], "sys ", "q?", 0.5, "m")
+
+        assert key_a == key_b
+
+    def test_key_depends_on_rate_and_model(self):
+        base = CompressionCache.make_key(["ctx"], "sys", "q", 0.5, "m")
+
+        assert base != CompressionCache.make_key(["ctx"], "sys", "q", 0.33, "m")
+        assert base != CompressionCache.make_key(["ctx"], "sys", "q", 0.5, "other")
+        assert base != CompressionCache.make_key(["c", "tx"], "sys", "q", 0.5, "m")
+
+    async def test_memory_hit(self):
+        cache = CompressionCache(redis_host=None)
+        cache.set("k", RESULT)
+
+        assert await cache.get("k") == RESULT
+        assert await cache.get("missing") is None
+
+    async def test_evicts_least_recently_used_within_byte_budget(self):
+        cache = CompressionCache(max_bytes=200, redis_host=None)
+        cache.set("a", RESULT)
+        cache.set("b", RESULT)
+        await cache.get("a")
+        cache.set("c", RESULT)
+
+        assert cache.size_bytes <= 200
+        assert await cache.get("a") == RESULT
+        assert await cache.get("b") is None
+
+    async def test_redis_hit_is_promoted_to_memory(self):
+        cache = CompressionCache(redis_host=None)
+        cache._redis = FakeRedis()
+        writer = CompressionCache(redis_host=None)
+        writer._redis = cache._redis
+        writer.set("k", RESULT)
+        for task in list(writer._background):
+            await task
+
+        assert await cache.get("k") == RESULT
+        cache._redis = None
+        assert await cache.get("k") == RESULT
+
+
+class CountingCompressor:
+    """Halves each segment and records which segments were compressed"""
+
+    use_llmlingua2 = False
+
+    def __init__(self):
+        self.segments = []
+        self.conditioning = []
+
+    def compress_prompt(self, context, instruction="", question="", **kwargs):
+        # Like LLMLingua: the result wraps the compressed context in the
+        # instruction and question
+        self.segments.extend(context)
+        self.conditioning.append((instruction, question))
+        text = "\n\n".join(context)
+        compressed = text[: len(text) // 2]
+        return {
+            "compressed_prompt": "\n\n".join(p for p in (instruction, compressed, question) if p),
+            "origin_tokens": (len(instruction) + len(text) + len(question)) // 4,
+            "compressed_tokens": (len(instruction) + len(compressed) + len(question)) // 4
+        }
+
+    def get_token_length(self, text):
+        return len(text) // 4
+
+
+@pytest.mark.unit
+class TestIncrementalCompression:
+    """Per-segment memoization across turns of a growing conversation"""
+
+    @pytest.fixture
+    def middleware(self):
+        mw = PromptCompressionMiddleware()
+        mw.executor = CompressionExecutor(max_workers=1, max_queue_size=8)
+        mw.batcher = CompressionBatcher(mw.executor, max_queue_size=8)
+        mw.cache = CompressionCache(redis_host=None)
+        mw.executor_config["timeout_seconds"] = 1.0
+        mw.ready.set()
+        yield mw
+        mw.executor.shutdown()
+        compression_worker.set_compressor(None)
+
+    async def test_new_turn_only_compresses_new_segments(self, middleware):
+        compressor = CountingCompressor()
+        compression_worker.set_compressor(compressor)
+        turn = lambda i: " ".join([f"turn {i} discusses topic {i} in depth."] * 80)
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": turn(1)},
+            {"role": "assistant", "content": turn(2)},
+            {"role": "user", "content": turn(3)}
+        ]
+
+        await middleware.async_pre_call_hook(None, None, {"messages": messages}, "completion")
+        assert compressor.segments == [turn(1), turn(2)]
+
+        compressor.segments.clear()
+        messages = messages + [
+            {"role": "assistant", "content": turn(4)},
+            {"role": "user", "content": turn(5)}
+        ]
+        result = await middleware.async_pre_call_hook(
+            None, None, {"messages": messages}, "completion"
+        )
+
+        assert compressor.segments == [turn(3), turn(4)]
+        content = result["messages"][-1]["content"]
+        assert content.index("turn 1") < content.index("turn 3") < content.index("turn 5")
+        assert content.endswith(turn(5))
+
+    async def test_short_question_is_kept_verbatim(self, middleware):
+        compressor = CountingCompressor()
+        compression_worker.set_compressor(compressor)
+        data = {"messages": [
+            {"role": "user", "content": " ".join(["Context sentence."] * 400)},
+            {"role": "assistant", "content": "Noted."},
+            {"role": "user", "content": "Summarize the above."}
+        ]}
+
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert len(compressor.segments) == 1
+        assert result["messages"][-1]["content"].endswith("Noted.\n\nSummarize the above.")
+
+    async def test_question_and_instruction_condition_context_verbatim(self, middleware):
+        compressor = CountingCompressor()
+        compression_worker.set_compressor(compressor)
+        question = " ".join(["Which of the figures above matter most?"] * 20)
+        data = {"messages": [
+            {"role": "system", "content": "Answer tersely."},
+            {"role": "user", "content": " ".join(["Context sentence."] * 400)},
+            {"role": "user", "content": question}
+        ]}
+
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert compressor.segments == [data["messages"][1]["content"]]
+        assert compressor.conditioning == [("Answer tersely.", question)]
+        content = result["messages"][-1]["content"]
+        assert content.endswith("\n\n" + question)
+        assert not content.startswith("Answer tersely.")
+        assert result["messages"][0] == data["messages"][0]
+
+    async def test_every_system_message_is_kept_in_place(self, middleware):
+        compression_worker.set_compressor(CountingCompressor())
+        data = {"messages": [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": " ".join(["Context sentence."] * 400)},
+            {"role": "system", "content": "Cite the context."},
+            {"role": "user", "content": "Summarize the above."}
+        ]}
+
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert [m["role"] for m in result["messages"]] == ["system", "system", "user"]
+        assert result["messages"][:2] == [data["messages"][0], data["messages"][2]]
+        assert result["messages"][-1]["content"].endswith("Summarize the above.")
+
+    async def test_tool_turns_are_not_merged(self, middleware):
+        compressor = CountingCompressor()
+        compression_worker.set_compressor(compressor)
+        data = {"messages": [
+            {"role": "user", "content": " ".join(["Context sentence."] * 400)},
+            {"role": "assistant", "content": "", "tool_calls": [{"id": "call-1"}]},
+            {"role": "tool", "tool_call_id": "call-1", "content": "42"},
+            {"role": "user", "content": "And now?"}
+        ]}
+
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert result is data
+        assert compressor.segments == []
+
+    async def test_question_aware_memo_key_includes_question(self, middleware, monkeypatch):
+        monkeypatch.setattr("middleware.prompt_compression.LLMLINGUA_USE_V2", False)
+        compressor = CountingCompressor()
+        compression_worker.set_compressor(compressor)
+        context = {"role": "user", "content": " ".join(["Context sentence."] * 400)}
+        ask = lambda q: {"messages": [context, {"role": "user", "content": q}]}
+
+        await middleware.async_pre_call_hook(None, None, ask("First question?"), "completion")
+        await middleware.async_pre_call_hook(None, None, ask("First question?"), "completion")
+        await middleware.async_pre_call_hook(None, None, ask("Second question?"), "completion")
+
+        assert len(compressor.segments) == 2
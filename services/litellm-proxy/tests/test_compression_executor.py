@@ -0,0 +1,270 @@
+"""
+Unit tests for the compression worker pool
+Verifies that slow or saturated compression never holds up a request
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from middleware import compression_worker
+from middleware.compression_batcher import CompressionBatcher
+from middleware.compression_cache import CompressionCache
+from middleware.compression_executor import CompressionExecutor, CompressionQueueFull
+from middleware.prompt_compression import PromptCompressionMiddleware
+
+
+LONG_PROMPT = " ".join(["This is a long context paragraph about various topics."] * 300)
+
+
+class FakeCompressor:
+    """Stand-in for LLMLingua's PromptCompressor with a configurable delay"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.batch_sizes = []
+        self.use_llmlingua2 = False
+
+    def compress_prompt(self, context, instruction="", question="", **kwargs):
+        self.calls += 1
+        self.batch_sizes.append(len(context))
+        time.sleep(self.delay)
+        if self.use_llmlingua2:
+            return {"compressed_prompt_list": [text[: len(text) // 2] for text in context]}
+        return {
+            "compressed_prompt": "compressed",
+            "origin_tokens": 1000,
+            "compressed_tokens": 500,
+            "ratio": "2.0x"
+        }
+
+    def get_token_length(self, text):
+        return len(text) // 4
+
+
+@pytest.fixture
+def middleware():
+    mw = PromptCompressionMiddleware()
+    mw.executor_config["timeout_seconds"] = 0.2
+    mw.executor = CompressionExecutor(mode="thread", max_workers=1, max_queue_size=1)
+    mw.batcher = CompressionBatcher(mw.executor, max_batch_size=1, max_queue_size=1)
+    mw.cache = CompressionCache(redis_host=None)
+    mw.ready.set()
+    yield mw
+    mw.executor.shutdown()
+    compression_worker.set_compressor(None)
+
+
+@pytest.fixture
+def worker_compressor_reset():
+    yield
+    compression_worker.set_compressor(None)
+
+
+def _request():
+    return {
+        "model": "gpt-4o-mini",
+        "messages": [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": LONG_PROMPT}
+        ]
+    }
+
+
+@pytest.mark.unit
+class TestCompressionExecutor:
+    """Bounded pool behaviour"""
+
+    async def test_runs_job_off_event_loop(self):
+        executor = CompressionExecutor(max_workers=1, max_queue_size=1)
+        loop_thread = threading.get_ident()
+
+        worker_thread = await executor.run(threading.get_ident)
+
+        assert worker_thread != loop_thread
+        assert executor.pending == 0
+        executor.shutdown()
+
+    async def test_rejects_when_queue_full(self):
+        executor = CompressionExecutor(max_workers=1, max_queue_size=1)
+        running = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(CompressionQueueFull):
+            await executor.run(time.sleep, 0)
+
+        await running
+        assert executor.pending == 0
+        executor.shutdown()
+
+    def test_rejects_queue_smaller_than_pool(self):
+        with pytest.raises(ValueError):
+            CompressionExecutor(max_workers=4, max_queue_size=2)
+
+
+@pytest.mark.unit
+class TestCompressionBatcher:
+    """Micro-batching of concurrent compression jobs"""
+
+    async def test_concurrent_jobs_share_one_forward_pass(self):
+        compressor = FakeCompressor()
+        compressor.use_llmlingua2 = True
+        compression_worker.set_compressor(compressor)
+        executor = CompressionExecutor(max_workers=1, max_queue_size=4)
+        batcher = CompressionBatcher(executor, max_batch_size=4, max_wait_seconds=0.05)
+
+        results = await asyncio.gather(*[
+            batcher.submit([f"context {i} " * 10], "", f"question {i}", {"rate": 0.5})
+            for i in range(4)
+        ])
+
+        assert compressor.calls == 1
+        assert compressor.batch_sizes == [4]
+        for i, result in enumerate(results):
+            assert result["compressed_prompt"].endswith(f"question {i}")
+            assert result["compressed_tokens"] < result["origin_tokens"]
+        executor.shutdown()
+
+    async def test_flushes_partial_batch_after_wait(self):
+        compression_worker.set_compressor(FakeCompressor())
+        executor = CompressionExecutor(max_workers=1, max_queue_size=4)
+        batcher = CompressionBatcher(executor, max_batch_size=8, max_wait_seconds=0.01)
+
+        result = await asyncio.wait_for(batcher.submit(["context"], "", "q", {}), timeout=1)
+
+        assert result["compressed_prompt"] == "compressed"
+        executor.shutdown()
+
+    async def test_keeps_dispatch_task_referenced_until_done(self):
+        compression_worker.set_compressor(FakeCompressor(delay=0.05))
+        executor = CompressionExecutor(max_workers=1, max_queue_size=4)
+        batcher = CompressionBatcher(executor, max_batch_size=1)
+
+        pending = asyncio.ensure_future(batcher.submit(["context"], "", "q", {}))
+        await asyncio.sleep(0.01)
+        assert len(batcher._dispatching) == 1
+
+        await asyncio.wait_for(pending, timeout=1)
+        await asyncio.sleep(0)
+        assert not batcher._dispatching
+        executor.shutdown()
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("worker_compressor_reset")
+class TestCompressionWorker:
+    """Token counts of context-only compression"""
+
+    def test_llmlingua2_single_job_counts_only_the_context(self):
+        compressor = FakeCompressor()
+        compressor.use_llmlingua2 = True
+        compression_worker.set_compressor(compressor)
+        context = "context " * 100
+
+        [result] = compression_worker.compress_batch([
+            ([context], "instruction " * 50, "question " * 50, {"rate": 0.5, "context_only": True})
+        ])
+
+        assert compressor.calls == 1
+        assert result["compressed_prompt"] == context[: len(context) // 2]
+        assert result["origin_tokens"] == compressor.get_token_length(context)
+        assert result["compressed_tokens"] == compressor.get_token_length(context[: len(context) // 2])
+
+    def test_llmlingua2_result_is_not_stripped_of_conditioning(self):
+        compressor = FakeCompressor()
+        compressor.use_llmlingua2 = True
+        compressor.compress_prompt = lambda context, **kwargs: {
+            "compressed_prompt": "kept context",
+            "origin_tokens": 400,
+            "compressed_tokens": 200
+        }
+        compression_worker.set_compressor(compressor)
+
+        result = compression_worker.compress_prompt(
+            ["context"], "instruction " * 50, "question " * 50, {"context_only": True}
+        )
+
+        assert (result["origin_tokens"], result["compressed_tokens"]) == (400, 200)
+
+    def test_llmlingua_result_is_stripped_of_conditioning(self):
+        compressor = FakeCompressor()
+        compressor.compress_prompt = lambda context, instruction="", question="", **kwargs: {
+            "compressed_prompt": f"{instruction}\n\nkept context\n\n{question}",
+            "origin_tokens": 400,
+            "compressed_tokens": 200
+        }
+        compression_worker.set_compressor(compressor)
+        instruction, question = "i" * 200, "q" * 200
+
+        result = compression_worker.compress_prompt(["context"], instruction, question, {"context_only": True})
+
+        assert result["compressed_prompt"] == "kept context"
+        assert (result["origin_tokens"], result["compressed_tokens"]) == (300, 100)
+
+
+@pytest.mark.unit
+class TestCompressionHookDeadline:
+    """async_pre_call_hook falls back to the original request"""
+
+    async def test_compresses_within_deadline(self, middleware):
+        compression_worker.set_compressor(FakeCompressor())
+
+        result = await middleware.async_pre_call_hook(None, None, _request(), "completion")
+
+        assert result["messages"][-1]["content"] == "compressed"
+
+    async def test_returns_original_data_after_deadline(self, middleware):
+        compression_worker.set_compressor(FakeCompressor(delay=0.5))
+        data = _request()
+
+        start = time.perf_counter()
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert result is data
+        assert time.perf_counter() - start < 0.45
+
+    async def test_returns_original_data_when_queue_full(self, middleware):
+        compression_worker.set_compressor(FakeCompressor(delay=0.3))
+        busy = asyncio.ensure_future(
+            middleware.async_pre_call_hook(None, None, _request(), "completion")
+        )
+        await asyncio.sleep(0.01)
+        data = _request()
+
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert result is data
+        await busy
+
+
+@pytest.mark.unit
+class TestBackgroundWarmup:
+    """Requests are admitted uncompressed while the model loads"""
+
+    async def test_skips_compression_until_ready(self, middleware):
+        compressor = FakeCompressor()
+        compression_worker.set_compressor(compressor)
+        middleware.ready.clear()
+        data = _request()
+
+        result = await middleware.async_pre_call_hook(None, None, data, "completion")
+
+        assert result is data
+        assert compressor.calls == 0
+        assert not middleware.is_ready
+
+    def test_load_model_runs_warmup_and_sets_ready(self, middleware, monkeypatch):
+        compressor = FakeCompressor()
+        monkeypatch.setattr(
+            "middleware.prompt_compression.load_compressor",
+            lambda *args: compressor
+        )
+        middleware.ready.clear()
+
+        middleware._load_model()
+
+        assert middleware.is_ready
+        assert compressor.calls == 1
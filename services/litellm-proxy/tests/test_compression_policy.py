@@ -0,0 +1,77 @@
+"""
+Unit tests for the adaptive compression policy
+"""
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from middleware.compression_policy import CompressionPolicy
+from middleware.metrics import CompressionMetrics
+
+
+PROFILE = {"name": "default", "enabled": True, "rate": 0.5, "min_tokens": 500}
+
+
+@pytest.mark.unit
+class TestCompressionPolicy:
+    """Cost/latency decisions and auditing"""
+
+    def test_compresses_expensive_model(self):
+        policy = CompressionPolicy()
+
+        decision = policy.decide("tenant-a", "gpt-4o", 2000, PROFILE)
+
+        assert decision.compress
+        assert decision.reason == "worth_it"
+        assert decision.rate == 0.5
+        assert decision.expected_saved_tokens == 1000
+
+    def test_skips_when_overhead_exceeds_savings(self):
+        policy = CompressionPolicy(latency_value_per_second=0.01)
+        profile = {**PROFILE, "input_cost_per_token": 1e-8}
+
+        decision = policy.decide("tenant-a", "cheap-model", 2000, profile)
+
+        assert not decision.compress
+        assert decision.reason == "not_worth_it"
+
+    def test_aggressive_rate_for_large_benefit(self):
+        policy = CompressionPolicy(aggressive_benefit_ratio=10)
+        profile = {**PROFILE, "aggressive_rate": 0.3, "input_cost_per_token": 1e-5}
+
+        decision = policy.decide("tenant-a", "premium-model", 4000, profile)
+
+        assert decision.compress
+        assert decision.reason == "aggressive"
+        assert decision.rate == 0.3
+
+    def test_unknown_price_compresses(self):
+        policy = CompressionPolicy()
+
+        decision = policy.decide("tenant-a", "not-a-real-model", 2000, PROFILE)
+
+        assert decision.compress
+        assert decision.reason == "unknown_price"
+
+    def test_observations_update_estimates(self):
+        policy = CompressionPolicy(initial_seconds_per_token=0.0002, smoothing=0.5)
+
+        policy.observe(0.5, 1000, 200, 1.0)
+
+        assert policy.seconds_per_token == pytest.approx(0.0002 + 0.5 * (0.001 - 0.0002))
+        assert policy.savings_ratio[0.5] == pytest.approx(0.65)
+
+        decision = policy.decide("tenant-a", "gpt-4o", 1000, PROFILE)
+        assert decision.expected_saved_tokens == 650
+
+    def test_decisions_are_audited(self):
+        metrics = CompressionMetrics(registry=CollectorRegistry())
+        policy = CompressionPolicy(audit_size=2, metrics=metrics)
+
+        for tenant in ("a", "b", "c"):
+            policy.decide(tenant, "gpt-4o", 2000, PROFILE)
+
+        audit = policy.recent_decisions()
+        assert [entry["tenant_id"] for entry in audit] == ["b", "c"]
+        assert policy.recent_decisions(limit=1)[0]["tenant_id"] == "c"
+        assert metrics.decisions.labels(decision="compress", reason="worth_it")._value.get() == 3
@@ -0,0 +1,69 @@
+"""
+Unit tests for compression profile resolution
+"""
+
+import json
+
+import pytest
+
+from middleware.compression_profiles import ProfileResolver
+
+
+BASE_PROFILES = {
+    "default": {"enabled": True, "rate": 0.5, "min_tokens": 500},
+    "rag_queries": {"enabled": True, "rate": 0.33, "min_tokens": 1000},
+    "chat": {"enabled": True, "rate": 0.6, "min_tokens": 300}
+}
+
+DOCUMENT = {
+    "version": "v2",
+    "models": {"gpt-4o-mini": "chat"},
+    "tenants": {
+        "tenant-off": {"enabled": False},
+        "tenant-b": {"profiles": {"chat": {"rate": 0.7}}}
+    }
+}
+
+
+@pytest.mark.unit
+class TestProfileResolver:
+    """Tenant, model and metadata mapping"""
+
+    def test_builtin_default(self):
+        resolver = ProfileResolver(BASE_PROFILES)
+
+        profile = resolver.resolve("any-tenant", "gpt-4o")
+
+        assert profile["name"] == "default"
+        assert profile["rate"] == 0.5
+
+    def test_metadata_selects_use_case(self):
+        resolver = ProfileResolver(BASE_PROFILES)
+
+        profile = resolver.resolve("t", "gpt-4o", {"compression_profile": "rag_queries"})
+
+        assert profile["rate"] == 0.33
+
+    def test_tenant_and_model_overrides(self):
+        resolver = ProfileResolver(BASE_PROFILES)
+        resolver.load(DOCUMENT)
+
+        assert resolver.resolve("tenant-off", "gpt-4o")["enabled"] is False
+        assert resolver.resolve("tenant-b", "gpt-4o-mini")["rate"] == 0.7
+        assert resolver.resolve("tenant-c", "gpt-4o-mini")["rate"] == 0.6
+        assert resolver.snapshot.version == "v2"
+
+    def test_profiles_are_read_only(self):
+        profile = ProfileResolver(BASE_PROFILES).resolve("t")
+
+        with pytest.raises(TypeError):
+            profile["rate"] = 0.1
+
+    def test_file_source_hot_reload(self, tmp_path):
+        source = tmp_path / "profiles.json"
+        source.write_text(json.dumps(DOCUMENT))
+        resolver = ProfileResolver(BASE_PROFILES, source=str(source))
+
+        assert resolver.refresh() is True
+        assert resolver.refresh() is False
+        assert resolver.resolve("tenant-off")["enabled"] is False
@@ -0,0 +1,84 @@
+"""
+Unit tests for compression metrics
+"""
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from middleware import compression_worker
+from middleware.compression_batcher import CompressionBatcher
+from middleware.compression_cache import CompressionCache
+from middleware.compression_executor import CompressionExecutor
+from middleware.metrics import CompressionMetrics
+from middleware.prompt_compression import PromptCompressionMiddleware
+
+
+class HalvingCompressor:
+    use_llmlingua2 = False
+
+    def compress_prompt(self, context, instruction="", question="", **kwargs):
+        text = "\n\n".join(context)
+        return {
+            "compressed_prompt": text[: len(text) // 2],
+            "origin_tokens": 1000,
+            "compressed_tokens": 500
+        }
+
+
+class TeamKey:
+    def __init__(self, team_id):
+        self.team_id = team_id
+
+
+def _sample(registry, name, **labels):
+    return registry.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.unit
+class TestCompressionMetrics:
+    """Metric objects are registered once and keep counting"""
+
+    def test_counts_accumulate_across_calls(self):
+        registry = CollectorRegistry()
+        metrics = CompressionMetrics(registry=registry)
+
+        for _ in range(250):
+            metrics.record("tenant-a", 1000, 400, 60.0, 0.02)
+
+        assert _sample(registry, "litellm_compression_requests_total", tenant_id="tenant-a") == 250
+        assert _sample(
+            registry, "litellm_compression_latency_seconds_count", tenant_id="tenant-a"
+        ) == 250
+
+    def test_tenant_labels_are_capped(self):
+        registry = CollectorRegistry()
+        metrics = CompressionMetrics(registry=registry, max_tenants=2)
+
+        for tenant in ("a", "b", "c", "d", "a"):
+            metrics.record(tenant, 1000, 500, 50.0, 0.01)
+
+        assert _sample(registry, "litellm_compression_requests_total", tenant_id="a") == 2
+        assert _sample(registry, "litellm_compression_requests_total", tenant_id="other") == 2
+        assert _sample(registry, "litellm_compression_requests_total", tenant_id="c") == 0
+
+    async def test_hook_records_every_request(self):
+        registry = CollectorRegistry()
+        middleware = PromptCompressionMiddleware()
+        middleware.metrics = CompressionMetrics(registry=registry)
+        middleware.executor = CompressionExecutor(max_workers=1, max_queue_size=8)
+        middleware.batcher = CompressionBatcher(middleware.executor, max_queue_size=8)
+        middleware.cache = CompressionCache(redis_host=None, metrics=middleware.metrics)
+        middleware.executor_config["timeout_seconds"] = 1.0
+        middleware.ready.set()
+        compression_worker.set_compressor(HalvingCompressor())
+
+        for i in range(50):
+            data = {"model": "gpt-4o-mini", "messages": [
+                {"role": "user", "content": f"request {i} " + "context sentence. " * 600}
+            ]}
+            await middleware.async_pre_call_hook(TeamKey("tenant-x"), None, data, "completion")
+
+        assert _sample(registry, "litellm_compression_requests_total", tenant_id="tenant-x") == 50
+        assert _sample(registry, "litellm_compression_cache_misses_total") == 50
+        middleware.executor.shutdown()
+        compression_worker.set_compressor(None)
@@ -0,0 +1,186 @@
+"""
+Unit tests for the compressor scoring backends
+Uses stub llmlingua / torch / optimum modules, so no model is downloaded
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+from middleware import scoring_backends
+from middleware.scoring_backends import load_compressor
+
+
+class StubModel:
+    """Stands in for a transformers / ONNX Runtime model"""
+
+    def __init__(self, source, **kwargs):
+        self.source = source
+        self.kwargs = kwargs
+
+    def to(self, device):
+        return self
+
+    def eval(self):
+        return self
+
+
+def _llmlingua_modules():
+    """llmlingua package whose PromptCompressor loads through module-level auto classes"""
+    module = types.ModuleType("llmlingua.prompt_compressor")
+
+    class AutoModel:
+        @staticmethod
+        def from_pretrained(model_name, **kwargs):
+            return StubModel(("torch", model_name), **kwargs)
+
+    class PromptCompressor:
+        def __init__(self, model_name, device_map="cuda", use_llmlingua2=False):
+            self.model_name = model_name
+            self.device_map = device_map
+            self.use_llmlingua2 = use_llmlingua2
+            auto_class = module.AutoModelForTokenClassification if use_llmlingua2 else module.AutoModelForCausalLM
+            self.model = auto_class.from_pretrained(model_name)
+
+    module.AutoModelForCausalLM = AutoModel
+    module.AutoModelForTokenClassification = AutoModel
+    module.PromptCompressor = PromptCompressor
+    package = types.ModuleType("llmlingua")
+    package.PromptCompressor = PromptCompressor
+    package.prompt_compressor = module
+    return package, module
+
+
+def _optimum_module(exports):
+    """optimum.onnxruntime whose export writes a marker file and is recorded in ``exports``"""
+    module = types.ModuleType("optimum.onnxruntime")
+
+    class ORTModel:
+        kind = ""
+
+        @classmethod
+        def from_pretrained(cls, source, export=False, provider=None):
+            if export:
+                exports.append((cls.kind, source))
+            return ORTStubModel((cls.kind, source), export=export, provider=provider)
+
+    class ORTStubModel(StubModel):
+        def save_pretrained(self, directory):
+            with open(os.path.join(directory, "model.onnx"), "w") as f:
+                f.write("graph")
+
+    module.ORTModelForCausalLM = type("ORTModelForCausalLM", (ORTModel,), {"kind": "causal"})
+    module.ORTModelForTokenClassification = type("ORTModelForTokenClassification", (ORTModel,), {"kind": "token"})
+    return module
+
+
+@pytest.fixture
+def llmlingua(monkeypatch):
+    package, module = _llmlingua_modules()
+    monkeypatch.setitem(sys.modules, "llmlingua", package)
+    monkeypatch.setitem(sys.modules, "llmlingua.prompt_compressor", module)
+    return module
+
+
+@pytest.fixture
+def torch(monkeypatch):
+    quantized = []
+    module = types.ModuleType("torch")
+    module.qint8 = "qint8"
+    module.nn = types.SimpleNamespace(Linear="Linear")
+
+    def quantize_dynamic(model, layers, dtype):
+        quantized.append((model, layers, dtype))
+        return StubModel(("int8", model.source))
+
+    module.quantization = types.SimpleNamespace(quantize_dynamic=quantize_dynamic)
+    module.quantized = quantized
+    monkeypatch.setitem(sys.modules, "torch", module)
+    return module
+
+
+@pytest.fixture
+def exports(monkeypatch, tmp_path):
+    exports = []
+    monkeypatch.setitem(sys.modules, "optimum", types.ModuleType("optimum"))
+    monkeypatch.setitem(sys.modules, "optimum.onnxruntime", _optimum_module(exports))
+    # Importing torch fails: the onnx backend must not need it
+    monkeypatch.setitem(sys.modules, "torch", None)
+    monkeypatch.setattr(scoring_backends._load_onnx, "__defaults__", (str(tmp_path),))
+    return exports
+
+
+@pytest.mark.unit
+class TestBackendSelection:
+    """Validation and the reference backend"""
+
+    def test_rejects_unknown_backend(self, llmlingua):
+        with pytest.raises(ValueError, match="Unknown compression backend"):
+            load_compressor("model", backend="tensorrt")
+
+    @pytest.mark.parametrize("backend", ["torch-int8", "onnx"])
+    def test_cpu_only_backends_reject_gpu(self, llmlingua, backend):
+        with pytest.raises(ValueError, match="only runs on CPU"):
+            load_compressor("model", device_map="cuda", backend=backend)
+
+    def test_torch_backend_loads_reference_model(self, llmlingua):
+        compressor = load_compressor("org/model", device_map="cuda", use_llmlingua2=True)
+
+        assert compressor.model.source == ("torch", "org/model")
+        assert compressor.device_map == "cuda"
+        assert compressor.use_llmlingua2
+        assert compressor.scoring_backend == "torch"
+
+
+@pytest.mark.unit
+class TestInt8Backend:
+    """Dynamic int8 quantization of the reference model"""
+
+    def test_quantizes_linear_layers(self, llmlingua, torch):
+        compressor = load_compressor("org/model", backend="torch-int8")
+
+        [(model, layers, dtype)] = torch.quantized
+        assert model.source == ("torch", "org/model")
+        assert (layers, dtype) == ({"Linear"}, "qint8")
+        assert compressor.model.source == ("int8", ("torch", "org/model"))
+        assert compressor.scoring_backend == "torch-int8"
+
+
+@pytest.mark.unit
+class TestOnnxBackend:
+    """ONNX Runtime sessions built from the export cache"""
+
+    def test_loads_exported_model_without_torch(self, llmlingua, exports, tmp_path):
+        compressor = load_compressor("org/model", use_llmlingua2=True, backend="onnx")
+
+        export_dir = str(tmp_path / "org--model")
+        assert exports == [("token", "org/model")]
+        assert compressor.model.source == ("token", export_dir)
+        assert compressor.model.kwargs["provider"] == "CPUExecutionProvider"
+        assert os.listdir(tmp_path) == ["org--model"]
+        assert compressor.scoring_backend == "onnx"
+
+    def test_export_is_cached_across_loads(self, llmlingua, exports, tmp_path):
+        load_compressor("org/model", backend="onnx")
+        compressor = load_compressor("org/model", backend="onnx")
+
+        assert exports == [("causal", "org/model")]
+        assert compressor.model.source == ("causal", str(tmp_path / "org--model"))
+
+    def test_restores_llmlingua_auto_classes(self, llmlingua, exports):
+        originals = (llmlingua.AutoModelForCausalLM, llmlingua.AutoModelForTokenClassification)
+
+        load_compressor("org/model", backend="onnx")
+
+        assert (llmlingua.AutoModelForCausalLM, llmlingua.AutoModelForTokenClassification) == originals
+
+    def test_restores_auto_classes_when_loading_fails(self, llmlingua, exports, monkeypatch):
+        originals = (llmlingua.AutoModelForCausalLM, llmlingua.AutoModelForTokenClassification)
+        monkeypatch.setitem(sys.modules, "optimum.onnxruntime", None)
+
+        with pytest.raises(RuntimeError, match="optimum"):
+            load_compressor("org/model", backend="onnx")
+
+        assert (llmlingua.AutoModelForCausalLM, llmlingua.AutoModelForTokenClassification) == originals
@@ -0,0 +1,78 @@
+"""
+Unit tests for token counting in the compression middleware
+"""
+
+import re
+import time
+
+import pytest
+
+from middleware.token_counter import TIKTOKEN_AVAILABLE, TokenCounter, approximate_tokens
+
+
+@pytest.mark.unit
+class TestTokenCounter:
+    """Tokenizer selection, multimodal content and memoization"""
+
+    def test_cjk_counts_one_token_per_character(self):
+        assert approximate_tokens("你好世界") == 4
+        assert approximate_tokens("abcdefgh") == 2
+
+    def test_list_content_counts_text_and_image_parts(self):
+        counter = TokenCounter()
+        messages = [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "describe this picture"},
+                {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}}
+            ]
+        }]
+
+        count = counter.count_messages(messages, "claude-sonnet-4-5")
+
+        assert count == approximate_tokens("describe this picture") + 85 + 4
+
+    def test_none_content(self):
+        assert TokenCounter().count_messages([{"role": "assistant", "content": None}]) == 4
+
+    @pytest.mark.skipif(not TIKTOKEN_AVAILABLE, reason="tiktoken not installed")
+    def test_openai_models_use_bpe(self):
+        counter = TokenCounter()
+        code = "def f(x):\n    return {k: v for k, v in x.items() if v}\n" * 20
+
+        assert counter.count_text(code, "gpt-4o") != approximate_tokens(code)
+        assert counter._family("gpt-4o") == "o200k_base"
+        assert counter._family("gpt-3.5-turbo") == "cl100k_base"
+        assert counter._family("gemini-2-5-pro") == "approx"
+
+    def test_repeated_messages_are_memoized(self):
+        counter = TokenCounter()
+        text = "The quick brown fox jumps over the lazy dog. " * 9000  # ~100k tokens
+
+        counter.count_text(text, "gpt-4o")
+        start = time.perf_counter()
+        for _ in range(100):
+            counter.count_text(text, "gpt-4o")
+        per_call = (time.perf_counter() - start) / 100
+
+        assert per_call < 0.001
+
+    def test_cold_long_text_is_counted_exactly(self):
+        words = lambda text: len(re.findall(r"\s*\S+", text))
+        counter = TokenCounter(chunk_chars=1000)
+        counter._encoders["o200k_base"] = words
+        text = "alpha  beta\n\ngamma delta, epsilon. " * 2000
+
+        assert counter.count_text(text, "gpt-4o") == words(text)
+
+    def test_chunks_align_to_word_starts(self):
+        counter = TokenCounter(chunk_chars=64)
+        text = "lorem ipsum dolor sit amet " * 50 + "x" * 200
+
+        chunks = list(counter._chunks(text))
+
+        assert "".join(chunks) == text
+        assert all(len(chunk) <= 64 for chunk in chunks)
+        # Prose is cut before a space, the unbroken run of x's is cut hard
+        assert all(chunk[0] in " x" for chunk in chunks[1:])
+        assert sum(chunk.startswith("x") for chunk in chunks) == 3
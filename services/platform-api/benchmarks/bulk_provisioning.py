@@ -0,0 +1,64 @@
+"""
+Bulk user provisioning throughput
+
+Posts generated users as one NDJSON body to POST /v1/users/bulk of a running
+service (with Postgres), reads the streamed results and reports records per
+second and time to the first result.
+
+Usage:
+    python benchmarks/bulk_provisioning.py --tenant <tenant id> --token <access token> [--users 50000] [--host http://localhost:8082]
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from uuid import uuid4
+
+import httpx
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="http://localhost:8082")
+    parser.add_argument("--tenant", required=True, help="X-Tenant-ID of an active tenant with enough user quota")
+    parser.add_argument("--token", required=True, help="Access token of a member of the tenant (or an admin)")
+    parser.add_argument("--users", type=int, default=50000)
+    args = parser.parse_args()
+
+    run = uuid4().hex[:8]
+    body = "\n".join(
+        json.dumps({"email": f"bench-{run}-{i}@example.com", "name": f"Bench User {i}"})
+        for i in range(args.users)
+    ).encode()
+
+    statuses = Counter()
+    first_result = None
+    start = time.perf_counter()
+    with httpx.stream(
+        "POST",
+        f"{args.host}/v1/users/bulk",
+        content=body,
+        headers={
+            "Content-Type": "application/x-ndjson",
+            "X-Tenant-ID": args.tenant,
+            "Authorization": f"Bearer {args.token}"
+        },
+        timeout=None
+    ) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if first_result is None:
+                first_result = time.perf_counter() - start
+            result = json.loads(line)
+            if "summary" not in result:
+                statuses[result["status"]] += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.users} users, {len(body) / 1e6:.1f} MB body")
+    print(f"total {elapsed:.2f} s ({args.users / elapsed:,.0f} records/s), first result after {first_result:.2f} s")
+    print(dict(statuses))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Import-time profile of the service
+
+Runs `python -X importtime -c "import src.main"` in a fresh interpreter (after
+one warm-up run so bytecode is cached) and prints the slowest imports under
+src.main: its direct imports by cumulative time, and third-party packages by
+the time spent in their own modules.
+
+Usage:
+    python benchmarks/import_profile.py [--top 15] [--module src.main]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import List, Tuple
+
+SERVICE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def importtime(module: str) -> str:
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    for _ in range(2):
+        result = subprocess.run(command, cwd=SERVICE_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise SystemExit(result.stderr)
+    return result.stderr
+
+
+def subtree(output: str, module: str) -> List[Tuple[int, int, int, str]]:
+    """(depth, self us, cumulative us, name) of the module and everything it imported"""
+    entries = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            entries.append((len(match.group(3)) // 2, int(match.group(1)), int(match.group(2)), match.group(4)))
+
+    # importtime prints children before their parent
+    for index, entry in enumerate(entries):
+        if entry[3] == module:
+            start = index
+            while start > 0 and entries[start - 1][0] > entry[0]:
+                start -= 1
+            return entries[start:index + 1]
+    raise SystemExit(f"{module} was not imported")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    entries = subtree(importtime(args.module), args.module)
+    root_depth, _, total, _ = entries[-1]
+    print(f"import {args.module}: {total / 1000:.1f} ms\n")
+
+    print("Direct imports (cumulative)")
+    direct = sorted((e for e in entries if e[0] == root_depth + 1), key=lambda e: e[2], reverse=True)
+    for _, _, cumulative, name in direct[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+    print("\nPackages (own modules only)")
+    packages = defaultdict(int)
+    for _, own, _, name in entries:
+        packages[name if name.startswith("src.") else name.split(".")[0]] += own
+    for name, own in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {own / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Load test for the tenant endpoints against a local Postgres
+
+Each simulated user issues 10 requests per second (constant throughput), so
+200 users drive ~2k RPS: mostly cached-path tenant reads by id, plus a small
+share of creates that exercise the write path and the connection pool.
+
+Usage (service started with DATABASE_CREATE_TABLES=true, `docker-compose up -d`
+for Postgres and Redis):
+    pip install locust
+    locust -f benchmarks/locustfile.py --headless -u 200 -r 50 -t 3m \
+        --host http://localhost:8082 --csv results/tenants
+
+The run exits non-zero when the p99 latency exceeds P99_BUDGET_MS (default
+50) or more than 0.1% of requests fail. Watch db_pool_wait_seconds on
+/metrics alongside: a growing tail there means the pool is undersized for
+the offered load.
+"""
+
+import os
+import random
+import uuid
+
+from locust import HttpUser, constant_throughput, events, task
+
+P99_BUDGET_MS = float(os.getenv("P99_BUDGET_MS", "50"))
+SEED_TENANTS = int(os.getenv("SEED_TENANTS", "200"))
+
+tenant_ids = []
+
+
+@events.test_start.add_listener
+def seed_tenants(environment, **_kwargs):
+    """Create the tenants that readers look up"""
+    import httpx
+
+    with httpx.Client(base_url=environment.host, timeout=10) as client:
+        for _ in range(SEED_TENANTS):
+            suffix = uuid.uuid4().hex[:12]
+            response = client.post("/v1/tenants/", json={
+                "name": f"Load Test {suffix}",
+                "organization_name": f"Load Test Org {suffix}",
+                "primary_contact_email": f"owner-{suffix}@example.com"
+            })
+            response.raise_for_status()
+            tenant_ids.append(response.json()["id"])
+
+
+@events.quitting.add_listener
+def check_budget(environment, **_kwargs):
+    """Fail the run when p99 or the error rate is over budget"""
+    total = environment.stats.total
+    p99 = total.get_response_time_percentile(0.99)
+    if p99 > P99_BUDGET_MS:
+        print(f"p99 {p99:.0f}ms exceeds budget of {P99_BUDGET_MS:.0f}ms")
+        environment.process_exit_code = 1
+    elif total.fail_ratio > 0.001:
+        print(f"Failure ratio {total.fail_ratio:.2%} exceeds 0.1%")
+        environment.process_exit_code = 1
+
+
+class TenantApiUser(HttpUser):
+    """Reads tenants by id; occasionally creates one"""
+
+    wait_time = constant_throughput(10)
+
+    @task(20)
+    def get_tenant(self):
+        self.client.get(f"/v1/tenants/{random.choice(tenant_ids)}", name="/v1/tenants/{tenant_id}")
+
+    @task(1)
+    def create_tenant(self):
+        suffix = uuid.uuid4().hex[:12]
+        self.client.post("/v1/tenants/", json={
+            "name": f"Load Test {suffix}",
+            "organization_name": f"Load Test Org {suffix}",
+            "primary_contact_email": f"owner-{suffix}@example.com"
+        }, name="/v1/tenants/")
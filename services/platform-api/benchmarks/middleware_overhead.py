@@ -0,0 +1,164 @@
+"""
+Per-request overhead of the platform-api middleware stack
+
+Drives a closed-loop load (N concurrent clients issuing requests back to back,
+as wrk/locust do) against three in-process apps with the same routes:
+
+  - bare:      no tenant/logging/metrics middleware (state only)
+  - basehttp:  the previous BaseHTTPMiddleware implementations
+  - asgi:      the current pure ASGI middlewares
+
+and reports throughput, mean and p99 latency, plus the overhead per request
+relative to the bare app. Requests go through httpx's ASGI transport so the
+numbers isolate middleware cost from socket and server overhead.
+
+Usage:
+    python benchmarks/middleware_overhead.py
+    python benchmarks/middleware_overhead.py --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.infrastructure.fastapi.middleware.logging import LoggingMiddleware  # noqa: E402
+from src.infrastructure.fastapi.middleware.metrics import MetricsMiddleware  # noqa: E402
+from src.infrastructure.fastapi.middleware.tenant import TenantMiddleware  # noqa: E402
+
+
+class BaseHTTPTenantMiddleware(BaseHTTPMiddleware):
+    """Previous TenantMiddleware (BaseHTTPMiddleware)"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        tenant_id = request.headers.get("X-Tenant-Id")
+        if not tenant_id:
+            host = request.headers.get("host", "")
+            if "." in host:
+                tenant_id = host.split(".")[0]
+        request.state.tenant_id = tenant_id
+        response = await call_next(request)
+        if tenant_id:
+            response.headers["X-Tenant-Id"] = tenant_id
+        return response
+
+
+class BaseHTTPLoggingMiddleware(BaseHTTPMiddleware):
+    """Previous LoggingMiddleware (BaseHTTPMiddleware)"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        response.headers["X-Request-Id"] = request_id
+        response.headers["X-Process-Time"] = str(process_time)
+        return response
+
+
+class BaseHTTPMetricsMiddleware(BaseHTTPMiddleware):
+    """Previous MetricsMiddleware (BaseHTTPMiddleware)"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        time.time() - start_time
+        return response
+
+
+class StateOnlyMiddleware:
+    """Baseline: only sets request.state.tenant_id so the route works"""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        scope.setdefault("state", {})["tenant_id"] = None
+        await self.app(scope, receive, send)
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/tenants/{tenant_id}")
+    async def get_tenant(tenant_id: str, request: Request):
+        return {"tenant_id": tenant_id, "resolved": request.state.tenant_id}
+
+    if stack == "basehttp":
+        app.add_middleware(BaseHTTPMetricsMiddleware)
+        app.add_middleware(BaseHTTPLoggingMiddleware)
+        app.add_middleware(BaseHTTPTenantMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(MetricsMiddleware)
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(TenantMiddleware)
+    else:
+        app.add_middleware(StateOnlyMiddleware)
+
+    return app
+
+
+async def run_load(app: FastAPI, requests: int, concurrency: int) -> List[float]:
+    transport = httpx.ASGITransport(app=app)
+    latencies: List[float] = []
+    remaining = requests
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://acme.platform.local") as client:
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                response = await client.get("/v1/tenants/t-1", headers={"X-Tenant-Id": "acme"})
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=1000)
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for stack in ("bare", "basehttp", "asgi"):
+        app = build_app(stack)
+        await run_load(app, args.warmup, args.concurrency)
+
+        start = time.perf_counter()
+        latencies = sorted(await run_load(app, args.requests, args.concurrency))
+        elapsed = time.perf_counter() - start
+
+        results[stack] = {
+            "rps": args.requests / elapsed,
+            "mean_ms": statistics.mean(latencies) * 1000,
+            "p99_ms": latencies[int(0.99 * (len(latencies) - 1))] * 1000,
+            "us_per_request": elapsed / args.requests * 1e6
+        }
+
+    bare = results["bare"]["us_per_request"]
+    print(f"{'stack':<10} {'req/s':>9} {'mean ms':>9} {'p99 ms':>8} {'us/req':>8} {'overhead us':>12}")
+    for stack, row in results.items():
+        print(
+            f"{stack:<10} {row['rps']:>9.0f} {row['mean_ms']:>9.2f} {row['p99_ms']:>8.2f} "
+            f"{row['us_per_request']:>8.1f} {row['us_per_request'] - bare:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Cold start time and memory of the service
+
+Each run starts a fresh interpreter and measures:
+- import: time to import src.main (the app is built at import) and peak RSS
+- serving: time from spawning uvicorn until GET /health/live answers, and
+  the server's RSS at that point
+
+Postgres, Redis and NATS do not need to be running: startup does not wait
+for them. RSS is read from /proc, so "serving" memory is Linux only.
+
+Usage:
+    python benchmarks/startup.py [--runs 10]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from typing import List, Optional, Tuple
+
+SERVICE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+_IMPORT_SCRIPT = """
+import resource, time
+start = time.perf_counter()
+import src.main
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure_import() -> Tuple[float, float]:
+    """Seconds to import src.main and peak RSS in MiB"""
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT], cwd=SERVICE_ROOT, capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), int(output[1]) / 1024
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_mib(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def measure_serving(timeout: float = 30.0) -> Tuple[float, Optional[float]]:
+    """Seconds until /health/live answers and the server's RSS in MiB"""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port), "--no-access-log"],
+        cwd=SERVICE_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health/live", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start, rss_mib(server.pid)
+            except OSError:
+                time.sleep(0.005)
+        raise SystemExit(f"Server did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def summary(values: List[float], unit: str) -> str:
+    return f"median {statistics.median(values):>7.1f} {unit}   min {min(values):>7.1f} {unit}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    measure_import()  # Warm the bytecode cache
+    imports = [measure_import() for _ in range(args.runs)]
+    print(f"import   time  {summary([seconds * 1000 for seconds, _ in imports], 'ms')}")
+    print(f"import   RSS   {summary([rss for _, rss in imports], 'MiB')}")
+
+    serving = [measure_serving() for _ in range(args.runs)]
+    print(f"serving  time  {summary([seconds * 1000 for seconds, _ in serving], 'ms')}")
+    rss = [value for _, value in serving if value is not None]
+    if rss:
+        print(f"serving  RSS   {summary(rss, 'MiB')}")
+
+
+if __name__ == "__main__":
+    main()
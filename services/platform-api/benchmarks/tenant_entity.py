@@ -0,0 +1,105 @@
+"""
+Memory and serialization cost of the Tenant entity
+
+- Memory per cached tenant: the slotted Tenant against the same dataclass
+  without slots (the previous layout)
+- Encoding for the Redis tenant cache / NDJSON export: to_dict() + json.dumps
+  (previous) against to_record() + serialization.dumps (orjson)
+- Decoding with Tenant.from_dict
+- Slug generation: re.sub with pattern strings (previous) against the
+  precompiled patterns
+
+Usage:
+    python benchmarks/tenant_entity.py
+"""
+
+import argparse
+import dataclasses
+import json
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.domain.entities.tenant import Tenant, TenantStatus  # noqa: E402
+from src.infrastructure.serialization import dumps, loads, orjson  # noqa: E402
+
+# Same fields and defaults as Tenant, stored in a per-instance __dict__
+DictTenant = dataclasses.make_dataclass(
+    "DictTenant",
+    [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(Tenant)
+    ]
+)
+
+
+def sample_tenant(index: int = 0, cls=Tenant):
+    return cls(
+        name=f"Acme Corporation {index}",
+        slug=f"acme-corporation-{index}",
+        status=TenantStatus.ACTIVE,
+        organization_name="Acme Corporation",
+        organization_domain="acme.example.com",
+        primary_contact_email="owner@acme.example.com",
+        primary_contact_name="Road Runner",
+        billing_email="billing@acme.example.com",
+        features=["sso", "audit-log"]
+    )
+
+
+def bytes_per_instance(cls, count: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tenants = [sample_tenant(index, cls) for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del tenants
+    return size / count
+
+
+def legacy_slug(name: str) -> str:
+    slug = name.lower()
+    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = re.sub(r'[-\s]+', '-', slug)
+    return slug.strip('-')
+
+
+def report(name: str, fn, number: int) -> None:
+    seconds = min(timeit.repeat(fn, number=number, repeat=5))
+    print(f"  {name:<38} {seconds / number * 1e6:>7.2f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tenants", type=int, default=10000)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"JSON backend: {'orjson ' + orjson.__version__ if orjson else 'stdlib json'}")
+
+    print(f"Memory per tenant ({args.tenants} instances, incl. strings/dicts they own)")
+    for name, cls in (("dataclass", DictTenant), ("dataclass(slots=True)", Tenant)):
+        print(f"  {name:<38} {bytes_per_instance(cls, args.tenants):>7.0f} B")
+
+    tenant = sample_tenant()
+    encoded = dumps(tenant.to_record())
+    assert loads(encoded) == json.loads(json.dumps(tenant.to_dict()))
+
+    print("Per call")
+    report("to_dict()", tenant.to_dict, args.number)
+    report("to_record()", tenant.to_record, args.number)
+    report("json.dumps(to_dict())", lambda: json.dumps(tenant.to_dict()), args.number)
+    report("dumps(to_record())", lambda: dumps(tenant.to_record()), args.number)
+    report("Tenant.from_dict(json.loads(...))", lambda: Tenant.from_dict(json.loads(encoded)), args.number)
+    report("Tenant.from_dict(loads(...))", lambda: Tenant.from_dict(loads(encoded)), args.number)
+    report("slug: re.sub(pattern string)", lambda: legacy_slug(tenant.name), args.number)
+    report("slug: precompiled patterns", lambda: tenant._generate_slug(tenant.name), args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Per-request cost of bearer token verification
+
+Compares TokenVerifier.verify on a token seen before (claims cache hit plus
+revocation lookup) with full verification on every request, for
+platform-api HS256 tokens and RS256 tokens as issued by the identity
+provider (RS256 is skipped when the `rsa` package is not installed).
+
+Usage:
+    python benchmarks/token_verification.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from jose import jwk, jwt
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.adapters.outbound.auth.revocation import RevocationList  # noqa: E402
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier  # noqa: E402
+
+ISSUER = "https://logto.example/oidc"
+
+
+class StaticJwks:
+    """JWKS cache stand-in holding one key"""
+
+    def __init__(self, key):
+        self.key = key
+
+    async def get_key(self, kid):
+        return self.key
+
+
+def rs256_token():
+    try:
+        import rsa
+    except ImportError:
+        return None, None
+    public_key, private_key = rsa.newkeys(2048)
+    public_jwk = jwk.construct(public_key.save_pkcs1().decode(), "RS256").to_dict()
+    token = jwt.encode(
+        {"sub": "user", "iss": ISSUER, "exp": int(time.time()) + 3600, "jti": "bench"},
+        private_key.save_pkcs1().decode(),
+        algorithm="RS256",
+        headers={"kid": "bench"}
+    )
+    return token, StaticJwks(public_jwk)
+
+
+async def measure(verifier: TokenVerifier, token: str, requests: int, cached: bool) -> float:
+    await verifier.verify(token)
+    start = time.perf_counter()
+    for _ in range(requests):
+        if not cached:
+            verifier._claims.clear()
+        await verifier.verify(token)
+    return (time.perf_counter() - start) / requests
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    revocations = RevocationList(redis=None)
+    cases = [("HS256 (platform-api)", TokenIssuer("secret").issue("user")["access_token"], None)]
+    token, jwks = rs256_token()
+    if token is not None:
+        cases.append(("RS256 (identity provider)", token, jwks))
+
+    for name, token, jwks in cases:
+        verifier = TokenVerifier("secret", jwks=jwks, jwks_issuer=ISSUER, revocations=revocations)
+        uncached = await measure(verifier, token, max(args.requests // 20, 100), cached=False)
+        cached = await measure(verifier, token, args.requests, cached=True)
+        print(f"{name:<28} verify every time {uncached * 1e6:>9.1f} us   cached {cached * 1e6:>6.2f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,157 @@
+"""
+Bulk Provisioning Helpers
+Records from an NDJSON or JSON array body, validated one at a time and
+inserted in chunks, with per-record results streamed back as NDJSON
+"""
+
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Set, Tuple, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, Request, status
+from pydantic import ValidationError
+
+from src.adapters.inbound.rest.pagination import NDJSON_MEDIA_TYPE
+from src.infrastructure.serialization import dumps, loads
+
+T = TypeVar("T")
+
+_WHITESPACE = " \t\r\n"
+
+
+class MalformedRecord(Exception):
+    """A record that is not valid JSON (yielded by iter_records, not raised)"""
+
+
+async def read_body(request: Request, max_bytes: int) -> bytes:
+    """Request body, or 413 once it grows past max_bytes"""
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Bulk request body exceeds {max_bytes} bytes"
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def iter_records(body: bytes, content_type: str) -> Iterator[Any]:
+    """
+    Decode records one at a time from NDJSON, or from a JSON array
+
+    A malformed NDJSON line is yielded as MalformedRecord and decoding goes
+    on; in a JSON array nothing after a syntax error can be located, so the
+    MalformedRecord is the last item.
+    """
+    if content_type.split(";")[0].strip() == NDJSON_MEDIA_TYPE:
+        for line in body.splitlines():
+            if line.strip():
+                try:
+                    yield loads(line)
+                except ValueError as e:
+                    yield MalformedRecord(f"Invalid JSON: {e}")
+        return
+
+    try:
+        text = body.decode()
+    except UnicodeDecodeError:
+        yield MalformedRecord("Body is not valid UTF-8")
+        return
+    decoder = json.JSONDecoder()
+    position = _skip_whitespace(text, 0)
+    if not text.startswith("[", position):
+        yield MalformedRecord("Expected an NDJSON body or a JSON array")
+        return
+    position = _skip_whitespace(text, position + 1)
+    while not text.startswith("]", position):
+        try:
+            record, position = decoder.raw_decode(text, position)
+        except ValueError as e:
+            yield MalformedRecord(f"Invalid JSON: {e}")
+            return
+        yield record
+        position = _skip_whitespace(text, position)
+        if text.startswith(",", position):
+            position = _skip_whitespace(text, position + 1)
+        elif not text.startswith("]", position):
+            yield MalformedRecord(f"Expected ',' or ']' at position {position}")
+            return
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    while position < len(text) and text[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+def error_message(error: Exception) -> str:
+    """One-line description of a validation error"""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'record'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    return str(error)
+
+
+async def provision(
+    records: Iterator[Any],
+    build: Callable[[Any], T],
+    insert: Callable[[List[T]], Awaitable[Set[UUID]]],
+    chunk_size: int = 1000,
+    rejection: Optional[Callable[[T], Optional[str]]] = None
+) -> AsyncIterator[bytes]:
+    """
+    Validate and insert records, yielding NDJSON results one chunk at a time
+
+    ``build`` turns a decoded record into an entity (raising ValueError when
+    the record is invalid); ``insert`` adds a chunk of entities in one
+    statement and returns the ids actually inserted. An entity that was not
+    inserted already existed, unless ``rejection`` (called after its chunk's
+    insert) gives the reason it was refused, which makes it invalid. Results
+    are in record order: one line per record with its ``index`` and
+    ``status`` (created, exists or invalid), then a summary line; a stream
+    without the summary was cut short by an error.
+    """
+    counts = {"created": 0, "exists": 0, "invalid": 0}
+    pending: List[Tuple[int, Any]] = []
+    entities: List[T] = []
+
+    async def flush() -> bytes:
+        inserted = await insert(entities) if entities else set()
+        lines = []
+        for index, item in pending:
+            if isinstance(item, Exception):
+                result = {"index": index, "status": "invalid", "error": error_message(item)}
+            elif item.id in inserted:
+                result = {"index": index, "status": "created", "id": str(item.id)}
+            elif rejection is not None and (reason := rejection(item)) is not None:
+                result = {"index": index, "status": "invalid", "error": reason}
+            else:
+                result = {"index": index, "status": "exists"}
+            counts[result["status"]] += 1
+            lines.append(dumps(result))
+        pending.clear()
+        entities.clear()
+        return b"\n".join(lines) + b"\n"
+
+    for index, record in enumerate(records):
+        if isinstance(record, MalformedRecord):
+            pending.append((index, record))
+        else:
+            try:
+                entity = build(record)
+            except ValueError as e:
+                pending.append((index, e))
+            else:
+                pending.append((index, entity))
+                entities.append(entity)
+        if len(pending) >= chunk_size:
+            yield await flush()
+
+    if pending:
+        yield await flush()
+    yield dumps({"summary": counts}) + b"\n"
@@ -0,0 +1,104 @@
+"""
+REST API Dependencies
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.adapters.outbound.auth.tokens import InvalidToken
+from src.adapters.outbound.cache.usage_meter import UsageMeter
+from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+from src.adapters.outbound.persistence.usage_repository import SqlAlchemyUsageRepository
+from src.adapters.outbound.persistence.user_repository import SqlAlchemyUserRepository
+from src.domain.entities.tenant import Tenant
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.domain.ports.repositories.usage_repository import UsageRepository
+from src.domain.ports.repositories.user_repository import UserRepository
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.engine import get_database
+
+
+def get_tenant_repository() -> TenantRepository:
+    """Tenant repository on the shared database engine"""
+    return SqlAlchemyTenantRepository(get_database())
+
+
+def get_user_repository() -> UserRepository:
+    """User repository on the shared database engine"""
+    return SqlAlchemyUserRepository(get_database())
+
+
+def get_usage_repository() -> UsageRepository:
+    """Usage rollup repository on the shared database engine"""
+    return SqlAlchemyUsageRepository(get_database())
+
+
+def get_usage_meter(request: Request) -> Optional[UsageMeter]:
+    """Usage meter created in the app lifespan (None when metering is disabled)"""
+    return getattr(request.app.state, "usage_meter", None)
+
+
+def get_current_tenant(request: Request) -> Tenant:
+    """Tenant resolved and validated by TenantMiddleware"""
+    tenant = getattr(request.state, "tenant", None)
+    if tenant is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Tenant required")
+    return tenant
+
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_claims(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> Dict[str, Any]:
+    """Verified claims of the request's bearer access token (401 if missing or invalid)"""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    try:
+        return await request.app.state.token_verifier.verify(credentials.credentials)
+    except InvalidToken:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+def has_scope(claims: Dict[str, Any], scope: str) -> bool:
+    """Whether the claims grant a scope (space-separated ``scope`` claim, as issued by Logto)"""
+    granted = claims.get("scope") or ""
+    if isinstance(granted, str):
+        granted = granted.split()
+    return scope in granted
+
+
+async def require_admin(claims: Dict[str, Any] = Depends(get_current_claims)) -> Dict[str, Any]:
+    """Claims of a caller holding the platform admin scope (403 otherwise)"""
+    if not has_scope(claims, settings.AUTH_ADMIN_SCOPE):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin scope required")
+    return claims
+
+
+def check_tenant_access(claims: Dict[str, Any], tenant: Tenant) -> None:
+    """403 unless the claims belong to the tenant (``tenant_id`` claim, id or slug) or hold the admin scope"""
+    if claims.get("tenant_id") in (str(tenant.id), tenant.slug):
+        return
+    if not has_scope(claims, settings.AUTH_ADMIN_SCOPE):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of this tenant")
+
+
+async def get_member_tenant(
+    claims: Dict[str, Any] = Depends(get_current_claims),
+    tenant: Tenant = Depends(get_current_tenant)
+) -> Tenant:
+    """Current tenant, for a caller that belongs to it or holds the admin scope"""
+    check_tenant_access(claims, tenant)
+    return tenant
@@ -0,0 +1,52 @@
+"""
+Keyset Pagination and NDJSON Streaming Helpers
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+from src.infrastructure.serialization import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def encode_cursor(created_at: datetime, item_id: UUID) -> str:
+    """Opaque cursor for the (created_at, id) position of the last item on a page"""
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, UUID]]:
+    """Parse a cursor from encode_cursor; 400 if it is malformed"""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(item_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+async def ndjson_lines(
+    items: AsyncIterator[Any],
+    serialize: Callable[[Any], dict],
+    chunk_size: int = 500
+) -> AsyncIterator[bytes]:
+    """
+    Encode items as NDJSON, yielding one chunk per ``chunk_size`` lines
+
+    Only one chunk is held in memory; the response is sent as it is produced.
+    """
+    lines = []
+    async for item in items:
+        lines.append(dumps(serialize(item)))
+        if len(lines) >= chunk_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
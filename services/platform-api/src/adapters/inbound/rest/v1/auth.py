@@ -2,24 +2,127 @@
 Authentication Endpoints
 """
 
-from fastapi import APIRouter, status
+import time
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import BaseModel
+
+from src.adapters.inbound.rest.dependencies import get_current_claims
+from src.adapters.outbound.auth.tokens import InvalidToken
+from src.infrastructure.config.settings import settings
 
 router = APIRouter()
 
+# Claims carried over from a verified token into the tokens issued for it
+_CARRIED_CLAIMS = ("tenant_id", "scope", "fam")
+
+
+class LoginRequest(BaseModel):
+    """Identity provider (Logto) token to exchange for platform tokens"""
+    token: str
+
+
+class RefreshRequest(BaseModel):
+    """Refresh token to rotate"""
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    """Refresh token to revoke along with the access token"""
+    refresh_token: Optional[str] = None
+
+
+async def _verify(request: Request, token: str, token_type: str) -> Dict[str, Any]:
+    try:
+        return await request.app.state.token_verifier.verify(token, token_type)
+    except InvalidToken:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid or expired {token_type} token"
+        )
+
+
+async def _revoke(request: Request, claims: Dict[str, Any]) -> None:
+    """Revoke a token until it expires"""
+    revocations = request.app.state.token_verifier.revocations
+    if revocations is not None and claims.get("jti"):
+        await revocations.revoke(claims["jti"], claims["exp"])
+
+
+def _login_tenant(request: Request, claims: Dict[str, Any]) -> Optional[str]:
+    """
+    Tenant of an identity token, which must match the request's tenant (if any)
+
+    The tenant comes from the identity provider's claim, never from the
+    request alone: X-Tenant-ID only selects which of the user's tenants to
+    sign in to, and naming any other tenant is a 403.
+    """
+    claimed = claims.get(settings.AUTH_TENANT_CLAIM)
+    claimed = str(claimed) if claimed else None
+    requested = getattr(request.state, "tenant_id", None)
+    if not requested:
+        return claimed
+
+    tenant = getattr(request.state, "tenant", None)
+    names = {requested} if tenant is None else {str(tenant.id), tenant.slug}
+    if claimed not in names:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of this tenant")
+    return str(tenant.id) if tenant is not None else claimed
+
 
 @router.post("/login", status_code=status.HTTP_200_OK)
-async def login():
-    """Login endpoint - TODO: Implement"""
-    return {"message": "Login endpoint - To be implemented"}
+async def login(payload: LoginRequest, request: Request) -> Dict[str, Any]:
+    """Exchange an identity provider token for platform access and refresh tokens"""
+    claims = await _verify(request, payload.token, "identity")
+
+    # Scopes granted by the identity provider (e.g. the admin scope) carry over;
+    # every token rotated from this login shares its family id
+    carried = {name: claims[name] for name in ("scope",) if name in claims}
+    carried["fam"] = uuid4().hex
+    tenant_id = _login_tenant(request, claims)
+    if tenant_id:
+        carried["tenant_id"] = tenant_id
+    return request.app.state.token_issuer.issue(claims["sub"], carried)
 
 
 @router.post("/logout", status_code=status.HTTP_200_OK)
-async def logout():
-    """Logout endpoint - TODO: Implement"""
-    return {"message": "Logout endpoint - To be implemented"}
+async def logout(
+    request: Request,
+    payload: Optional[LogoutRequest] = None,
+    claims: Dict[str, Any] = Depends(get_current_claims)
+) -> Dict[str, Any]:
+    """Revoke the current access token (and the given refresh token)"""
+    await _revoke(request, claims)
+    if payload is not None and payload.refresh_token:
+        refresh_claims = await _verify(request, payload.refresh_token, "refresh")
+        if refresh_claims["sub"] != claims["sub"]:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Refresh token belongs to another subject")
+        await _revoke(request, refresh_claims)
+    return {"message": "Logged out"}
 
 
 @router.post("/refresh", status_code=status.HTTP_200_OK)
-async def refresh_token():
-    """Refresh token endpoint - TODO: Implement"""
-    return {"message": "Refresh token endpoint - To be implemented"}
\ No newline at end of file
+async def refresh_token(payload: RefreshRequest, request: Request) -> Dict[str, Any]:
+    """
+    Rotate a refresh token: revoke it and issue a new token pair
+
+    Each refresh token is single-use across replicas (the revocation is a
+    Redis ZADD NX, so only one caller can win it). Presenting one again means
+    it leaked: the whole token family is revoked and the caller gets a 401.
+    """
+    claims = await _verify(request, payload.refresh_token, "refresh")
+    revocations = request.app.state.token_verifier.revocations
+    if revocations is not None and claims.get("jti"):
+        if not await revocations.revoke_once(claims["jti"], claims["exp"]):
+            if claims.get("fam"):
+                issuer = request.app.state.token_issuer
+                await revocations.revoke_family(claims["fam"], time.time() + issuer.refresh_ttl_seconds)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has already been used"
+            )
+
+    carried = {name: claims[name] for name in _CARRIED_CLAIMS if name in claims}
+    return request.app.state.token_issuer.issue(claims["sub"], carried)
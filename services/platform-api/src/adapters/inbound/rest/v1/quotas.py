@@ -2,20 +2,43 @@
 Quota Management Endpoints
 """
 
-from fastapi import APIRouter, status
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.adapters.inbound.rest.dependencies import get_member_tenant, get_usage_meter, get_usage_repository
+from src.adapters.outbound.cache.usage_meter import UsageMeter, current_period
+from src.domain.entities.tenant import QUOTA_TYPES, Tenant
+from src.domain.ports.repositories.usage_repository import UsageRepository
 
 router = APIRouter()
 
 
+async def _current_usage(
+    tenant: Tenant,
+    meter: Optional[UsageMeter],
+    repository: UsageRepository
+) -> Dict[str, int]:
+    """Current-period usage: metered totals, or the rollups when metering is off"""
+    if meter is not None:
+        return await meter.usage(tenant.id)
+    return await repository.get_usage(tenant.id, current_period())
+
+
 @router.get("/", status_code=status.HTTP_200_OK)
-async def get_quotas():
-    """Get tenant quotas - TODO: Implement"""
+async def get_quotas(
+    tenant: Tenant = Depends(get_member_tenant),
+    meter: Optional[UsageMeter] = Depends(get_usage_meter),
+    repository: UsageRepository = Depends(get_usage_repository)
+) -> Dict[str, Any]:
+    """Current tenant's quotas with usage in the current period (limit -1 = unlimited)"""
+    usage = await _current_usage(tenant, meter, repository)
     return {
         "quotas": {
-            "users": {"used": 0, "limit": 10},
-            "requests": {"used": 0, "limit": 10000},
-            "storage": {"used": 0, "limit": 10}
-        }
+            quota_type: {"used": usage.get(quota_type, 0), "limit": tenant.quota_limit(quota_type)}
+            for quota_type in QUOTA_TYPES
+        },
+        "period": current_period()
     }
 
 
@@ -26,13 +49,25 @@ async def update_quotas():
 
 
 @router.get("/usage", status_code=status.HTTP_200_OK)
-async def get_usage():
-    """Get current usage - TODO: Implement"""
+async def get_usage(
+    period: Optional[str] = Query(None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$", description="YYYY-MM (default: current month)"),
+    tenant: Tenant = Depends(get_member_tenant),
+    meter: Optional[UsageMeter] = Depends(get_usage_meter),
+    repository: UsageRepository = Depends(get_usage_repository)
+) -> Dict[str, Any]:
+    """
+    Current tenant's usage in one period
+
+    The current month is answered from the metered totals; earlier months
+    from the Postgres rollups.
+    """
+    if period is None or period == current_period():
+        period = current_period()
+        usage = await _current_usage(tenant, meter, repository)
+    else:
+        usage = await repository.get_usage(tenant.id, period)
+
     return {
-        "usage": {
-            "users": 0,
-            "requests": 0,
-            "storage": 0
-        },
-        "period": "current_month"
-    }
\ No newline at end of file
+        "usage": {quota_type: usage.get(quota_type, 0) for quota_type in QUOTA_TYPES},
+        "period": period
+    }
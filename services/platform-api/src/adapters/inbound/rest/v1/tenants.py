@@ -2,36 +2,361 @@
 Tenant Management Endpoints
 """
 
-from fastapi import APIRouter, status
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+
+from src.adapters.inbound.rest.bulk import iter_records, provision, read_body
+from src.adapters.inbound.rest.dependencies import (
+    check_tenant_access,
+    get_current_claims,
+    get_tenant_repository,
+    require_admin
+)
+from src.adapters.inbound.rest.pagination import (
+    NDJSON_MEDIA_TYPE,
+    decode_cursor,
+    encode_cursor,
+    ndjson_lines,
+)
+from src.domain.entities.tenant import TIER_POLICIES, Tenant, TenantTier
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.config.settings import settings
 
 router = APIRouter()
 
 
-@router.get("/", status_code=status.HTTP_200_OK)
-async def list_tenants():
-    """List all tenants - TODO: Implement"""
-    return {"tenants": [], "total": 0}
+class TenantCreate(BaseModel):
+    """Tenant creation request"""
+    name: str
+    organization_name: str
+    primary_contact_email: str
+    primary_contact_name: Optional[str] = None
+    organization_domain: Optional[str] = None
+    tier: TenantTier = TenantTier.FREE
+
+
+class TenantUpdate(BaseModel):
+    """Tenant update request (only provided fields change)"""
+    name: Optional[str] = None
+    organization_name: Optional[str] = None
+    organization_domain: Optional[str] = None
+    primary_contact_name: Optional[str] = None
+    billing_email: Optional[str] = None
+
+
+class TenantSuspend(BaseModel):
+    """Tenant suspension request"""
+    reason: Optional[str] = None
+
+
+class TenantTierUpdate(BaseModel):
+    """Tenant tier change request"""
+    tier: TenantTier
+
+
+def _new_tenant(payload: TenantCreate) -> Tenant:
+    policy = TIER_POLICIES[payload.tier]
+    return Tenant(
+        name=payload.name,
+        organization_name=payload.organization_name,
+        organization_domain=payload.organization_domain,
+        primary_contact_email=payload.primary_contact_email,
+        primary_contact_name=payload.primary_contact_name,
+        tier=payload.tier,
+        max_users=policy.max_users,
+        max_requests_per_month=policy.max_requests_per_month,
+        max_storage_gb=policy.max_storage_gb
+    )
+
+
+async def _load_tenant(repository: TenantRepository, tenant_id: UUID) -> Tenant:
+    tenant = await repository.get_by_id(tenant_id)
+    if tenant is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found")
+    return tenant
+
+
+async def _publish_events(request: Request, tenant: Tenant) -> None:
+    """
+    Handle events committed to the outbox by the repository: invalidate this
+    replica's cached tenant now and wake the outbox relay for the rest
+    """
+    events = tenant.pull_events()
+    if not events:
+        return
+    resolver = getattr(request.app.state, "tenant_resolver", None)
+    if resolver is not None:
+        await resolver.handle_events(events)
+    relay = getattr(request.app.state, "outbox_relay", None)
+    if relay is not None:
+        relay.notify()
+
+
+async def _change_tenant(
+    request: Request,
+    repository: TenantRepository,
+    tenant_id: UUID,
+    change: Callable[[Tenant], None]
+) -> Tenant:
+    """Apply a domain operation to a tenant, persist it and publish its events"""
+    try:
+        tenant = await repository.update(tenant_id, change)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if tenant is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found")
+
+    await _publish_events(request, tenant)
+    return tenant
+
+
+@router.get(
+    "/",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def list_tenants(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add a planner-estimated total"),
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """List tenants with keyset (cursor) pagination"""
+    tenants = await repository.list_page(limit + 1, decode_cursor(cursor))
+    has_more = len(tenants) > limit
+    tenants = tenants[:limit]
+
+    response: Dict[str, Any] = {
+        "tenants": [tenant.to_dict() for tenant in tenants],
+        "next_cursor": encode_cursor(tenants[-1].created_at, tenants[-1].id) if has_more else None
+    }
+    if include_total:
+        response["estimated_total"] = await repository.estimate_count()
+    return response
+
 
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def export_tenants(
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> StreamingResponse:
+    """Stream every tenant as NDJSON (constant memory)"""
+    return StreamingResponse(
+        ndjson_lines(repository.iter_all(), Tenant.to_record),
+        media_type=NDJSON_MEDIA_TYPE
+    )
 
-@router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_tenant():
-    """Create new tenant - TODO: Implement"""
-    return {"message": "Tenant creation - To be implemented"}
+
+@router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(require_admin)]
+)
+async def create_tenant(
+    payload: TenantCreate,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Create new tenant (pending until activated, with the quotas of its tier)"""
+    tenant = _new_tenant(payload)
+    try:
+        await repository.add(tenant)
+    except IntegrityError:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Tenant slug already exists")
+    return tenant.to_dict()
+
+
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def bulk_create_tenants(
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> StreamingResponse:
+    """
+    Create tenants from an NDJSON body or a JSON array
+
+    Streams one NDJSON result per record (created, exists when the slug is
+    taken, or invalid) and a summary line.
+    """
+    body = await read_body(request, settings.BULK_MAX_BODY_BYTES)
+
+    def build(record: Any) -> Tenant:
+        return _new_tenant(TenantCreate.model_validate(record))
+
+    return StreamingResponse(
+        provision(
+            iter_records(body, request.headers.get("content-type", "")),
+            build,
+            repository.add_many,
+            settings.BULK_CHUNK_SIZE
+        ),
+        media_type=NDJSON_MEDIA_TYPE
+    )
 
 
 @router.get("/{tenant_id}", status_code=status.HTTP_200_OK)
-async def get_tenant(tenant_id: str):
-    """Get tenant details - TODO: Implement"""
-    return {"tenant_id": tenant_id, "message": "To be implemented"}
+async def get_tenant(
+    tenant_id: UUID,
+    claims: Dict[str, Any] = Depends(get_current_claims),
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Get tenant details (members of the tenant and admins)"""
+    tenant = await _load_tenant(repository, tenant_id)
+    check_tenant_access(claims, tenant)
+    return tenant.to_dict()
+
+
+@router.patch(
+    "/{tenant_id}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def update_tenant(
+    tenant_id: UUID,
+    payload: TenantUpdate,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Update tenant (publishes tenant.updated with the changed fields)"""
+    changes = payload.model_dump(exclude_unset=True)
+    tenant = await _change_tenant(request, repository, tenant_id, lambda tenant: tenant.update_details(**changes))
+    return tenant.to_dict()
+
+
+@router.delete(
+    "/{tenant_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_admin)]
+)
+async def delete_tenant(
+    tenant_id: UUID,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+):
+    """Delete tenant (archive, soft delete)"""
+    await _change_tenant(request, repository, tenant_id, Tenant.archive)
+    return None
+
+
+@router.post(
+    "/{tenant_id}/activate",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def activate_tenant(
+    tenant_id: UUID,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Activate a pending tenant"""
+    tenant = await _change_tenant(request, repository, tenant_id, Tenant.activate)
+    return tenant.to_dict()
+
+
+@router.post(
+    "/{tenant_id}/suspend",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def suspend_tenant(
+    tenant_id: UUID,
+    request: Request,
+    payload: Optional[TenantSuspend] = None,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Suspend an active tenant"""
+    reason = payload.reason if payload is not None else None
+    tenant = await _change_tenant(request, repository, tenant_id, lambda tenant: tenant.suspend(reason))
+    return tenant.to_dict()
+
+
+@router.post(
+    "/{tenant_id}/reactivate",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def reactivate_tenant(
+    tenant_id: UUID,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Reactivate a suspended tenant"""
+    tenant = await _change_tenant(request, repository, tenant_id, Tenant.reactivate)
+    return tenant.to_dict()
+
+
+@router.put(
+    "/{tenant_id}/tier",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def update_tenant_tier(
+    tenant_id: UUID,
+    payload: TenantTierUpdate,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Move an active tenant to another tier (quotas follow the tier)"""
+    tenant = await _change_tenant(request, repository, tenant_id, lambda tenant: tenant.update_tier(payload.tier))
+    return tenant.to_dict()
+
+
+@router.get("/{tenant_id}/tier/history", status_code=status.HTTP_200_OK)
+async def get_tenant_tier_history(
+    tenant_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    claims: Dict[str, Any] = Depends(get_current_claims),
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Tier changes of a tenant, newest first (members of the tenant and admins)"""
+    check_tenant_access(claims, await _load_tenant(repository, tenant_id))
+    changes = await repository.get_tier_history(tenant_id, limit)
+    return {
+        "tenant_id": str(tenant_id),
+        "history": [
+            {"from": change.old_tier, "to": change.new_tier, "changed_at": change.occurred_at.isoformat()}
+            for change in changes
+        ]
+    }
 
 
-@router.patch("/{tenant_id}", status_code=status.HTTP_200_OK)
-async def update_tenant(tenant_id: str):
-    """Update tenant - TODO: Implement"""
-    return {"tenant_id": tenant_id, "message": "To be implemented"}
+@router.put(
+    "/{tenant_id}/features/{feature}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def add_tenant_feature(
+    tenant_id: UUID,
+    feature: str,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Enable a feature for a tenant"""
+    tenant = await _change_tenant(request, repository, tenant_id, lambda tenant: tenant.add_feature(feature))
+    return tenant.to_dict()
 
 
-@router.delete("/{tenant_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_tenant(tenant_id: str):
-    """Delete tenant - TODO: Implement"""
-    return None
\ No newline at end of file
+@router.delete(
+    "/{tenant_id}/features/{feature}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_admin)]
+)
+async def remove_tenant_feature(
+    tenant_id: UUID,
+    feature: str,
+    request: Request,
+    repository: TenantRepository = Depends(get_tenant_repository)
+) -> Dict[str, Any]:
+    """Disable a feature for a tenant"""
+    tenant = await _change_tenant(request, repository, tenant_id, lambda tenant: tenant.remove_feature(feature))
+    return tenant.to_dict()
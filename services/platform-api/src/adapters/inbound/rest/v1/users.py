@@ -2,15 +2,110 @@
 User Management Endpoints
 """
 
-from fastapi import APIRouter, status
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.adapters.inbound.rest.bulk import iter_records, provision, read_body
+from src.adapters.inbound.rest.dependencies import get_member_tenant, get_user_repository
+from src.adapters.inbound.rest.pagination import (
+    NDJSON_MEDIA_TYPE,
+    decode_cursor,
+    encode_cursor,
+    ndjson_lines,
+)
+from src.domain.entities.tenant import Tenant
+from src.domain.entities.user import User, UserRole
+from src.domain.ports.repositories.user_repository import UserRepository
+from src.infrastructure.config.settings import settings
 
 router = APIRouter()
 
 
+class UserCreate(BaseModel):
+    """User creation request"""
+    email: str
+    name: Optional[str] = None
+    role: UserRole = UserRole.MEMBER
+
+
 @router.get("/", status_code=status.HTTP_200_OK)
-async def list_users():
-    """List users - TODO: Implement"""
-    return {"users": [], "total": 0}
+async def list_users(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add a planner-estimated total"),
+    tenant: Tenant = Depends(get_member_tenant),
+    repository: UserRepository = Depends(get_user_repository)
+) -> Dict[str, Any]:
+    """List the current tenant's users with keyset (cursor) pagination"""
+    users = await repository.list_page(tenant.id, limit + 1, decode_cursor(cursor))
+    has_more = len(users) > limit
+    users = users[:limit]
+
+    response: Dict[str, Any] = {
+        "users": [user.to_dict() for user in users],
+        "next_cursor": encode_cursor(users[-1].created_at, users[-1].id) if has_more else None
+    }
+    if include_total:
+        response["estimated_total"] = await repository.estimate_count(tenant.id)
+    return response
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_users(
+    tenant: Tenant = Depends(get_member_tenant),
+    repository: UserRepository = Depends(get_user_repository)
+) -> StreamingResponse:
+    """Stream every user of the current tenant as NDJSON (constant memory)"""
+    return StreamingResponse(
+        ndjson_lines(repository.iter_all(tenant.id), User.to_dict),
+        media_type=NDJSON_MEDIA_TYPE
+    )
+
+
+@router.post("/bulk", status_code=status.HTTP_200_OK)
+async def bulk_create_users(
+    request: Request,
+    tenant: Tenant = Depends(get_member_tenant),
+    repository: UserRepository = Depends(get_user_repository)
+) -> StreamingResponse:
+    """
+    Create users of the current tenant from an NDJSON body or a JSON array
+
+    Streams one NDJSON result per record (created, exists or invalid) and a
+    summary line. Records beyond the tenant's user quota are invalid; the
+    quota is checked by the repository as each chunk is inserted, so
+    concurrent bulk requests cannot overrun it together.
+    """
+    body = await read_body(request, settings.BULK_MAX_BODY_BYTES)
+    max_users = tenant.quota_limit("users")
+    over_quota: Set[UUID] = set()
+
+    def build(record: Any) -> User:
+        payload = UserCreate.model_validate(record)
+        return User(tenant_id=tenant.id, email=payload.email, name=payload.name, role=payload.role)
+
+    async def insert(users: List[User]) -> Set[UUID]:
+        inserted, refused = await repository.add_many(users, max_users)
+        over_quota.update(refused)
+        return inserted
+
+    def rejection(user: User) -> Optional[str]:
+        return "User quota exceeded" if user.id in over_quota else None
+
+    return StreamingResponse(
+        provision(
+            iter_records(body, request.headers.get("content-type", "")),
+            build,
+            insert,
+            settings.BULK_CHUNK_SIZE,
+            rejection
+        ),
+        media_type=NDJSON_MEDIA_TYPE
+    )
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
@@ -34,4 +129,4 @@ async def update_user(user_id: str):
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(user_id: str):
     """Delete user - TODO: Implement"""
-    return None
\ No newline at end of file
+    return None
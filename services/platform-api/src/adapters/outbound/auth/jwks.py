@@ -0,0 +1,99 @@
+"""
+JWKS Cache
+Signing keys of the identity provider (Logto), fetched once and rotated in the background
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+
+class JwksCache:
+    """
+    In-process copy of an OIDC provider's JSON Web Key Set
+
+    - Keys are looked up by ``kid`` from memory; verifying a token never
+      waits on the provider unless it is signed with a key not seen yet
+    - A background task re-fetches the set every ``refresh_interval_seconds``
+      so rotated keys are picked up ahead of use
+    - An unknown ``kid`` triggers one immediate re-fetch (shared by concurrent
+      callers, at most once per ``min_refresh_interval_seconds``)
+    - Fetch failures keep the previous keys
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        refresh_interval_seconds: float = 3600.0,
+        min_refresh_interval_seconds: float = 30.0,
+        timeout_seconds: float = 5.0
+    ):
+        self.jwks_url = jwks_url
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+
+        self._client = httpx.AsyncClient(timeout=timeout_seconds)
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        self._fetching: Optional[asyncio.Task] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        """
+        JWK with the given key id, or None if the provider does not publish it
+        """
+        key = self._keys.get(kid)
+        if key is None and time.monotonic() - self._fetched_at >= self.min_refresh_interval_seconds:
+            await self._refresh()
+            key = self._keys.get(kid)
+        return key
+
+    async def start(self) -> None:
+        """
+        Fetch the keys and keep them fresh in the background
+        """
+        if self._worker is None:
+            await self._refresh()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop rotating keys and close the HTTP client
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        await self._client.aclose()
+
+    async def _refresh(self) -> None:
+        """Fetch the key set once, sharing an in-progress fetch"""
+        if self._fetching is None:
+            self._fetching = asyncio.create_task(self._fetch())
+        fetching = self._fetching
+        try:
+            await asyncio.shield(fetching)
+        finally:
+            if self._fetching is fetching and fetching.done():
+                self._fetching = None
+
+    async def _fetch(self) -> None:
+        self._fetched_at = time.monotonic()
+        try:
+            response = await self._client.get(self.jwks_url)
+            response.raise_for_status()
+            keys = {key["kid"]: key for key in response.json()["keys"] if "kid" in key}
+        except Exception as e:
+            print(f"JWKS fetch from {self.jwks_url} failed, keeping {len(self._keys)} cached keys: {e}")
+            return
+        self._keys = keys
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval_seconds)
+            await self._refresh()
@@ -0,0 +1,112 @@
+"""
+Token Revocation List
+Revoked token ids in a Redis sorted set, mirrored in-process
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+REVOKED_KEY = "platform:auth:revoked"
+
+# Members for revoked token families (every token descended from one login)
+_FAMILY_PREFIX = "family:"
+
+
+class RevocationList:
+    """
+    Revoked tokens, shared by all replicas through Redis
+
+    Token ids (jti) are stored in a sorted set scored by the token's expiry,
+    so entries can be dropped once the token would be rejected anyway; a
+    revoked token family is a ``family:<id>`` entry in the same set. Every
+    replica keeps a copy in memory, refreshed every ``sync_interval_seconds``:
+    is_revoked() is a dict lookup, and a revocation reaches other replicas
+    within one interval (immediately on the replica that revoked it).
+    """
+
+    def __init__(self, redis, sync_interval_seconds: float = 2.0):
+        self.redis = redis
+        self.sync_interval_seconds = sync_interval_seconds
+
+        self._revoked: Dict[str, float] = {}
+        self._worker: Optional[asyncio.Task] = None
+
+    def is_revoked(self, token_id: str) -> bool:
+        """
+        Whether a token id has been revoked (in-process lookup)
+        """
+        return token_id in self._revoked
+
+    def is_family_revoked(self, family_id: str) -> bool:
+        """
+        Whether a token family has been revoked (in-process lookup)
+        """
+        return _FAMILY_PREFIX + family_id in self._revoked
+
+    async def revoke(self, token_id: str, expires_at: float) -> None:
+        """
+        Revoke a token until its expiry (unix time)
+        """
+        self._revoked[token_id] = expires_at
+        await self.redis.zadd(REVOKED_KEY, {token_id: expires_at})
+
+    async def revoke_once(self, token_id: str, expires_at: float) -> bool:
+        """
+        Revoke a token, returning False if it was already revoked
+
+        Decided by Redis (ZADD NX) rather than the local copy, so of several
+        replicas racing to use a single-use token exactly one gets True.
+        """
+        self._revoked[token_id] = expires_at
+        return bool(await self.redis.zadd(REVOKED_KEY, {token_id: expires_at}, nx=True))
+
+    async def revoke_family(self, family_id: str, expires_at: float) -> None:
+        """
+        Revoke every token of a family until ``expires_at`` (the latest expiry of its tokens)
+        """
+        await self.revoke(_FAMILY_PREFIX + family_id, expires_at)
+
+    async def sync(self) -> None:
+        """
+        Merge the unexpired entries in Redis into the local copy, dropping expired ones
+        """
+        now = time.time()
+        await self.redis.zremrangebyscore(REVOKED_KEY, "-inf", now)
+        entries = await self.redis.zrangebyscore(REVOKED_KEY, now, "+inf", withscores=True)
+
+        # Revocations are never lifted, so local entries only go once expired
+        revoked = {token_id: expires_at for token_id, expires_at in self._revoked.items() if expires_at > now}
+        revoked.update(entries)
+        self._revoked = revoked
+
+    async def start(self) -> None:
+        """
+        Load the revocations and keep them in sync in the background
+        """
+        if self._worker is None:
+            try:
+                await self.sync()
+            except Exception as e:
+                print(f"Token revocation sync failed, retrying: {e}")
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop syncing revocations
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval_seconds)
+            try:
+                await self.sync()
+            except Exception as e:
+                print(f"Token revocation sync failed, retrying: {e}")
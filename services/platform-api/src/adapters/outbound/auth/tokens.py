@@ -0,0 +1,183 @@
+"""
+Token Verification and Issuing
+JWT verification with verified claims cached until the token expires
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+from uuid import uuid4
+
+from jose import JWTError, jwt
+
+from src.adapters.outbound.auth.revocation import RevocationList
+
+if TYPE_CHECKING:
+    # httpx is only imported when Logto is configured
+    from src.adapters.outbound.auth.jwks import JwksCache
+
+# Algorithms accepted for identity provider tokens (keys from the JWKS)
+ASYMMETRIC_ALGORITHMS = frozenset({"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"})
+
+
+class InvalidToken(Exception):
+    """Token is malformed, expired, revoked, of the wrong type or not signed by a trusted key"""
+
+
+class TokenVerifier:
+    """
+    Verifies bearer tokens issued by platform-api or by the identity provider
+
+    - platform-api tokens are signed with JWT_SECRET_KEY and carry a ``typ``
+      claim (access or refresh)
+    - Identity provider (Logto) tokens are signed with a key from the JWKS
+      cache, looked up by ``kid``
+    - Verified claims are cached by a hash of the token until the token
+      expires (least recently used entries are evicted first), so a repeat
+      request costs a hash and a few dict lookups (claims cache, revocation
+      list); only the first use of a token pays for signature verification
+    - Revocation applies to single tokens (``jti``) and to token families
+      (``fam``: every token rotated from one login)
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        issuer: str = "platform-api",
+        jwks: Optional["JwksCache"] = None,
+        jwks_issuer: Optional[str] = None,
+        audience: Optional[str] = None,
+        revocations: Optional[RevocationList] = None,
+        max_entries: int = 10000
+    ):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.issuer = issuer
+        self.jwks = jwks
+        self.jwks_issuer = jwks_issuer
+        self.audience = audience
+        self.revocations = revocations
+        self.max_entries = max_entries
+
+        self._claims: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def verify(self, token: str, token_type: str = "access") -> Dict[str, Any]:
+        """
+        Verified claims of a token
+
+        ``token_type`` is "access" (platform-api access or identity provider
+        token), "refresh" (platform-api refresh token) or "identity" (identity
+        provider token only). Raises InvalidToken.
+        """
+        digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        entry = self._claims.get(digest)
+        if entry is not None and entry[0] > time.time():
+            claims = entry[1]
+            self._claims.move_to_end(digest)
+        else:
+            claims = await self._decode(token)
+            self._claims[digest] = (claims["exp"], claims)
+            while len(self._claims) > self.max_entries:
+                self._claims.popitem(last=False)
+
+        self._check(claims, token_type)
+        return claims
+
+    def _check(self, claims: Dict[str, Any], token_type: str) -> None:
+        external = claims.get("iss") != self.issuer
+        if token_type == "identity":
+            valid_type = external
+        elif external:
+            valid_type = token_type == "access"
+        else:
+            valid_type = claims.get("typ") == token_type
+        if not valid_type:
+            raise InvalidToken(f"Not a valid {token_type} token")
+
+        if self.revocations is not None:
+            # A used refresh token is left to the caller (RevocationList.revoke_once),
+            # which has to tell a replay apart from any other invalid token
+            token_id, family_id = claims.get("jti"), claims.get("fam")
+            if token_id and token_type != "refresh" and self.revocations.is_revoked(token_id):
+                raise InvalidToken("Token has been revoked")
+            if family_id and self.revocations.is_family_revoked(family_id):
+                raise InvalidToken("Token family has been revoked")
+
+    async def _decode(self, token: str) -> Dict[str, Any]:
+        """Verify the signature and registered claims"""
+        try:
+            header = jwt.get_unverified_header(token)
+        except JWTError:
+            raise InvalidToken("Malformed token")
+
+        algorithm = header.get("alg")
+        if algorithm == self.algorithm:
+            key, issuer, audience = self.secret_key, self.issuer, None
+        elif algorithm in ASYMMETRIC_ALGORITHMS and self.jwks is not None and header.get("kid"):
+            key = await self.jwks.get_key(header["kid"])
+            if key is None:
+                raise InvalidToken("Unknown signing key")
+            issuer, audience = self.jwks_issuer, self.audience
+        else:
+            raise InvalidToken("Unsupported token algorithm")
+
+        try:
+            return jwt.decode(
+                token,
+                key,
+                algorithms=[algorithm],
+                issuer=issuer,
+                audience=audience,
+                options={"require_exp": True, "verify_aud": audience is not None}
+            )
+        except JWTError as e:
+            raise InvalidToken(str(e))
+
+
+class TokenIssuer:
+    """
+    Issues platform-api access/refresh token pairs (signed with JWT_SECRET_KEY)
+
+    Pairs issued by a refresh keep the ``fam`` claim of the login they descend
+    from, so a whole chain of rotations can be revoked at once.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        issuer: str = "platform-api",
+        access_ttl_seconds: int = 1800,
+        refresh_ttl_seconds: int = 7 * 24 * 3600
+    ):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.issuer = issuer
+        self.access_ttl_seconds = access_ttl_seconds
+        self.refresh_ttl_seconds = refresh_ttl_seconds
+
+    def issue(self, subject: str, claims: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        New access and refresh tokens for a subject, with extra claims (e.g. tenant_id)
+        """
+        now = int(time.time())
+
+        def encode(token_type: str, ttl_seconds: int) -> str:
+            return jwt.encode({
+                **(claims or {}),
+                "sub": subject,
+                "iss": self.issuer,
+                "iat": now,
+                "exp": now + ttl_seconds,
+                "jti": uuid4().hex,
+                "typ": token_type
+            }, self.secret_key, algorithm=self.algorithm)
+
+        return {
+            "access_token": encode("access", self.access_ttl_seconds),
+            "refresh_token": encode("refresh", self.refresh_ttl_seconds),
+            "token_type": "bearer",
+            "expires_in": self.access_ttl_seconds
+        }
@@ -0,0 +1,210 @@
+"""
+Rate Limiter
+Distributed GCRA rate limiting in a single atomic Redis Lua script, with local token leases
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+# KEYS: one per (identity, limit)
+# ARGV: cost, then emission interval and burst tolerance (ms) per key
+#
+# GCRA keeps one "theoretical arrival time" (TAT) per key. A request costing
+# c is allowed when TAT + c * emission - now <= tolerance. Every key must
+# allow the request before any TAT moves, so all limits are checked and
+# updated atomically. If a leased cost (c > 1) does not fit, the script falls
+# back to c = 1. Returns {allowed, binding key index, remaining, reset ms,
+# retry-after ms, cost charged}.
+GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local n = #KEYS
+
+local tats = {}
+for i = 1, n do
+  local stored = redis.call('GET', KEYS[i])
+  local tat = stored and tonumber(stored) or now
+  if tat < now then tat = now end
+  tats[i] = tat
+end
+
+local function evaluate(cost)
+  local binding, min_remaining, reset, retry = 1, nil, 0, 0
+  local allowed = true
+  for i = 1, n do
+    local emission = tonumber(ARGV[2 * i])
+    local tolerance = tonumber(ARGV[2 * i + 1])
+    local new_tat = tats[i] + emission * cost
+    local remaining
+    if new_tat - now > tolerance then
+      allowed = false
+      remaining = 0
+      if new_tat - now - tolerance > retry then
+        retry = new_tat - now - tolerance
+        binding = i
+        reset = tats[i] - now
+      end
+    else
+      remaining = math.floor((tolerance - (new_tat - now)) / emission)
+    end
+    if allowed and (min_remaining == nil or remaining < min_remaining) then
+      min_remaining = remaining
+      binding = i
+      reset = new_tat - now
+    end
+  end
+  return allowed, binding, min_remaining or 0, reset, retry
+end
+
+local cost = tonumber(ARGV[1])
+local allowed, binding, remaining, reset, retry = evaluate(cost)
+if not allowed and cost > 1 then
+  cost = 1
+  allowed, binding, remaining, reset, retry = evaluate(cost)
+end
+if not allowed then
+  return {0, binding, 0, reset, retry, 0}
+end
+
+for i = 1, n do
+  local new_tat = tats[i] + tonumber(ARGV[2 * i]) * cost
+  redis.call('SET', KEYS[i], new_tat, 'PX', math.max(1, new_tat - now))
+end
+return {1, binding, remaining, reset, 0, cost}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """At most ``limit`` requests per ``window_seconds`` (bursts up to ``limit``)"""
+    limit: int
+    window_seconds: int
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a rate limit check, against the tightest applicable limit"""
+    allowed: bool
+    limit: RateLimit
+    remaining: int
+    reset_seconds: float
+    retry_after_seconds: float = 0.0
+
+
+@dataclass
+class _Lease:
+    """Tokens charged in Redis ahead of time and spent locally"""
+    tokens: int
+    expires_at: float
+    result: RateLimitResult
+
+
+class RateLimiter:
+    """
+    GCRA rate limiter shared by all replicas through Redis
+
+    Each check evaluates every limit for every identity (tenant, token subject) in
+    one EVALSHA round-trip. Identities far below their limits (remaining of
+    at least ``lease_threshold``) are charged ``lease_size`` extra tokens
+    up front; those tokens are then spent locally for up to
+    ``lease_ttl_seconds`` without contacting Redis. Unused leased tokens
+    expire, which can only under-admit, never over-admit. Rejected
+    identities are rejected locally until their retry-after has passed.
+
+    All keys of one check are passed to one script, so in Redis Cluster they
+    must share a hash slot.
+    """
+
+    def __init__(
+        self,
+        redis,
+        limits: Sequence[RateLimit],
+        lease_size: int = 10,
+        lease_ttl_seconds: float = 1.0,
+        max_leases: int = 10000,
+        key_prefix: str = "ratelimit"
+    ):
+        self.redis = redis
+        self.limits = tuple(limits)
+        self.lease_size = lease_size
+        self.lease_threshold = 4 * lease_size
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.max_leases = max_leases
+        self.key_prefix = key_prefix
+
+        self._script = redis.register_script(GCRA_SCRIPT)
+        self._args: List[int] = []
+        for rate_limit in self.limits:
+            emission_ms = rate_limit.window_seconds * 1000 / rate_limit.limit
+            self._args += [int(emission_ms), int(emission_ms * rate_limit.limit)]
+        self._leases: "OrderedDict[tuple, _Lease]" = OrderedDict()
+
+    async def check(self, identities: Sequence[str]) -> RateLimitResult:
+        """
+        Admit or reject one request for the given identities
+        """
+        lease_key = tuple(identities)
+        lease = self._leases.get(lease_key)
+        now = time.monotonic()
+
+        if lease is not None and lease.expires_at > now:
+            result = lease.result
+            if not result.allowed:
+                # Rejected until retry-after passes; no need to ask Redis again
+                return result
+            if lease.tokens > 0:
+                lease.tokens -= 1
+                return RateLimitResult(True, result.limit, result.remaining + lease.tokens, result.reset_seconds)
+
+        cost = 1
+        if self.lease_size and lease is not None and lease.result.remaining >= self.lease_threshold:
+            cost += self.lease_size
+
+        keys = [
+            f"{self.key_prefix}:{identity}:{rate_limit.window_seconds}"
+            for identity in identities
+            for rate_limit in self.limits
+        ]
+        allowed, binding, remaining, reset_ms, retry_ms, charged = await self._script(
+            keys=keys,
+            args=[cost] + self._args * len(identities)
+        )
+
+        result = RateLimitResult(
+            allowed=bool(allowed),
+            limit=self.limits[(binding - 1) % len(self.limits)],
+            remaining=int(remaining),
+            reset_seconds=reset_ms / 1000,
+            retry_after_seconds=retry_ms / 1000
+        )
+
+        self._leases[lease_key] = _Lease(
+            tokens=max(0, int(charged) - 1),
+            expires_at=now + (self.lease_ttl_seconds if result.allowed else result.retry_after_seconds),
+            result=result
+        )
+        self._leases.move_to_end(lease_key)
+        while len(self._leases) > self.max_leases:
+            self._leases.popitem(last=False)
+
+        if result.allowed and charged > 1:
+            return RateLimitResult(True, result.limit, result.remaining + charged - 1, result.reset_seconds)
+        return result
+
+    def policy_header(self) -> str:
+        """RateLimit-Policy value describing every configured limit"""
+        return ", ".join(f"{limit.limit};w={limit.window_seconds}" for limit in self.limits)
+
+
+def build_rate_limiter(redis, per_minute: int, per_hour: int, lease_size: int) -> Optional[RateLimiter]:
+    """Rate limiter for the configured per-minute and per-hour limits (None if both are 0)"""
+    limits = []
+    if per_minute > 0:
+        limits.append(RateLimit(per_minute, 60))
+    if per_hour > 0:
+        limits.append(RateLimit(per_hour, 3600))
+    if not limits:
+        return None
+    return RateLimiter(redis, limits, lease_size=lease_size)
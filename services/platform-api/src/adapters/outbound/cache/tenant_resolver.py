@@ -0,0 +1,208 @@
+"""
+Tenant Resolver
+Resolves tenants by id or slug through an in-process cache, Redis and the tenant repository
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from src.domain.entities.tenant import Tenant
+from src.domain.events.tenant_events import TenantEvent
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.serialization import dumps, loads
+
+REDIS_KEY_PREFIX = "platform:tenant:"
+INVALIDATION_CHANNEL = "platform:tenant:invalidate"
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark a load's failure retrieved, so one whose callers all left is not logged"""
+    if not task.cancelled():
+        task.exception()
+
+
+class TenantResolver:
+    """
+    Three-tier tenant lookup: in-process TTL/LRU -> Redis -> repository
+
+    - Hot path: a dict lookup, no network round-trip
+    - Concurrent misses for the same key share one load (single-flight),
+      which a cancelled caller does not cancel for the others
+    - Unknown tenants are cached briefly to absorb repeated bad lookups
+    - invalidate() drops a tenant here, in Redis, and (via Redis pub/sub)
+      in every other replica's in-process cache
+    - A load that an invalidation overtook is returned to its callers but not
+      cached, so it cannot put back the tenant the invalidation dropped
+    """
+
+    def __init__(
+        self,
+        repository: TenantRepository,
+        redis=None,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 10000,
+        redis_ttl_seconds: int = 300,
+        negative_ttl_seconds: float = 5.0
+    ):
+        self.repository = repository
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Tenant]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Invalidations seen per key while its load is in flight
+        self._generations: Dict[str, int] = {}
+        self._subscriber: Optional[asyncio.Task] = None
+
+    async def resolve(self, identifier: str) -> Optional[Tenant]:
+        """
+        Resolve a tenant by id (UUID string) or slug
+        """
+        entry = self._entries.get(identifier)
+        if entry is not None:
+            expires_at, tenant = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(identifier)
+                return tenant
+            del self._entries[identifier]
+
+        inflight = self._inflight.get(identifier)
+        if inflight is None:
+            # The load runs in its own task: a cancelled caller (e.g. a client
+            # that disconnected) stops waiting without cancelling the others
+            inflight = asyncio.create_task(self._load_shared(identifier))
+            inflight.add_done_callback(_retrieve_exception)
+            self._inflight[identifier] = inflight
+            self._generations[identifier] = 0
+        return await asyncio.shield(inflight)
+
+    async def _load_shared(self, identifier: str) -> Optional[Tenant]:
+        """Single-flight load for every caller of one key, caching the result"""
+        try:
+            tenant = await self._load(identifier)
+            if not self._invalidated(identifier):
+                self._store(identifier, tenant)
+            return tenant
+        finally:
+            del self._inflight[identifier]
+            del self._generations[identifier]
+
+    async def invalidate(self, tenant_id: UUID, slug: Optional[str] = None) -> None:
+        """
+        Drop a tenant from every cache tier and notify other replicas
+        """
+        keys = [str(tenant_id)] + ([slug] if slug else [])
+        self._evict(keys)
+
+        if self.redis is None:
+            return
+        try:
+            await self.redis.delete(*[REDIS_KEY_PREFIX + key for key in keys])
+            await self.redis.publish(INVALIDATION_CHANNEL, json.dumps(keys))
+        except Exception as e:
+            print(f"Tenant cache invalidation via Redis failed: {e}")
+
+    async def handle_events(self, events: Iterable[TenantEvent]) -> None:
+        """
+        Invalidate tenants changed by the given events (call after persisting them)
+        """
+        changed = {event.tenant_id: event.slug for event in events}
+        for tenant_id, slug in changed.items():
+            await self.invalidate(tenant_id, slug)
+
+    async def start(self) -> None:
+        """
+        Subscribe to invalidations published by other replicas
+        """
+        if self.redis is None or self._subscriber is not None:
+            return
+        self._subscriber = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """
+        Stop listening for invalidations
+        """
+        if self._subscriber is not None:
+            self._subscriber.cancel()
+            try:
+                await self._subscriber
+            except asyncio.CancelledError:
+                pass
+            self._subscriber = None
+
+    async def _load(self, identifier: str) -> Optional[Tenant]:
+        """Load from Redis, then from the repository (writing back to Redis)"""
+        redis_key = REDIS_KEY_PREFIX + identifier
+
+        if self.redis is not None:
+            try:
+                cached = await self.redis.get(redis_key)
+                if cached is not None:
+                    return Tenant.from_dict(loads(cached))
+            except Exception as e:
+                print(f"Tenant cache read from Redis failed: {e}")
+
+        try:
+            tenant_id = UUID(identifier)
+        except ValueError:
+            tenant = await self.repository.get_by_slug(identifier)
+        else:
+            tenant = await self.repository.get_by_id(tenant_id)
+
+        if tenant is not None and self.redis is not None and not self._invalidated(identifier):
+            try:
+                await self.redis.set(
+                    redis_key,
+                    dumps(tenant.to_record()),
+                    ex=self.redis_ttl_seconds
+                )
+                if self._invalidated(identifier):
+                    # The invalidation's delete may have run before this write landed
+                    await self.redis.delete(redis_key)
+            except Exception as e:
+                print(f"Tenant cache write to Redis failed: {e}")
+
+        return tenant
+
+    def _invalidated(self, identifier: str) -> bool:
+        """Whether the key was invalidated since its in-flight load started"""
+        return self._generations.get(identifier, 0) > 0
+
+    def _store(self, identifier: str, tenant: Optional[Tenant]) -> None:
+        ttl = self.ttl_seconds if tenant is not None else self.negative_ttl_seconds
+        self._entries[identifier] = (time.monotonic() + ttl, tenant)
+        self._entries.move_to_end(identifier)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+            if key in self._generations:
+                self._generations[key] += 1
+
+    async def _listen(self) -> None:
+        """Drop local entries named in invalidation messages; reconnect on errors"""
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._evict(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Tenant invalidation subscription failed, retrying: {e}")
+                # Entries may have missed invalidations while disconnected
+                self._entries.clear()
+                await asyncio.sleep(1.0)
+            finally:
+                await pubsub.aclose()
@@ -0,0 +1,349 @@
+"""
+Usage Meter
+Per-tenant usage counters in Redis, flushed in batches to Postgres rollups
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import DefaultDict, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from src.domain.entities.tenant import Tenant
+from src.domain.ports.repositories.usage_repository import UsageRepository
+
+KEY_PREFIX = "platform:usage:"
+PENDING_KEY = KEY_PREFIX + "pending"
+FLUSHING_KEY = KEY_PREFIX + "flushing"
+FLUSH_LOCK_KEY = KEY_PREFIX + "flush-lock"
+
+# Hash fields starting with "_" (_seeded, _batch) are bookkeeping, not metrics
+_BATCH_FIELD = "_batch"
+
+# KEYS[1]: pending deltas hash; KEYS[2..]: per-tenant totals hashes
+# ARGV[1]: totals TTL (s); then per totals key: seed, pending field prefix,
+#          metric count n, and n (metric, amount) pairs
+#
+# A totals hash that does not exist yet is created from its seed (the
+# tenant's Postgres rollups plus its unflushed deltas, JSON), so totals
+# survive Redis losing the key.
+# If any missing key has no seed, nothing is applied and the (1-based)
+# indexes of those keys are returned so the caller can load their seeds.
+RECORD_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+local seeds, prefixes, firsts, counts = {}, {}, {}, {}
+local missing = {}
+local i = 2
+for k = 2, #KEYS do
+  seeds[k], prefixes[k], counts[k] = ARGV[i], ARGV[i + 1], tonumber(ARGV[i + 2])
+  firsts[k] = i + 3
+  if seeds[k] == '' and redis.call('EXISTS', KEYS[k]) == 0 then
+    missing[#missing + 1] = k - 1
+  end
+  i = i + 3 + 2 * counts[k]
+end
+if #missing > 0 then
+  return missing
+end
+
+for k = 2, #KEYS do
+  if seeds[k] ~= '' and redis.call('EXISTS', KEYS[k]) == 0 then
+    redis.call('HSET', KEYS[k], '_seeded', 1)
+    for metric, value in pairs(cjson.decode(seeds[k])) do
+      redis.call('HINCRBY', KEYS[k], metric, value)
+    end
+  end
+  for j = firsts[k], firsts[k] + 2 * counts[k] - 1, 2 do
+    redis.call('HINCRBY', KEYS[k], ARGV[j], ARGV[j + 1])
+    redis.call('HINCRBY', KEYS[1], prefixes[k] .. ARGV[j], ARGV[j + 1])
+  end
+  redis.call('EXPIRE', KEYS[k], ttl)
+end
+return {}
+"""
+
+# Delete the lock only if this replica still holds it
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Totals outlive their month so the previous period can still be read from Redis
+_TOTALS_TTL_SECONDS = 40 * 24 * 3600
+
+
+def current_period() -> str:
+    """Usage period of the current moment: the calendar month as YYYY-MM (UTC)"""
+    return datetime.utcnow().strftime("%Y-%m")
+
+
+def _metrics(fields: Dict[str, str]) -> Dict[str, int]:
+    return {field: int(value) for field, value in fields.items() if not field.startswith("_")}
+
+
+class UsageMeter:
+    """
+    Usage metering for quota checks and reporting
+
+    - record() only adds to an in-process buffer (no I/O on the request path)
+    - Every ``sync_interval_seconds`` the buffer is applied to Redis in one
+      script call: running per-tenant totals for the period, plus a shared
+      hash of deltas not yet persisted
+    - Every ``flush_interval_seconds`` one replica (holding a Redis lock)
+      moves the pending deltas to Postgres as a single batch; the batch id
+      makes a retried flush idempotent
+    - usage()/current() read per-tenant totals cached in-process; stale
+      entries are served while one background refresh reloads them, so a
+      quota check is a dict lookup. On a miss (first request of a tenant on
+      this replica) current() fails open with zero usage while the totals
+      load in the background; usage() waits for them
+    - Totals missing from Redis are rebuilt from the Postgres rollups plus
+      the deltas still waiting in Redis to be flushed
+
+    Totals are advisory (they gate quotas); the Postgres rollups are the
+    record for reporting.
+    """
+
+    def __init__(
+        self,
+        redis,
+        repository: UsageRepository,
+        sync_interval_seconds: float = 1.0,
+        flush_interval_seconds: float = 30.0,
+        cache_ttl_seconds: float = 1.0,
+        max_entries: int = 10000,
+        flush_lock_seconds: float = 60.0
+    ):
+        self.redis = redis
+        self.repository = repository
+        self.sync_interval_seconds = sync_interval_seconds
+        self.flush_interval_seconds = flush_interval_seconds
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_entries = max_entries
+        self.flush_lock_seconds = flush_lock_seconds
+
+        self._record = redis.register_script(RECORD_SCRIPT)
+        self._release = redis.register_script(RELEASE_SCRIPT)
+        self._buffer: DefaultDict[UUID, DefaultDict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._totals: "OrderedDict[UUID, Tuple[float, Dict[str, int]]]" = OrderedDict()
+        self._refreshing: Dict[UUID, asyncio.Task] = {}
+        self._worker: Optional[asyncio.Task] = None
+
+    def record(self, tenant_id: UUID, metric: str, amount: int = 1) -> None:
+        """
+        Count usage for a tenant (non-blocking; applied to Redis on the next sync)
+        """
+        self._buffer[tenant_id][metric] += amount
+
+    async def current(self, tenant_id: UUID, metric: str) -> int:
+        """
+        Usage of one metric in the current period, including unsynced local usage
+
+        Never waits on Redis or Postgres: totals not cached yet count as zero
+        until the background load finishes.
+        """
+        totals = self._cached_totals(tenant_id) or {}
+        buffered = self._buffer.get(tenant_id)
+        return totals.get(metric, 0) + (buffered.get(metric, 0) if buffered else 0)
+
+    async def usage(self, tenant_id: UUID) -> Dict[str, int]:
+        """
+        Usage of every metric in the current period
+        """
+        totals = self._cached_totals(tenant_id)
+        if totals is None:
+            totals = await asyncio.shield(self._refresh_task(tenant_id))
+        usage = dict(totals)
+        for metric, amount in self._buffer.get(tenant_id, {}).items():
+            usage[metric] = usage.get(metric, 0) + amount
+        return usage
+
+    async def is_quota_exceeded(self, tenant: Tenant, quota_type: str) -> bool:
+        """
+        Check a tenant quota against current usage (metric names match quota types)
+        """
+        return tenant.is_quota_exceeded(quota_type, await self.current(tenant.id, quota_type))
+
+    async def sync(self) -> None:
+        """
+        Apply locally buffered usage to the Redis totals and pending deltas
+        """
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, defaultdict(lambda: defaultdict(int))
+        period = current_period()
+        tenant_ids = list(buffer)
+
+        try:
+            seeds: Dict[UUID, str] = {}
+            missing = await self._record(keys=self._record_keys(period, tenant_ids), args=self._record_args(
+                period, tenant_ids, buffer, seeds
+            ))
+            if missing:
+                missing_ids = [tenant_ids[index - 1] for index in missing]
+                seeded = await self._seed_totals(missing_ids, period)
+                seeds = {tenant_id: json.dumps(totals) for tenant_id, totals in seeded.items()}
+                if await self._record(keys=self._record_keys(period, tenant_ids), args=self._record_args(
+                    period, tenant_ids, buffer, seeds
+                )):
+                    raise RuntimeError("Usage totals expired while seeding")
+        except Exception:
+            # Keep the usage for the next attempt
+            for tenant_id, metrics in buffer.items():
+                for metric, amount in metrics.items():
+                    self._buffer[tenant_id][metric] += amount
+            raise
+
+        # Read-your-writes for this replica until the next refresh
+        for tenant_id, metrics in buffer.items():
+            entry = self._totals.get(tenant_id)
+            if entry is not None:
+                totals = dict(entry[1])
+                for metric, amount in metrics.items():
+                    totals[metric] = totals.get(metric, 0) + amount
+                self._totals[tenant_id] = (entry[0], totals)
+
+    async def flush(self) -> int:
+        """
+        Persist pending deltas to the Postgres rollups; returns the number of rollups updated
+        """
+        token = uuid4().hex
+        if not await self.redis.set(FLUSH_LOCK_KEY, token, nx=True, px=int(self.flush_lock_seconds * 1000)):
+            return 0  # Another replica is flushing
+        try:
+            # A batch left by a failed flush is retried before taking new deltas
+            if not await self.redis.exists(FLUSHING_KEY):
+                if not await self.redis.exists(PENDING_KEY):
+                    return 0
+                await self.redis.rename(PENDING_KEY, FLUSHING_KEY)
+            await self.redis.hsetnx(FLUSHING_KEY, _BATCH_FIELD, uuid4().hex)
+
+            fields = await self.redis.hgetall(FLUSHING_KEY)
+            batch_id = fields[_BATCH_FIELD]
+            deltas = {}
+            for field, amount in _metrics(fields).items():
+                period, tenant_id, metric = field.split("|", 2)
+                deltas[(period, UUID(tenant_id), metric)] = amount
+
+            await self.repository.apply_deltas(batch_id, deltas)
+            await self.redis.delete(FLUSHING_KEY)
+            return len(deltas)
+        finally:
+            await self._release(keys=[FLUSH_LOCK_KEY], args=[token])
+
+    async def start(self) -> None:
+        """
+        Start the background sync/flush worker
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the worker, then sync and flush whatever is left
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        for task in list(self._refreshing.values()):
+            task.cancel()
+
+        try:
+            await self.sync()
+            await self.flush()
+        except Exception as e:
+            print(f"Final usage flush failed: {e}")
+
+    async def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval_seconds
+        while True:
+            await asyncio.sleep(self.sync_interval_seconds)
+            try:
+                await self.sync()
+                if time.monotonic() >= next_flush:
+                    next_flush = time.monotonic() + self.flush_interval_seconds
+                    await self.flush()
+            except Exception as e:
+                print(f"Usage sync failed, retrying: {e}")
+
+    def _cached_totals(self, tenant_id: UUID) -> Optional[Dict[str, int]]:
+        """Cached totals (None on a miss); missing or stale entries are reloaded by one background task"""
+        entry = self._totals.get(tenant_id)
+        if entry is None or entry[0] <= time.monotonic():
+            self._refresh_task(tenant_id)
+        return entry[1] if entry is not None else None
+
+    def _refresh_task(self, tenant_id: UUID) -> asyncio.Task:
+        task = self._refreshing.get(tenant_id)
+        if task is None:
+            task = asyncio.create_task(self._refresh(tenant_id))
+            self._refreshing[tenant_id] = task
+            task.add_done_callback(lambda done: self._refreshed(tenant_id, done))
+        return task
+
+    def _refreshed(self, tenant_id: UUID, task: asyncio.Task) -> None:
+        self._refreshing.pop(tenant_id, None)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Usage totals refresh failed: {task.exception()}")
+
+    async def _refresh(self, tenant_id: UUID) -> Dict[str, int]:
+        """Load totals from Redis, falling back to the rollups plus unflushed deltas"""
+        period = current_period()
+        try:
+            fields = await self.redis.hgetall(self._totals_key(period, tenant_id))
+        except Exception as e:
+            print(f"Usage totals read from Redis failed: {e}")
+            fields = {}
+        if fields:
+            totals = _metrics(fields)
+        else:
+            totals = (await self._seed_totals([tenant_id], period))[tenant_id]
+
+        self._totals[tenant_id] = (time.monotonic() + self.cache_ttl_seconds, totals)
+        self._totals.move_to_end(tenant_id)
+        while len(self._totals) > self.max_entries:
+            self._totals.popitem(last=False)
+        return totals
+
+    async def _seed_totals(self, tenant_ids: List[UUID], period: str) -> Dict[UUID, Dict[str, int]]:
+        """
+        Totals rebuilt from the Postgres rollups plus the deltas not flushed
+        to them yet (pending, or taken by a flush still in progress)
+        """
+        rollups = await self.repository.get_usage_many(tenant_ids, period)
+        totals = {tenant_id: dict(rollups.get(tenant_id, {})) for tenant_id in tenant_ids}
+        try:
+            for key in (PENDING_KEY, FLUSHING_KEY):
+                for field, amount in _metrics(await self.redis.hgetall(key)).items():
+                    field_period, tenant_id, metric = field.split("|", 2)
+                    tenant_totals = totals.get(UUID(tenant_id)) if field_period == period else None
+                    if tenant_totals is not None:
+                        tenant_totals[metric] = tenant_totals.get(metric, 0) + amount
+        except Exception as e:
+            print(f"Unflushed usage read from Redis failed: {e}")
+        return totals
+
+    @staticmethod
+    def _totals_key(period: str, tenant_id: UUID) -> str:
+        return f"{KEY_PREFIX}{period}:{tenant_id}"
+
+    def _record_keys(self, period: str, tenant_ids) -> list:
+        return [PENDING_KEY] + [self._totals_key(period, tenant_id) for tenant_id in tenant_ids]
+
+    @staticmethod
+    def _record_args(period: str, tenant_ids, buffer, seeds: Dict[UUID, str]) -> list:
+        args = [_TOTALS_TTL_SECONDS]
+        for tenant_id in tenant_ids:
+            metrics = buffer[tenant_id]
+            args += [seeds.get(tenant_id, ""), f"{period}|{tenant_id}|", len(metrics)]
+            for metric, amount in metrics.items():
+                args += [metric, amount]
+        return args
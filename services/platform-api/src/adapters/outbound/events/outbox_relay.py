@@ -0,0 +1,155 @@
+"""
+Outbox Relay
+Publishes domain events from the outbox table to NATS JetStream
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, List, Optional, Sequence
+from uuid import UUID
+
+from src.adapters.outbound.persistence.outbox import ClaimedEvent, OutboxStore
+from src.infrastructure.serialization import dumps
+
+
+class OutboxRelay:
+    """
+    At-least-once delivery of outbox events, in order per tenant
+
+    - A batch is claimed (one short transaction), published, then deleted
+      (another short one); nothing is held open while publishing
+    - Events of one tenant go out in commit order: every change updates the
+      tenant row before writing its events, so transactions on one tenant
+      serialize on that row and their outbox ids increase in commit order.
+      A tenant's events are published one after another, and only by the
+      relay holding their claim. Events of different tenants may interleave
+    - A failed publish stops that tenant's events for the batch and releases
+      them for the next one; a relay that dies mid-batch leaves claims that
+      expire after ``claim_seconds``. Republished events are dropped by
+      JetStream inside its duplicate window (Nats-Msg-Id is the eventId) and
+      consumers dedupe on eventId beyond it
+    - notify() wakes the relay right after a commit; otherwise it polls
+    """
+
+    def __init__(
+        self,
+        store: OutboxStore,
+        get_nats: Callable[[], Optional[Any]],
+        stream: str = "TENANT_EVENTS",
+        subjects: Sequence[str] = ("tenant.>",),
+        batch_size: int = 100,
+        poll_interval_seconds: float = 1.0,
+        publish_timeout_seconds: float = 5.0,
+        claim_seconds: float = 60.0
+    ):
+        self.store = store
+        self.get_nats = get_nats
+        self.stream = stream
+        self.subjects = list(subjects)
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.publish_timeout_seconds = publish_timeout_seconds
+        self.claim_seconds = claim_seconds
+
+        self._jetstream = None
+        self._wake = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        """
+        Relay without waiting for the next poll (call after committing events)
+        """
+        self._wake.set()
+
+    async def relay_once(self) -> int:
+        """
+        Claim, publish and delete one batch; returns the number of events published
+        """
+        nats = self.get_nats()
+        if nats is None or not nats.is_connected:
+            return 0
+        jetstream = await self._ensure_stream(nats)
+
+        events = await self.store.claim(self.batch_size, self.claim_seconds)
+        if not events:
+            return 0
+
+        by_tenant: DefaultDict[UUID, List[ClaimedEvent]] = defaultdict(list)
+        for event in events:
+            by_tenant[event.tenant_id].append(event)
+        published = [
+            event_id
+            for ids in await asyncio.gather(*(
+                self._publish_in_order(jetstream, tenant_events) for tenant_events in by_tenant.values()
+            ))
+            for event_id in ids
+        ]
+
+        await self.store.mark_sent(published)
+        sent = set(published)
+        await self.store.release([event.id for event in events if event.id not in sent])
+        return len(published)
+
+    async def start(self) -> None:
+        """
+        Start relaying in the background
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop relaying (unpublished events stay in the outbox)
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _publish_in_order(self, jetstream, events: List[ClaimedEvent]) -> List[int]:
+        """Publish one tenant's events in order, stopping at the first failure; returns the ids sent"""
+        published = []
+        for event in events:
+            try:
+                await jetstream.publish(
+                    event.subject,
+                    dumps(event.envelope),
+                    timeout=self.publish_timeout_seconds,
+                    headers={"Nats-Msg-Id": str(event.event_id)}
+                )
+            except Exception as e:
+                print(f"Publishing outbox event {event.event_id} failed, retrying later: {e}")
+                break
+            published.append(event.id)
+        return published
+
+    async def _ensure_stream(self, nats):
+        if self._jetstream is None:
+            jetstream = nats.jetstream()
+            try:
+                await jetstream.add_stream(name=self.stream, subjects=self.subjects)
+            except Exception as e:
+                # Usually an existing stream with a different configuration
+                print(f"Could not create NATS stream {self.stream}: {e}")
+            self._jetstream = jetstream
+        return self._jetstream
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                published = await self.relay_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Outbox relay failed, retrying: {e}")
+                published = 0
+
+            if published < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
@@ -0,0 +1,41 @@
+"""
+Keyset Pagination Helpers
+"""
+
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import Select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def keyset_page(
+    statement: Select,
+    model,
+    limit: int,
+    after: Optional[Tuple[datetime, UUID]] = None
+) -> Select:
+    """
+    Restrict a query to one page in (created_at, id) order
+
+    Uses a row-value comparison so Postgres seeks the (created_at, id) index
+    straight to the cursor instead of scanning and discarding an OFFSET.
+    """
+    if after is not None:
+        statement = statement.where(tuple_(model.created_at, model.id) > tuple_(*after))
+    return statement.order_by(model.created_at, model.id).limit(limit)
+
+
+async def estimate_rows(session: AsyncSession, statement: Select) -> int:
+    """
+    Row estimate for a query from the planner (EXPLAIN, no execution)
+    """
+    sql = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,123 @@
+"""
+SQLAlchemy Persistence Models
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Identity, Index, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    """Declarative base for platform-api tables"""
+
+
+class TenantModel(Base):
+    """Row in the tenants table (mapped to/from the Tenant entity by the repository)"""
+    __tablename__ = "tenants"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(255))
+    slug: Mapped[str] = mapped_column(String(255), unique=True)
+    status: Mapped[str] = mapped_column(String(32))
+    tier: Mapped[str] = mapped_column(String(32))
+
+    organization_name: Mapped[str] = mapped_column(String(255), default="")
+    organization_domain: Mapped[Optional[str]] = mapped_column(String(255))
+    organization_size: Mapped[Optional[str]] = mapped_column(String(64))
+
+    primary_contact_email: Mapped[str] = mapped_column(String(320), default="")
+    primary_contact_name: Mapped[Optional[str]] = mapped_column(String(255))
+    billing_email: Mapped[Optional[str]] = mapped_column(String(320))
+
+    settings: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    features: Mapped[List[str]] = mapped_column(JSONB, default=list)
+
+    max_users: Mapped[int] = mapped_column(Integer)
+    max_requests_per_month: Mapped[int] = mapped_column(Integer)
+    max_storage_gb: Mapped[int] = mapped_column(Integer)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+    activated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    suspended_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # Keyset pagination order
+        Index("ix_tenants_created_at_id", "created_at", "id"),
+    )
+
+
+class UserModel(Base):
+    """Row in the users table (mapped to/from the User entity by the repository)"""
+    __tablename__ = "users"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True)
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey("tenants.id"))
+    email: Mapped[str] = mapped_column(String(320))
+    name: Mapped[Optional[str]] = mapped_column(String(255))
+    role: Mapped[str] = mapped_column(String(32))
+    status: Mapped[str] = mapped_column(String(32))
+
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "email", name="uq_users_tenant_email"),
+        # Keyset pagination order within a tenant
+        Index("ix_users_tenant_created_at_id", "tenant_id", "created_at", "id"),
+    )
+
+
+class UsageRollupModel(Base):
+    """Pre-aggregated usage of one tenant, period (YYYY-MM) and metric"""
+    __tablename__ = "usage_rollups"
+
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey("tenants.id"), primary_key=True)
+    period: Mapped[str] = mapped_column(String(7), primary_key=True)
+    metric: Mapped[str] = mapped_column(String(32), primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class UsageFlushBatchModel(Base):
+    """Usage delta batch already applied to usage_rollups (makes flushes idempotent)"""
+    __tablename__ = "usage_flush_batches"
+
+    batch_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+class TenantTierHistoryModel(Base):
+    """Append-only record of a tenant's tier changes (rows are never updated or deleted)"""
+    __tablename__ = "tenant_tier_history"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_id: Mapped[UUID] = mapped_column(unique=True)
+    tenant_id: Mapped[UUID] = mapped_column(ForeignKey("tenants.id"))
+    slug: Mapped[str] = mapped_column(String(255))
+    old_tier: Mapped[str] = mapped_column(String(32))
+    new_tier: Mapped[str] = mapped_column(String(32))
+    changed_at: Mapped[datetime] = mapped_column(DateTime)
+
+    __table_args__ = (
+        Index("ix_tenant_tier_history_tenant_id_id", "tenant_id", "id"),
+    )
+
+
+class OutboxEventModel(Base):
+    """Domain event committed with its aggregate and not yet published to NATS"""
+    __tablename__ = "outbox_events"
+
+    # Insert order; follows commit order among events of one tenant
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    event_id: Mapped[UUID] = mapped_column(unique=True)
+    tenant_id: Mapped[UUID]
+    subject: Mapped[str] = mapped_column(String(128))
+    envelope: Mapped[Dict[str, Any]] = mapped_column(JSONB)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    # Set while a relay publishes the event; an expired claim is taken over
+    claimed_until: Mapped[Optional[datetime]] = mapped_column(DateTime)
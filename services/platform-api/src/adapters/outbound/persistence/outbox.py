@@ -0,0 +1,125 @@
+"""
+Transactional Outbox
+Domain events stored in the same transaction as the aggregate that raised them
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.persistence.models import OutboxEventModel
+from src.domain.events.tenant_events import TenantEvent
+from src.infrastructure.database.engine import Database
+
+# pg_advisory_xact_lock key serializing claims (held only while claiming)
+_CLAIM_LOCK_ID = 0x6F7574626F78  # "outbox"
+
+
+def event_envelope(event: TenantEvent) -> Dict[str, Any]:
+    """Event in the platform envelope (see docs SERVICE_CONTRACTS, "Event Conventions")"""
+    return {
+        "eventId": str(event.event_id),
+        "occurredAt": event.occurred_at.isoformat(),
+        "tenantId": str(event.tenant_id),
+        "platformId": None,
+        "correlationId": None,
+        "actor": None,
+        "payload": event.payload()
+    }
+
+
+def outbox_rows(events: Iterable[TenantEvent]) -> List[Dict[str, Any]]:
+    """Outbox rows for events; the NATS subject is tenant.<action>"""
+    now = datetime.utcnow()
+    return [
+        {
+            "event_id": event.event_id,
+            "tenant_id": event.tenant_id,
+            "subject": f"tenant.{event.action}",
+            "envelope": event_envelope(event),
+            "created_at": now
+        }
+        for event in events
+    ]
+
+
+async def add_to_outbox(session: AsyncSession, events: List[TenantEvent]) -> None:
+    """Queue events for publishing as part of the session's transaction"""
+    if events:
+        await session.execute(insert(OutboxEventModel), outbox_rows(events))
+
+
+class ClaimedEvent(NamedTuple):
+    """Outbox row claimed by a relay for publishing"""
+    id: int
+    event_id: UUID
+    tenant_id: UUID
+    subject: str
+    envelope: Dict[str, Any]
+
+
+class OutboxStore:
+    """
+    Claims outbox rows for publishing and removes them once sent
+
+    Each call is its own short transaction, so no transaction or lock is
+    held while events are being published.
+    """
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def claim(self, limit: int, claim_seconds: float) -> List[ClaimedEvent]:
+        """
+        Claim up to ``limit`` of the oldest unclaimed events, in id order
+
+        Tenants with events claimed by another relay are skipped, so only one
+        relay at a time publishes a given tenant's events. Claims are made
+        under an advisory lock, so two relays cannot split one tenant's
+        events between them.
+        """
+        now = func.now()
+        claimed_tenants = select(OutboxEventModel.tenant_id).where(OutboxEventModel.claimed_until > now)
+        candidates = (
+            select(OutboxEventModel.id)
+            .where(or_(OutboxEventModel.claimed_until.is_(None), OutboxEventModel.claimed_until <= now))
+            .where(OutboxEventModel.tenant_id.not_in(claimed_tenants))
+            .order_by(OutboxEventModel.id)
+            .limit(limit)
+        )
+        statement = (
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id.in_(candidates.scalar_subquery()))
+            .values(claimed_until=now + timedelta(seconds=claim_seconds))
+            .returning(
+                OutboxEventModel.id,
+                OutboxEventModel.event_id,
+                OutboxEventModel.tenant_id,
+                OutboxEventModel.subject,
+                OutboxEventModel.envelope
+            )
+        )
+        async with self.database.session() as session:
+            await session.execute(select(func.pg_advisory_xact_lock(_CLAIM_LOCK_ID)))
+            rows = (await session.execute(statement)).all()
+            await session.commit()
+        return sorted((ClaimedEvent(*row) for row in rows), key=lambda event: event.id)
+
+    async def mark_sent(self, ids: Sequence[int]) -> None:
+        """Remove published events"""
+        if ids:
+            async with self.database.session() as session:
+                await session.execute(delete(OutboxEventModel).where(OutboxEventModel.id.in_(ids)))
+                await session.commit()
+
+    async def release(self, ids: Sequence[int]) -> None:
+        """Drop the claim on events that were not published, so they are retried"""
+        if ids:
+            async with self.database.session() as session:
+                await session.execute(
+                    update(OutboxEventModel).where(OutboxEventModel.id.in_(ids)).values(claimed_until=None)
+                )
+                await session.commit()
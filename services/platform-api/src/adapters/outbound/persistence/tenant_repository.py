@@ -0,0 +1,176 @@
+"""
+SQLAlchemy Tenant Repository
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.adapters.outbound.persistence.keyset import estimate_rows, keyset_page
+from src.adapters.outbound.persistence.models import TenantModel, TenantTierHistoryModel
+from src.adapters.outbound.persistence.outbox import add_to_outbox
+from src.adapters.outbound.persistence.tier_history import add_to_tier_history
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+from src.domain.events.tenant_events import TenantTierChanged
+from src.domain.ports.repositories.tenant_repository import TenantRepository
+from src.infrastructure.database.engine import Database
+
+# Entity attributes stored one-to-one in TenantModel columns
+_COLUMNS = tuple(column.key for column in TenantModel.__table__.columns)
+
+
+def _to_row(tenant: Tenant) -> Dict[str, Any]:
+    row = {column: getattr(tenant, column) for column in _COLUMNS}
+    row["status"] = tenant.status.value
+    row["tier"] = tenant.tier.value
+    return row
+
+
+def _to_entity(model: TenantModel) -> Tenant:
+    values = {column: getattr(model, column) for column in _COLUMNS}
+    values["status"] = TenantStatus(model.status)
+    values["tier"] = TenantTier(model.tier)
+    return Tenant(**values)
+
+
+class SqlAlchemyTenantRepository(TenantRepository):
+    """
+    Tenant repository on the async SQLAlchemy engine
+
+    Each call borrows one pooled connection for a single statement (or
+    statement plus commit) and returns it immediately. add() and update() also
+    write the tenant's pending domain events to the outbox (and tier changes
+    to the tier history) in the same transaction; the caller still pulls
+    them afterwards.
+    """
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        """Load a tenant by id"""
+        async with self.database.session() as session:
+            model = await session.get(TenantModel, tenant_id)
+            return _to_entity(model) if model is not None else None
+
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        """Load a tenant by slug (subdomain)"""
+        async with self.database.session() as session:
+            result = await session.execute(select(TenantModel).where(TenantModel.slug == slug))
+            model = result.scalar_one_or_none()
+            return _to_entity(model) if model is not None else None
+
+    async def add(self, tenant: Tenant) -> None:
+        """Persist a new tenant"""
+        async with self.database.session() as session:
+            session.add(TenantModel(**_to_row(tenant)))
+            await add_to_outbox(session, tenant.events)
+            await add_to_tier_history(session, tenant.events)
+            await session.commit()
+
+    async def add_many(self, tenants: List[Tenant]) -> Set[UUID]:
+        """
+        Insert new tenants with one multi-row INSERT, skipping slugs that are
+        already taken; returns the ids of the tenants inserted
+        """
+        statement = (
+            insert(TenantModel)
+            .values([_to_row(tenant) for tenant in tenants])
+            .on_conflict_do_nothing(index_elements=[TenantModel.slug])
+            .returning(TenantModel.id)
+        )
+        async with self.database.session() as session:
+            inserted = set((await session.execute(statement)).scalars())
+            await add_to_outbox(session, [
+                event for tenant in tenants if tenant.id in inserted for event in tenant.events
+            ])
+            await session.commit()
+            return inserted
+
+    async def update(self, tenant_id: UUID, change: Callable[[Tenant], None]) -> Optional[Tenant]:
+        """
+        Apply a change to a tenant and persist it with its events
+
+        The row is read with SELECT ... FOR UPDATE and written back in the
+        same transaction, so concurrent changes to one tenant take turns
+        instead of overwriting each other. Exceptions from ``change`` roll
+        the transaction back. Returns None if the tenant does not exist.
+        """
+        async with self.database.session() as session:
+            model = await session.scalar(
+                select(TenantModel).where(TenantModel.id == tenant_id).with_for_update()
+            )
+            if model is None:
+                return None
+            tenant = _to_entity(model)
+            change(tenant)
+
+            row = _to_row(tenant)
+            del row["id"]
+            await session.execute(
+                update(TenantModel)
+                .where(TenantModel.id == tenant_id)
+                .values(**row)
+                .execution_options(synchronize_session=False)
+            )
+            await add_to_outbox(session, tenant.events)
+            await add_to_tier_history(session, tenant.events)
+            await session.commit()
+            return tenant
+
+    async def get_tier_history(self, tenant_id: UUID, limit: int = 100) -> List[TenantTierChanged]:
+        """Most recent tier changes of a tenant, newest first"""
+        statement = (
+            select(TenantTierHistoryModel)
+            .where(TenantTierHistoryModel.tenant_id == tenant_id)
+            .order_by(TenantTierHistoryModel.id.desc())
+            .limit(limit)
+        )
+        async with self.database.session() as session:
+            result = await session.execute(statement)
+            return [
+                TenantTierChanged(
+                    tenant_id=row.tenant_id,
+                    slug=row.slug,
+                    occurred_at=row.changed_at,
+                    event_id=row.event_id,
+                    old_tier=row.old_tier,
+                    new_tier=row.new_tier
+                )
+                for row in result.scalars()
+            ]
+
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Tenant]:
+        """Tenants ordered by (created_at, id), starting after a keyset cursor"""
+        statement = keyset_page(select(TenantModel), TenantModel, limit, after)
+        async with self.database.session() as session:
+            result = await session.execute(statement)
+            return [_to_entity(model) for model in result.scalars()]
+
+    async def estimate_count(self) -> int:
+        """Planner estimate of the number of tenants (no COUNT scan)"""
+        async with self.database.session() as session:
+            return await estimate_rows(session, select(TenantModel.id))
+
+    async def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Tenant]:
+        """
+        Every tenant in (created_at, id) order
+
+        Each batch is a separate keyset query on a briefly borrowed connection,
+        so memory stays at one batch and no connection is held between batches.
+        """
+        after = None
+        while True:
+            page = await self.list_page(batch_size, after)
+            for tenant in page:
+                yield tenant
+            if len(page) < batch_size:
+                return
+            after = (page[-1].created_at, page[-1].id)
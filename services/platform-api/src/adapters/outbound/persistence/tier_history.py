@@ -0,0 +1,35 @@
+"""
+Tenant Tier History
+Tier changes appended in the same transaction as the tenant that made them
+"""
+
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.outbound.persistence.models import TenantTierHistoryModel
+from src.domain.events.tenant_events import TenantEvent, TenantTierChanged
+
+
+def tier_history_rows(events: Iterable[TenantEvent]) -> List[Dict[str, Any]]:
+    """History rows for the TenantTierChanged events among events"""
+    return [
+        {
+            "event_id": event.event_id,
+            "tenant_id": event.tenant_id,
+            "slug": event.slug,
+            "old_tier": event.old_tier,
+            "new_tier": event.new_tier,
+            "changed_at": event.occurred_at
+        }
+        for event in events
+        if isinstance(event, TenantTierChanged)
+    ]
+
+
+async def add_to_tier_history(session: AsyncSession, events: List[TenantEvent]) -> None:
+    """Append tier changes as part of the session's transaction"""
+    rows = tier_history_rows(events)
+    if rows:
+        await session.execute(insert(TenantTierHistoryModel), rows)
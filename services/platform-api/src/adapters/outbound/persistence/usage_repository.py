@@ -0,0 +1,84 @@
+"""
+SQLAlchemy Usage Repository
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.adapters.outbound.persistence.models import UsageFlushBatchModel, UsageRollupModel
+from src.domain.ports.repositories.usage_repository import UsageDeltas, UsageRepository
+from src.infrastructure.database.engine import Database
+
+# Rows per multi-row upsert (5 bind parameters each, well under asyncpg's 32767 limit)
+_UPSERT_CHUNK_SIZE = 2000
+
+
+class SqlAlchemyUsageRepository(UsageRepository):
+    """
+    Usage rollups on the async SQLAlchemy engine
+
+    Reads are primary-key lookups on usage_rollups, never aggregates over raw
+    events. A delta batch is applied in one transaction as multi-row
+    INSERT ... ON CONFLICT DO UPDATE statements, together with a row in
+    usage_flush_batches that makes re-applying the same batch a no-op.
+    """
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def get_usage(self, tenant_id: UUID, period: str) -> Dict[str, int]:
+        """Rolled-up usage of one tenant in one period, by metric"""
+        usage = await self.get_usage_many([tenant_id], period)
+        return usage.get(tenant_id, {})
+
+    async def get_usage_many(self, tenant_ids: Iterable[UUID], period: str) -> Dict[UUID, Dict[str, int]]:
+        """Rolled-up usage of several tenants in one period"""
+        statement = select(UsageRollupModel.tenant_id, UsageRollupModel.metric, UsageRollupModel.value).where(
+            UsageRollupModel.tenant_id.in_(list(tenant_ids)),
+            UsageRollupModel.period == period
+        )
+        usage: Dict[UUID, Dict[str, int]] = defaultdict(dict)
+        async with self.database.session() as session:
+            for tenant_id, metric, value in await session.execute(statement):
+                usage[tenant_id][metric] = value
+        return dict(usage)
+
+    async def apply_deltas(self, batch_id: str, deltas: UsageDeltas) -> bool:
+        """
+        Add a batch of usage deltas to the rollups
+
+        Returns False (and changes nothing) if the batch was already applied.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {"tenant_id": tenant_id, "period": period, "metric": metric, "value": amount, "updated_at": now}
+            for (period, tenant_id, metric), amount in deltas.items()
+            if amount
+        ]
+
+        async with self.database.session() as session:
+            claimed = await session.execute(
+                insert(UsageFlushBatchModel)
+                .values(batch_id=batch_id, applied_at=now)
+                .on_conflict_do_nothing()
+                .returning(UsageFlushBatchModel.batch_id)
+            )
+            if claimed.scalar_one_or_none() is None:
+                return False
+
+            for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+                statement = insert(UsageRollupModel).values(rows[start:start + _UPSERT_CHUNK_SIZE])
+                await session.execute(statement.on_conflict_do_update(
+                    index_elements=["tenant_id", "period", "metric"],
+                    set_={
+                        "value": UsageRollupModel.value + statement.excluded.value,
+                        "updated_at": statement.excluded.updated_at
+                    }
+                ))
+            await session.commit()
+        return True
@@ -0,0 +1,136 @@
+"""
+SQLAlchemy User Repository
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.adapters.outbound.persistence.keyset import estimate_rows, keyset_page
+from src.adapters.outbound.persistence.models import UserModel
+from src.domain.entities.tenant import UNLIMITED
+from src.domain.entities.user import User, UserRole, UserStatus
+from src.domain.ports.repositories.user_repository import UserRepository
+from src.infrastructure.database.engine import Database
+
+# Entity attributes stored one-to-one in UserModel columns
+_COLUMNS = tuple(column.key for column in UserModel.__table__.columns)
+
+
+def _to_row(user: User) -> Dict[str, Any]:
+    row = {column: getattr(user, column) for column in _COLUMNS}
+    row["role"] = user.role.value
+    row["status"] = user.status.value
+    return row
+
+
+def _to_entity(model: UserModel) -> User:
+    values = {column: getattr(model, column) for column in _COLUMNS}
+    values["role"] = UserRole(model.role)
+    values["status"] = UserStatus(model.status)
+    return User(**values)
+
+
+class SqlAlchemyUserRepository(UserRepository):
+    """
+    User repository on the async SQLAlchemy engine
+    """
+
+    def __init__(self, database: Database):
+        self.database = database
+
+    async def add_many(self, users: List[User], max_users: int = UNLIMITED) -> Tuple[Set[UUID], Set[UUID]]:
+        """
+        Insert users of one tenant with one multi-row INSERT, skipping emails
+        that already exist and stopping at ``max_users`` users in the tenant;
+        returns the ids inserted and the ids refused for exceeding the quota
+
+        Inserts for one tenant take turns on a transaction-level advisory
+        lock, so the user count checked against the quota cannot change until
+        this insert commits: concurrent bulk requests share the quota instead
+        of each filling it.
+        """
+        tenant_id = users[0].tenant_id
+        async with self.database.session() as session:
+            await session.execute(
+                select(func.pg_advisory_xact_lock(func.hashtext(f"users:{tenant_id}")))
+            )
+            seen = set((await session.execute(
+                select(UserModel.email).where(
+                    UserModel.tenant_id == tenant_id,
+                    UserModel.email.in_([user.email for user in users])
+                )
+            )).scalars())
+            new_users = []
+            for user in users:
+                if user.email not in seen:
+                    seen.add(user.email)
+                    new_users.append(user)
+
+            over_quota: Set[UUID] = set()
+            if max_users != UNLIMITED:
+                room = max(max_users - await self._count(session, tenant_id), 0)
+                over_quota = {user.id for user in new_users[room:]}
+                new_users = new_users[:room]
+
+            inserted: Set[UUID] = set()
+            if new_users:
+                statement = (
+                    insert(UserModel)
+                    .values([_to_row(user) for user in new_users])
+                    .on_conflict_do_nothing(constraint="uq_users_tenant_email")
+                    .returning(UserModel.id)
+                )
+                inserted = set((await session.execute(statement)).scalars())
+            await session.commit()
+            return inserted, over_quota
+
+    async def count(self, tenant_id: UUID) -> int:
+        """Exact number of users of a tenant (index-only scan)"""
+        async with self.database.session() as session:
+            return await self._count(session, tenant_id)
+
+    @staticmethod
+    async def _count(session, tenant_id: UUID) -> int:
+        return await session.scalar(
+            select(func.count()).select_from(UserModel).where(UserModel.tenant_id == tenant_id)
+        )
+
+    async def list_page(
+        self,
+        tenant_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[User]:
+        """Users of a tenant ordered by (created_at, id), starting after a keyset cursor"""
+        statement = keyset_page(
+            select(UserModel).where(UserModel.tenant_id == tenant_id),
+            UserModel,
+            limit,
+            after
+        )
+        async with self.database.session() as session:
+            result = await session.execute(statement)
+            return [_to_entity(model) for model in result.scalars()]
+
+    async def estimate_count(self, tenant_id: UUID) -> int:
+        """Planner estimate of the number of users of a tenant (no COUNT scan)"""
+        async with self.database.session() as session:
+            return await estimate_rows(
+                session,
+                select(UserModel.id).where(UserModel.tenant_id == tenant_id)
+            )
+
+    async def iter_all(self, tenant_id: UUID, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Every user of a tenant in (created_at, id) order, one keyset query per batch"""
+        after = None
+        while True:
+            page = await self.list_page(tenant_id, batch_size, after)
+            for user in page:
+                yield user
+            if len(page) < batch_size:
+                return
+            after = (page[-1].created_at, page[-1].id)
@@ -2,12 +2,27 @@
 Tenant Entity - Core Domain Model
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping
 from uuid import UUID, uuid4
 from enum import Enum
 
+from src.domain.events.tenant_events import (
+    TenantEvent,
+    TenantFeatureAdded,
+    TenantFeatureRemoved,
+    TenantStatusChanged,
+    TenantTierChanged,
+    TenantUpdated,
+)
+
+_SLUG_INVALID_CHARS = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATORS = re.compile(r'[-\s]+')
+
 
 class TenantStatus(Enum):
     """Tenant status enumeration"""
@@ -24,12 +39,55 @@ class TenantTier(Enum):
     ENTERPRISE = "enterprise"
 
 
-@dataclass
+# Quota value meaning "no limit"
+UNLIMITED = -1
+
+
+# Quota type (as metered) -> TierPolicy field holding its limit
+QUOTA_TYPES: Mapping[str, str] = MappingProxyType({
+    "users": "max_users",
+    "requests": "max_requests_per_month",
+    "storage": "max_storage_gb",
+})
+
+
+@dataclass(frozen=True, slots=True)
+class TierPolicy:
+    """Quotas granted by a subscription tier"""
+    max_users: int
+    max_requests_per_month: int
+    max_storage_gb: int
+
+    def limit(self, quota_type: str) -> int:
+        """Limit of a quota type (0, nothing allowed, for unknown types)"""
+        attribute = QUOTA_TYPES.get(quota_type)
+        return getattr(self, attribute) if attribute is not None else 0
+
+
+# Built once at import and shared read-only by every tenant
+TIER_POLICIES: Mapping[TenantTier, TierPolicy] = MappingProxyType({
+    TenantTier.FREE: TierPolicy(max_users=10, max_requests_per_month=10000, max_storage_gb=10),
+    TenantTier.PRO: TierPolicy(max_users=50, max_requests_per_month=100000, max_storage_gb=100),
+    TenantTier.ENTERPRISE: TierPolicy(max_users=UNLIMITED, max_requests_per_month=UNLIMITED, max_storage_gb=1000),
+})
+
+# Fields changed through update_details()
+_DETAIL_FIELDS = frozenset({
+    "name",
+    "organization_name",
+    "organization_domain",
+    "primary_contact_name",
+    "billing_email",
+})
+
+
+@dataclass(slots=True)
 class Tenant:
     """
     Tenant entity representing an organization using the platform
 
-    This is a pure domain model with no framework dependencies
+    This is a pure domain model with no framework dependencies. Instances are
+    slotted (no per-instance __dict__) since every request reads a cached one.
     """
     id: UUID = field(default_factory=uuid4)
     name: str = ""
@@ -51,10 +109,10 @@ class Tenant:
     settings: Dict[str, Any] = field(default_factory=dict)
     features: List[str] = field(default_factory=list)
 
-    # Quotas
-    max_users: int = 10
-    max_requests_per_month: int = 10000
-    max_storage_gb: int = 10
+    # Quotas (set from TIER_POLICIES when the tier changes)
+    max_users: int = TIER_POLICIES[TenantTier.FREE].max_users
+    max_requests_per_month: int = TIER_POLICIES[TenantTier.FREE].max_requests_per_month
+    max_storage_gb: int = TIER_POLICIES[TenantTier.FREE].max_storage_gb
 
     # Metadata
     created_at: datetime = field(default_factory=datetime.utcnow)
@@ -62,6 +120,9 @@ class Tenant:
     activated_at: Optional[datetime] = None
     suspended_at: Optional[datetime] = None
 
+    # Domain events raised since the last pull_events()
+    events: List[TenantEvent] = field(default_factory=list, repr=False, compare=False)
+
     def __post_init__(self):
         """Post-initialization validation and setup"""
         if not self.slug and self.name:
@@ -72,10 +133,8 @@ class Tenant:
 
     def _generate_slug(self, name: str) -> str:
         """Generate URL-safe slug from name"""
-        import re
-        slug = name.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = _SLUG_INVALID_CHARS.sub('', name.lower())
+        slug = _SLUG_SEPARATORS.sub('-', slug)
         return slug.strip('-')
 
     def activate(self) -> None:
@@ -83,18 +142,16 @@ class Tenant:
         if self.status != TenantStatus.PENDING:
             raise ValueError(f"Cannot activate tenant in {self.status} status")
 
-        self.status = TenantStatus.ACTIVE
+        self._change_status(TenantStatus.ACTIVE)
         self.activated_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
 
     def suspend(self, reason: Optional[str] = None) -> None:
         """Suspend the tenant"""
         if self.status != TenantStatus.ACTIVE:
             raise ValueError(f"Cannot suspend tenant in {self.status} status")
 
-        self.status = TenantStatus.SUSPENDED
+        self._change_status(TenantStatus.SUSPENDED)
         self.suspended_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
 
         if reason:
             self.settings["suspension_reason"] = reason
@@ -104,9 +161,8 @@ class Tenant:
         if self.status != TenantStatus.SUSPENDED:
             raise ValueError(f"Cannot reactivate tenant in {self.status} status")
 
-        self.status = TenantStatus.ACTIVE
+        self._change_status(TenantStatus.ACTIVE)
         self.suspended_at = None
-        self.updated_at = datetime.utcnow()
 
         # Remove suspension reason if exists
         self.settings.pop("suspension_reason", None)
@@ -116,66 +172,97 @@ class Tenant:
         if self.status == TenantStatus.ARCHIVED:
             raise ValueError("Tenant is already archived")
 
-        self.status = TenantStatus.ARCHIVED
+        self._change_status(TenantStatus.ARCHIVED)
+
+    def _change_status(self, new_status: TenantStatus) -> None:
+        """Set the status and record a TenantStatusChanged event"""
+        old_status = self.status
+        self.status = new_status
         self.updated_at = datetime.utcnow()
+        self.events.append(TenantStatusChanged(
+            tenant_id=self.id,
+            slug=self.slug,
+            old_status=old_status.value,
+            new_status=new_status.value
+        ))
+
+    def pull_events(self) -> List[TenantEvent]:
+        """Return and clear the domain events raised so far"""
+        events, self.events = self.events, []
+        return events
 
     def update_tier(self, new_tier: TenantTier) -> None:
-        """Update tenant subscription tier"""
+        """
+        Move the tenant to another tier and apply that tier's quotas
+
+        The change is recorded as a TenantTierChanged event, which the
+        repository appends to the tier history (outside the entity). Moving
+        to the current tier changes nothing and records nothing.
+        """
         if self.status != TenantStatus.ACTIVE:
             raise ValueError(f"Cannot update tier for tenant in {self.status} status")
+        if new_tier == self.tier:
+            return
 
         old_tier = self.tier
         self.tier = new_tier
         self.updated_at = datetime.utcnow()
 
-        # Update quotas based on tier
-        if new_tier == TenantTier.FREE:
-            self.max_users = 10
-            self.max_requests_per_month = 10000
-            self.max_storage_gb = 10
-        elif new_tier == TenantTier.PRO:
-            self.max_users = 50
-            self.max_requests_per_month = 100000
-            self.max_storage_gb = 100
-        elif new_tier == TenantTier.ENTERPRISE:
-            self.max_users = -1  # Unlimited
-            self.max_requests_per_month = -1  # Unlimited
-            self.max_storage_gb = 1000
-
-        # Log tier change
-        self.settings["tier_history"] = self.settings.get("tier_history", [])
-        self.settings["tier_history"].append({
-            "from": old_tier.value,
-            "to": new_tier.value,
-            "changed_at": datetime.utcnow().isoformat()
-        })
+        policy = TIER_POLICIES[new_tier]
+        self.max_users = policy.max_users
+        self.max_requests_per_month = policy.max_requests_per_month
+        self.max_storage_gb = policy.max_storage_gb
+
+        self.events.append(TenantTierChanged(
+            tenant_id=self.id,
+            slug=self.slug,
+            old_tier=old_tier.value,
+            new_tier=new_tier.value
+        ))
+
+    def update_details(self, **changes: Any) -> None:
+        """
+        Change descriptive fields; those whose value actually changes are
+        recorded in a TenantUpdated event
+        """
+        unknown = set(changes) - _DETAIL_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update tenant fields: {', '.join(sorted(unknown))}")
+
+        changed = {name: value for name, value in changes.items() if getattr(self, name) != value}
+        if not changed:
+            return
+        for name, value in changed.items():
+            setattr(self, name, value)
+        self.updated_at = datetime.utcnow()
+        self.events.append(TenantUpdated(tenant_id=self.id, slug=self.slug, changes=changed))
 
     def add_feature(self, feature: str) -> None:
         """Add a feature to the tenant"""
         if feature not in self.features:
             self.features.append(feature)
             self.updated_at = datetime.utcnow()
+            self.events.append(TenantFeatureAdded(tenant_id=self.id, slug=self.slug, feature=feature))
 
     def remove_feature(self, feature: str) -> None:
         """Remove a feature from the tenant"""
         if feature in self.features:
             self.features.remove(feature)
             self.updated_at = datetime.utcnow()
+            self.events.append(TenantFeatureRemoved(tenant_id=self.id, slug=self.slug, feature=feature))
 
     def has_feature(self, feature: str) -> bool:
         """Check if tenant has a specific feature"""
         return feature in self.features
 
-    def is_quota_exceeded(self, quota_type: str, current_usage: int) -> bool:
-        """Check if a quota has been exceeded"""
-        quota_map = {
-            "users": self.max_users,
-            "requests": self.max_requests_per_month,
-            "storage": self.max_storage_gb
-        }
+    def quota_limit(self, quota_type: str) -> int:
+        """Limit of a quota type under the tenant's tier policy (UNLIMITED = -1)"""
+        return TIER_POLICIES[self.tier].limit(quota_type)
 
-        max_allowed = quota_map.get(quota_type, 0)
-        if max_allowed == -1:  # Unlimited
+    def is_quota_exceeded(self, quota_type: str, current_usage: int) -> bool:
+        """Check if a quota has been exceeded (unknown quota types allow nothing)"""
+        max_allowed = self.quota_limit(quota_type)
+        if max_allowed == UNLIMITED:
             return False
 
         return current_usage >= max_allowed
@@ -203,4 +290,46 @@ class Tenant:
             "updated_at": self.updated_at.isoformat(),
             "activated_at": self.activated_at.isoformat() if self.activated_at else None,
             "suspended_at": self.suspended_at.isoformat() if self.suspended_at else None
-        }
\ No newline at end of file
+        }
+
+    def to_record(self) -> Dict[str, Any]:
+        """
+        Field values of to_dict() without conversion (UUID, enums and datetimes
+        as-is), for JSON encoders that handle those types natively (orjson)
+        """
+        return dict(zip(_RECORD_FIELDS, _get_record_fields(self)))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Tenant":
+        """Rebuild an entity from to_dict() output"""
+        return cls(
+            id=UUID(data["id"]),
+            name=data["name"],
+            slug=data["slug"],
+            status=TenantStatus(data["status"]),
+            tier=TenantTier(data["tier"]),
+            organization_name=data["organization_name"],
+            organization_domain=data["organization_domain"],
+            organization_size=data["organization_size"],
+            primary_contact_email=data["primary_contact_email"],
+            primary_contact_name=data["primary_contact_name"],
+            billing_email=data["billing_email"],
+            settings=data["settings"],
+            features=data["features"],
+            max_users=data["max_users"],
+            max_requests_per_month=data["max_requests_per_month"],
+            max_storage_gb=data["max_storage_gb"],
+            created_at=_parse_datetime(data["created_at"]),
+            updated_at=_parse_datetime(data["updated_at"]),
+            activated_at=_parse_datetime(data["activated_at"]),
+            suspended_at=_parse_datetime(data["suspended_at"])
+        )
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+# Everything but the pending domain events, in to_dict() order
+_RECORD_FIELDS = tuple(name for name in Tenant.__dataclass_fields__ if name != "events")
+_get_record_fields = attrgetter(*_RECORD_FIELDS)
@@ -0,0 +1,66 @@
+"""
+User Entity - Core Domain Model
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+
+class UserStatus(Enum):
+    """User status enumeration"""
+    ACTIVE = "active"
+    DISABLED = "disabled"
+
+
+class UserRole(Enum):
+    """User role within a tenant"""
+    OWNER = "owner"
+    ADMIN = "admin"
+    MEMBER = "member"
+
+
+@dataclass
+class User:
+    """
+    User entity representing a member of a tenant
+
+    This is a pure domain model with no framework dependencies
+    """
+    tenant_id: UUID
+    email: str
+    id: UUID = field(default_factory=uuid4)
+    name: Optional[str] = None
+    role: UserRole = UserRole.MEMBER
+    status: UserStatus = UserStatus.ACTIVE
+
+    # Metadata
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        """Normalize the email address"""
+        self.email = self.email.strip().lower()
+
+    def disable(self) -> None:
+        """Disable the user"""
+        if self.status == UserStatus.DISABLED:
+            raise ValueError("User is already disabled")
+
+        self.status = UserStatus.DISABLED
+        self.updated_at = datetime.utcnow()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert entity to dictionary"""
+        return {
+            "id": str(self.id),
+            "tenant_id": str(self.tenant_id),
+            "email": self.email,
+            "name": self.name,
+            "role": self.role.value,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat()
+        }
@@ -0,0 +1,83 @@
+"""
+Tenant Domain Events
+"""
+
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID, uuid4
+
+# Identity fields carried by every event, outside its payload
+_ENVELOPE_FIELDS = ("tenant_id", "occurred_at", "event_id")
+
+
+@dataclass(frozen=True)
+class TenantEvent:
+    """Base class for events raised by the Tenant aggregate"""
+    tenant_id: UUID
+    slug: str
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+    event_id: UUID = field(default_factory=uuid4)
+
+    @property
+    def action(self) -> str:
+        """What happened, e.g. "suspended" (the event name is tenant.<action>)"""
+        raise NotImplementedError
+
+    def payload(self) -> Dict[str, Any]:
+        """Event-specific fields (slug and those of the subclass)"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name not in _ENVELOPE_FIELDS}
+
+
+@dataclass(frozen=True)
+class TenantUpdated(TenantEvent):
+    """Raised when descriptive fields (name, organization, contacts) change; carries the new values"""
+    changes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def action(self) -> str:
+        return "updated"
+
+
+@dataclass(frozen=True)
+class TenantStatusChanged(TenantEvent):
+    """Raised when a tenant is activated, suspended, reactivated or archived"""
+    old_status: str = ""
+    new_status: str = ""
+
+    @property
+    def action(self) -> str:
+        if self.new_status == "active":
+            return "reactivated" if self.old_status == "suspended" else "activated"
+        return self.new_status
+
+
+@dataclass(frozen=True)
+class TenantTierChanged(TenantEvent):
+    """Raised when a tenant moves to another subscription tier"""
+    old_tier: str = ""
+    new_tier: str = ""
+
+    @property
+    def action(self) -> str:
+        return "tier_changed"
+
+
+@dataclass(frozen=True)
+class TenantFeatureAdded(TenantEvent):
+    """Raised when a feature is enabled for a tenant"""
+    feature: str = ""
+
+    @property
+    def action(self) -> str:
+        return "feature_added"
+
+
+@dataclass(frozen=True)
+class TenantFeatureRemoved(TenantEvent):
+    """Raised when a feature is disabled for a tenant"""
+    feature: str = ""
+
+    @property
+    def action(self) -> str:
+        return "feature_removed"
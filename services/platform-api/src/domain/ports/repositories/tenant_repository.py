@@ -0,0 +1,62 @@
+"""
+Tenant Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.domain.entities.tenant import Tenant
+from src.domain.events.tenant_events import TenantTierChanged
+
+
+class TenantRepository(ABC):
+    """
+    Persistence interface for tenants
+
+    Implemented by outbound persistence adapters
+    """
+
+    @abstractmethod
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        """Load a tenant by id"""
+
+    @abstractmethod
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        """Load a tenant by slug (subdomain)"""
+
+    @abstractmethod
+    async def add(self, tenant: Tenant) -> None:
+        """Persist a new tenant (and queue its pending events for publishing)"""
+
+    @abstractmethod
+    async def add_many(self, tenants: List[Tenant]) -> Set[UUID]:
+        """Persist new tenants, skipping slugs that are already taken; returns the ids inserted"""
+
+    @abstractmethod
+    async def update(self, tenant_id: UUID, change: Callable[[Tenant], None]) -> Optional[Tenant]:
+        """
+        Apply a change to a tenant under a lock on it and persist the result
+        (queueing its pending events for publishing); None if not found
+        """
+
+    @abstractmethod
+    async def get_tier_history(self, tenant_id: UUID, limit: int = 100) -> List[TenantTierChanged]:
+        """Most recent tier changes of a tenant, newest first (append-only, kept outside the entity)"""
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Tenant]:
+        """Tenants ordered by (created_at, id), starting after a keyset cursor"""
+
+    @abstractmethod
+    async def estimate_count(self) -> int:
+        """Planner estimate of the number of tenants (no COUNT scan)"""
+
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Tenant]:
+        """Every tenant in (created_at, id) order, fetched in batches"""
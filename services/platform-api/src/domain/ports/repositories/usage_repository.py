@@ -0,0 +1,35 @@
+"""
+Usage Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Mapping, Tuple
+from uuid import UUID
+
+# (period, tenant_id, metric) -> amount
+UsageDeltas = Mapping[Tuple[str, UUID, str], int]
+
+
+class UsageRepository(ABC):
+    """
+    Persistence interface for pre-aggregated usage rollups
+
+    One rollup per (tenant, period, metric); periods are calendar months
+    formatted as YYYY-MM (UTC).
+    """
+
+    @abstractmethod
+    async def get_usage(self, tenant_id: UUID, period: str) -> Dict[str, int]:
+        """Rolled-up usage of one tenant in one period, by metric"""
+
+    @abstractmethod
+    async def get_usage_many(self, tenant_ids: Iterable[UUID], period: str) -> Dict[UUID, Dict[str, int]]:
+        """Rolled-up usage of several tenants in one period"""
+
+    @abstractmethod
+    async def apply_deltas(self, batch_id: str, deltas: UsageDeltas) -> bool:
+        """
+        Add a batch of usage deltas to the rollups
+
+        Returns False (and changes nothing) if the batch was already applied.
+        """
@@ -0,0 +1,49 @@
+"""
+User Repository Port
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.domain.entities.tenant import UNLIMITED
+from src.domain.entities.user import User
+
+
+class UserRepository(ABC):
+    """
+    Persistence interface for users
+
+    Implemented by outbound persistence adapters
+    """
+
+    @abstractmethod
+    async def add_many(self, users: List[User], max_users: int = UNLIMITED) -> Tuple[Set[UUID], Set[UUID]]:
+        """
+        Insert users of one tenant, skipping emails that already exist and
+        stopping at ``max_users`` users in the tenant
+
+        Returns the ids inserted and the ids refused for exceeding the quota.
+        """
+
+    @abstractmethod
+    async def count(self, tenant_id: UUID) -> int:
+        """Exact number of users of a tenant"""
+
+    @abstractmethod
+    async def list_page(
+        self,
+        tenant_id: UUID,
+        limit: int,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[User]:
+        """Users of a tenant ordered by (created_at, id), starting after a keyset cursor"""
+
+    @abstractmethod
+    async def estimate_count(self, tenant_id: UUID) -> int:
+        """Planner estimate of the number of users of a tenant (no COUNT scan)"""
+
+    @abstractmethod
+    def iter_all(self, tenant_id: UUID, batch_size: int = 1000) -> AsyncIterator[User]:
+        """Every user of a tenant in (created_at, id) order, fetched in batches"""
@@ -26,6 +26,14 @@ class Settings(BaseSettings):
     # Debug & Logging
     DEBUG: bool = Field(default=False, description="Debug mode")
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
+    ACCESS_LOG_ENABLED: bool = Field(default=True, description="Write JSON access log to stdout")
+    ACCESS_LOG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        description="Share of successful requests logged (errors are always logged)"
+    )
+    ACCESS_LOG_BATCH_SIZE: int = Field(default=512, description="Access log records per write")
+    ACCESS_LOG_QUEUE_SIZE: int = Field(default=10000, description="Max queued access log records")
+    ACCESS_LOG_FLUSH_INTERVAL_SECONDS: float = Field(default=0.5, description="Access log flush interval")
 
     # Database
     DATABASE_URL: str = Field(
@@ -35,6 +43,20 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = Field(default=20, description="Database connection pool size")
     DATABASE_MAX_OVERFLOW: int = Field(default=40, description="Maximum overflow connections")
     DATABASE_POOL_TIMEOUT: int = Field(default=30, description="Pool timeout in seconds")
+    DATABASE_POOL_RECYCLE: int = Field(default=1800, description="Recycle connections after N seconds")
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        description="asyncpg prepared statements cached per connection (0 behind PgBouncer transaction pooling)"
+    )
+    DATABASE_CREATE_TABLES: bool = Field(default=False, description="Create tables at startup (local development)")
+
+    # Bulk Provisioning
+    BULK_MAX_BODY_BYTES: int = Field(default=64 * 1024 * 1024, description="Largest accepted bulk request body")
+    BULK_CHUNK_SIZE: int = Field(
+        default=1000,
+        le=1500,
+        description="Records per multi-row INSERT (bounded by the 32767 bind parameters of a statement)"
+    )
 
     # Redis
     REDIS_URL: str = Field(
@@ -51,6 +73,14 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = Field(default="HS256", description="JWT algorithm")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, description="Access token expiration in minutes")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, description="Refresh token expiration in days")
+    AUTH_CLAIMS_CACHE_SIZE: int = Field(default=10000, description="Verified tokens cached in-process")
+    AUTH_REVOCATION_SYNC_SECONDS: float = Field(default=2.0, description="Interval between revocation list syncs from Redis")
+    AUTH_ADMIN_SCOPE: str = Field(default="platform:admin", description="Token scope required for tenant administration")
+    AUTH_TENANT_CLAIM: str = Field(
+        default="tenant_id",
+        description="Identity provider token claim naming the user's tenant (id or slug)"
+    )
+    JWKS_REFRESH_INTERVAL_SECONDS: float = Field(default=3600.0, description="Interval between Logto JWKS refreshes")
 
     # CORS
     CORS_ORIGINS: List[str] = Field(
@@ -64,6 +94,13 @@ class Settings(BaseSettings):
         description="Tenant isolation strategy"
     )
     MAX_TENANTS: int = Field(default=1000, description="Maximum number of tenants")
+    TENANT_CACHE_TTL_SECONDS: float = Field(default=30.0, description="In-process tenant cache TTL")
+    TENANT_CACHE_MAX_ENTRIES: int = Field(default=10000, description="In-process tenant cache size")
+    TENANT_REDIS_TTL_SECONDS: int = Field(default=300, description="Redis tenant cache TTL")
+    TENANT_BASE_DOMAINS: str = Field(
+        default="",
+        description="Comma-separated domains whose subdomains name tenants (empty: X-Tenant-ID header only)"
+    )
 
     # Feature Flags
     FLAGSMITH_URL: Optional[str] = Field(default=None, description="Flagsmith API URL")
@@ -71,9 +108,19 @@ class Settings(BaseSettings):
 
     # NATS
     NATS_URL: str = Field(default="nats://localhost:4222", description="NATS server URL")
+    NATS_TENANT_STREAM: str = Field(default="TENANT_EVENTS", description="JetStream stream for tenant.> events")
+    OUTBOX_BATCH_SIZE: int = Field(default=100, description="Outbox events published per batch")
+    OUTBOX_POLL_INTERVAL_SECONDS: float = Field(default=1.0, description="Outbox poll interval when idle")
 
     # Observability
     ENABLE_METRICS: bool = Field(default=True, description="Enable Prometheus metrics")
+    HEALTH_CHECK_INTERVAL_SECONDS: float = Field(default=5.0, description="Interval between dependency health probes")
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = Field(default=1.0, description="Timeout of each dependency health probe")
+    # Kept as the raw comma-separated string: pydantic-settings would JSON-decode a list field
+    METRICS_LATENCY_BUCKETS: str = Field(
+        default="0.005,0.01,0.025,0.05,0.1,0.25,0.5,1.0,2.5,5.0,10.0",
+        description="Request duration histogram buckets in seconds (comma-separated)"
+    )
     ENABLE_TRACING: bool = Field(default=True, description="Enable distributed tracing")
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = Field(
         default=None,
@@ -84,6 +131,16 @@ class Settings(BaseSettings):
     RATE_LIMIT_ENABLED: bool = Field(default=True, description="Enable rate limiting")
     RATE_LIMIT_PER_MINUTE: int = Field(default=60, description="Requests per minute")
     RATE_LIMIT_PER_HOUR: int = Field(default=1000, description="Requests per hour")
+    RATE_LIMIT_LOCAL_LEASE_SIZE: int = Field(
+        default=10,
+        description="Tokens reserved per Redis call and spent locally (0 disables leasing)"
+    )
+
+    # Usage Metering
+    USAGE_METERING_ENABLED: bool = Field(default=True, description="Meter tenant usage and enforce request quotas")
+    USAGE_SYNC_INTERVAL_SECONDS: float = Field(default=1.0, description="Interval between local buffer syncs to Redis")
+    USAGE_FLUSH_INTERVAL_SECONDS: float = Field(default=30.0, description="Interval between Redis to Postgres rollup flushes")
+    USAGE_CACHE_TTL_SECONDS: float = Field(default=1.0, description="In-process usage totals cache TTL")
 
     # Security
     ENCRYPTION_KEY: str = Field(
@@ -98,6 +155,7 @@ class Settings(BaseSettings):
 
     # External Services
     LOGTO_ENDPOINT: Optional[str] = Field(default=None, description="Logto authentication endpoint")
+    LOGTO_AUDIENCE: Optional[str] = Field(default=None, description="Expected audience (API resource) of Logto tokens")
     KONG_ADMIN_URL: str = Field(default="http://kong:8001", description="Kong Admin API URL")
 
     @validator("DATABASE_URL")
@@ -114,6 +172,24 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",")]
         return v
 
+    @validator("METRICS_LATENCY_BUCKETS", pre=True)
+    def validate_metrics_buckets(cls, v) -> str:
+        """Check histogram buckets are positive numbers and store them sorted"""
+        if not isinstance(v, str):
+            v = ",".join(str(bucket) for bucket in v)
+        try:
+            buckets = sorted({float(bucket) for bucket in v.split(",") if bucket.strip()})
+        except ValueError:
+            raise ValueError(f"Histogram buckets must be comma-separated numbers, got {v!r}")
+        if not buckets or buckets[0] <= 0:
+            raise ValueError("Histogram buckets must be positive")
+        return ",".join(str(bucket) for bucket in buckets)
+
+    @property
+    def metrics_latency_buckets(self) -> List[float]:
+        """METRICS_LATENCY_BUCKETS as sorted floats"""
+        return [float(bucket) for bucket in self.METRICS_LATENCY_BUCKETS.split(",")]
+
     @validator("ENCRYPTION_KEY")
     def validate_encryption_key(cls, v: str) -> str:
         """Validate encryption key length for AES-256"""
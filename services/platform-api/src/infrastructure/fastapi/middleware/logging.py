@@ -3,43 +3,73 @@ Logging Middleware
 """
 
 import time
-import uuid
-from typing import Callable
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.infrastructure.observability.access_log import (
+    AccessLogWriter,
+    access_log,
+    next_request_id,
+)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+
+class LoggingMiddleware:
     """
     Middleware for request/response logging
+
+    Pure ASGI middleware; headers are added to the response start message
+    without buffering the body. Access records are handed to the batched
+    AccessLogWriter, so the request path never blocks on log I/O; with
+    ``writer=None`` only the request headers are added.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, writer: Optional[AccessLogWriter] = access_log) -> None:
+        self.app = app
+        self.writer = writer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and log details
         """
-        # Generate request ID if not present
-        request_id = request.headers.get("X-Request-Id", str(uuid.uuid4()))
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Start timer
-        start_time = time.time()
+        # Use the caller's request ID or generate one
+        request_id = Headers(scope=scope).get("x-request-id") or next_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        # Process request
-        response = await call_next(request)
+        # Start timer
+        start_time = time.perf_counter()
+        status_code = 500
 
-        # Calculate process time
-        process_time = time.time() - start_time
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
 
-        # Add headers
-        response.headers["X-Request-Id"] = request_id
-        response.headers["X-Process-Time"] = str(process_time)
+                # Time until the response starts (same point call_next returned)
+                process_time = time.perf_counter() - start_time
 
-        # TODO: Implement actual logging
-        # logger.info(
-        #     f"Request: {request.method} {request.url.path} "
-        #     f"Status: {response.status_code} "
-        #     f"Duration: {process_time:.3f}s"
-        # )
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Request-Id", request_id)
+                headers.append("X-Process-Time", str(process_time))
+            await send(message)
 
-        return response
\ No newline at end of file
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            if self.writer is not None:
+                client = scope.get("client")
+                self.writer.log(
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    time.perf_counter() - start_time,
+                    request_id,
+                    scope["state"].get("tenant_id"),
+                    client[0] if client else None
+                )
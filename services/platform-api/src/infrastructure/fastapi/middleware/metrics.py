@@ -3,41 +3,54 @@ Metrics Middleware for Prometheus
 """
 
 import time
-from typing import Callable
+from typing import Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.infrastructure.observability.metrics import UNMATCHED_ROUTE, HttpMetrics, http_metrics
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+
+class MetricsMiddleware:
     """
     Middleware for collecting Prometheus metrics
+
+    Pure ASGI middleware; the status code is captured from the response start
+    message and the duration covers the full response body. Requests are
+    labeled with the matched route template (``/v1/tenants/{tenant_id}``),
+    never the raw path.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, metrics: Optional[HttpMetrics] = None) -> None:
+        self.app = app
+        self.metrics = metrics if metrics is not None else http_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and collect metrics
         """
-        # Start timer
-        start_time = time.time()
-
-        # Process request
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Calculate request duration
-        duration = time.time() - start_time
-
-        # TODO: Implement actual metrics collection
-        # metrics.http_request_duration_seconds.labels(
-        #     method=request.method,
-        #     endpoint=request.url.path,
-        #     status=response.status_code
-        # ).observe(duration)
-
-        # metrics.http_requests_total.labels(
-        #     method=request.method,
-        #     endpoint=request.url.path,
-        #     status=response.status_code
-        # ).inc()
-
-        return response
\ No newline at end of file
+        # Start timer
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            # Process request
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Calculate request duration
+            duration = time.perf_counter() - start_time
+
+            # The router stores the matched APIRoute in the scope
+            route = scope.get("route")
+            route_template = route.path_format if route is not None else UNMATCHED_ROUTE
+
+            self.metrics.record(scope["method"], route_template, status_code, duration)
@@ -0,0 +1,65 @@
+"""
+Request Quota Middleware
+"""
+
+import time
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.fastapi.middleware.tenant import EXEMPT_PATH_PREFIXES
+
+# Still counted, but reachable once the quota is used up
+UNENFORCED_PATH_PREFIXES = ("/v1/quotas",)
+
+# Seconds between repeated "usage meter unavailable" warnings
+_WARNING_INTERVAL = 60.0
+
+
+class QuotaMiddleware:
+    """
+    Middleware metering tenant requests and enforcing max_requests_per_month
+
+    Runs after TenantMiddleware and reads the meter from
+    ``app.state.usage_meter``; without one, requests pass through. The quota
+    check is a read of in-process cached totals, and recording a request only
+    updates a local buffer, so neither touches Redis or the database. If
+    usage cannot be read, requests are admitted.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._last_warning = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        meter = getattr(scope["app"].state, "usage_meter", None) if "app" in scope else None
+        tenant = scope.get("state", {}).get("tenant")
+        if (
+            scope["type"] != "http"
+            or meter is None
+            or tenant is None
+            or scope["path"].startswith(EXEMPT_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        if not scope["path"].startswith(UNENFORCED_PATH_PREFIXES):
+            try:
+                exceeded = await meter.is_quota_exceeded(tenant, "requests")
+            except Exception as e:
+                exceeded = False
+                now = time.monotonic()
+                if now - self._last_warning > _WARNING_INTERVAL:
+                    self._last_warning = now
+                    print(f"Usage meter unavailable, admitting requests: {e}")
+
+            if exceeded:
+                response = JSONResponse(
+                    {"detail": "Monthly request quota exceeded"},
+                    status_code=429
+                )
+                await response(scope, receive, send)
+                return
+
+        meter.record(tenant.id, "requests")
+        await self.app(scope, receive, send)
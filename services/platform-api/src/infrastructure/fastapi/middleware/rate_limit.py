@@ -0,0 +1,116 @@
+"""
+Rate Limiting Middleware
+"""
+
+import math
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.outbound.auth.tokens import InvalidToken
+from src.adapters.outbound.cache.rate_limiter import RateLimitResult
+from src.infrastructure.fastapi.middleware.tenant import EXEMPT_PATH_PREFIXES
+
+# Seconds between repeated "rate limiter unavailable" warnings
+_WARNING_INTERVAL = 60.0
+
+
+async def _subject_identity(scope: Scope, headers: Headers) -> str:
+    """
+    Subject of a verified bearer token ("" without one)
+
+    Only verified credentials get their own budget: an unverified value is
+    attacker-chosen, so keying on it would give every forged token a fresh
+    allowance. Verification is served from the verifier's claims cache.
+    """
+    authorization = headers.get("authorization", "")
+    verifier = getattr(scope["app"].state, "token_verifier", None)
+    if authorization[:7].lower() != "bearer " or verifier is None:
+        return ""
+    try:
+        claims = await verifier.verify(authorization[7:])
+    except InvalidToken:
+        return ""
+    return "sub:" + str(claims["sub"])
+
+
+class RateLimitMiddleware:
+    """
+    Middleware enforcing RATE_LIMIT_PER_MINUTE / RATE_LIMIT_PER_HOUR
+
+    Limits apply independently per tenant (resolved by TenantMiddleware) and
+    per subject of a verified bearer token; requests with neither (missing or
+    invalid credentials included) are limited per client address. The limiter
+    is read from ``app.state.rate_limiter``; without one, requests pass
+    through. Responses carry RateLimit-Limit, RateLimit-Remaining,
+    RateLimit-Reset and RateLimit-Policy; rejected requests get 429 with
+    Retry-After. If Redis is unreachable, requests are admitted.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._last_warning = 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limiter = getattr(scope["app"].state, "rate_limiter", None) if "app" in scope else None
+        if (
+            scope["type"] != "http"
+            or limiter is None
+            or scope["path"].startswith(EXEMPT_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        identities = []
+        tenant_id = scope.get("state", {}).get("tenant_id")
+        if tenant_id:
+            identities.append("tenant:" + tenant_id)
+        subject = await _subject_identity(scope, Headers(scope=scope))
+        if subject:
+            identities.append(subject)
+        if not identities:
+            client = scope.get("client")
+            identities.append("ip:" + (client[0] if client else "unknown"))
+
+        try:
+            result = await limiter.check(identities)
+        except Exception as e:
+            # Fail open: an unavailable limiter must not take the API down
+            now = time.monotonic()
+            if now - self._last_warning > _WARNING_INTERVAL:
+                self._last_warning = now
+                print(f"Rate limiter unavailable, admitting requests: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        headers = self._headers(result, limiter.policy_header())
+
+        if not result.allowed:
+            headers["Retry-After"] = str(math.ceil(result.retry_after_seconds))
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers=headers
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers.append(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    @staticmethod
+    def _headers(result: RateLimitResult, policy: str) -> dict:
+        return {
+            "RateLimit-Limit": str(result.limit.limit),
+            "RateLimit-Remaining": str(result.remaining),
+            "RateLimit-Reset": str(math.ceil(result.reset_seconds)),
+            "RateLimit-Policy": policy
+        }
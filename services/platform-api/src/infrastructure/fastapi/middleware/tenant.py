@@ -2,48 +2,92 @@
 Multi-tenancy Middleware
 """
 
-from typing import Callable
+from typing import Optional, Sequence, Tuple
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.domain.entities.tenant import TenantStatus
 
-class TenantMiddleware(BaseHTTPMiddleware):
+# Paths served without tenant validation (probes, metrics, API docs)
+EXEMPT_PATH_PREFIXES = ("/health", "/metrics", "/docs", "/redoc", "/openapi.json")
+
+
+def _subdomain(host: str, suffixes: Tuple[str, ...]) -> Optional[str]:
+    """Leftmost label of a host directly under one of the base domain suffixes"""
+    for suffix in suffixes:
+        if host.endswith(suffix):
+            label = host[:-len(suffix)]
+            if label and "." not in label:
+                return label
+    return None
+
+
+class TenantMiddleware:
     """
     Middleware for handling multi-tenancy
+
+    Pure ASGI middleware: the downstream app receives the original receive/send
+    channels, so streaming responses and backpressure pass straight through.
+
+    When a TenantResolver is installed on ``app.state.tenant_resolver``, the
+    tenant is loaded through its caches and unknown or inactive tenants are
+    rejected with 403.
+
+    Without an X-Tenant-ID header the tenant is taken from the subdomain, but
+    only for hosts directly under one of ``base_domains`` (tenant1.<domain>);
+    any other host is treated as a request without a tenant.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, base_domains: Sequence[str] = ()) -> None:
+        self.app = app
+        self.base_domain_suffixes = tuple(
+            "." + domain.strip().strip(".").lower()
+            for domain in base_domains
+            if domain.strip().strip(".")
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and extract tenant information
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Extract tenant from headers or subdomain
-        tenant_id = request.headers.get("X-Tenant-Id")
+        headers = Headers(scope=scope)
+        tenant_id = headers.get("x-tenant-id")
 
         # If not in header, try to extract from subdomain
-        if not tenant_id:
-            host = request.headers.get("host", "")
-            # Example: tenant1.platform.com -> tenant1
-            if "." in host:
-                tenant_id = host.split(".")[0]
+        if not tenant_id and self.base_domain_suffixes:
+            host = headers.get("host", "").rsplit(":", 1)[0].lower()
+            # Example: tenant1.platform.com -> tenant1 (base domain platform.com)
+            tenant_id = _subdomain(host, self.base_domain_suffixes)
 
         # Store tenant ID in request state for use in endpoints
-        request.state.tenant_id = tenant_id
+        state = scope.setdefault("state", {})
+        state["tenant_id"] = tenant_id
 
-        # TODO: Validate tenant exists and is active
-        # if tenant_id:
-        #     tenant = await get_tenant(tenant_id)
-        #     if not tenant or tenant.status != "active":
-        #         return Response(
-        #             content="Invalid or inactive tenant",
-        #             status_code=403
-        #         )
+        # Validate tenant exists and is active (served from cache in the common case)
+        resolver = getattr(scope["app"].state, "tenant_resolver", None) if "app" in scope else None
+        if tenant_id and resolver is not None and not scope["path"].startswith(EXEMPT_PATH_PREFIXES):
+            tenant = await resolver.resolve(tenant_id)
+            if tenant is None or tenant.status != TenantStatus.ACTIVE:
+                response = PlainTextResponse("Invalid or inactive tenant", status_code=403)
+                await response(scope, receive, send)
+                return
+            state["tenant"] = tenant
 
-        # Process request
-        response = await call_next(request)
+        if not tenant_id:
+            await self.app(scope, receive, send)
+            return
 
-        # Add tenant ID to response headers
-        if tenant_id:
-            response.headers["X-Tenant-Id"] = tenant_id
+        async def send_with_tenant(message: Message) -> None:
+            # Add tenant ID to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Tenant-Id", tenant_id)
+            await send(message)
 
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send_with_tenant)
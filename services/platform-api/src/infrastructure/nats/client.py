@@ -0,0 +1,78 @@
+"""
+NATS Client
+Shared NATS connection for publishing domain events
+"""
+
+import asyncio
+import importlib
+import time
+from typing import TYPE_CHECKING, Optional
+
+from src.infrastructure.config.settings import settings
+
+if TYPE_CHECKING:
+    from nats.aio.client import Client as NATS
+
+_nats: Optional["NATS"] = None
+_connecting: Optional[asyncio.Task] = None
+_last_error = 0.0
+
+# Seconds between repeated connection error messages
+_ERROR_INTERVAL = 60.0
+
+
+async def _log_error(error: Exception) -> None:
+    global _last_error
+    now = time.monotonic()
+    if now - _last_error > _ERROR_INTERVAL:
+        _last_error = now
+        print(f"NATS connection error (retrying): {error}")
+
+
+async def init_nats() -> None:
+    """
+    Create the shared NATS client and connect in the background
+
+    Startup does not wait for NATS: nats-py (and the aiohttp it pulls in) is
+    imported off the event loop after startup, the client keeps retrying,
+    and callers check ``get_nats()`` and ``is_connected`` (events wait in
+    the outbox meanwhile).
+    """
+    global _connecting
+    if _connecting is None:
+        _connecting = asyncio.create_task(_connect())
+
+
+async def _connect() -> None:
+    global _nats
+    module = await asyncio.to_thread(importlib.import_module, "nats.aio.client")
+    _nats = module.Client()
+    await _nats.connect(
+        servers=settings.NATS_URL,
+        name=settings.SERVICE_NAME,
+        max_reconnect_attempts=-1,
+        error_cb=_log_error
+    )
+
+
+async def close_nats() -> None:
+    """
+    Flush pending publishes and close the shared NATS client
+    """
+    global _nats, _connecting
+    if _connecting is not None and not _connecting.done():
+        _connecting.cancel()
+    if _nats is not None:
+        if _nats.is_connected:
+            await _nats.drain()
+        else:
+            await _nats.close()
+    _nats = None
+    _connecting = None
+
+
+def get_nats() -> Optional["NATS"]:
+    """
+    Return the shared NATS client, or None until it has been created
+    """
+    return _nats
@@ -0,0 +1,170 @@
+"""
+Structured Access Log
+JSON access log written in batches by a background thread, off the event loop
+"""
+
+import itertools
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional, TextIO, Tuple
+
+from src.infrastructure.config.settings import settings
+
+# (timestamp, method, path, status, duration_seconds, request_id, tenant_id, client)
+AccessRecord = Tuple[float, str, str, int, float, str, Optional[str], Optional[str]]
+
+# Per-process prefix keeps ids unique across workers and restarts
+_REQUEST_ID_PREFIX = os.urandom(4).hex()
+_request_counter = itertools.count(1)
+
+
+def next_request_id() -> str:
+    """
+    Cheap, unique request id: a random per-process prefix and a monotonic counter
+    """
+    return f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
+
+
+class AccessLogWriter:
+    """
+    Batched JSON access log
+
+    The request path only appends a tuple to a deque (append/popleft are
+    atomic, no lock is taken). A daemon thread wakes every
+    ``flush_interval_seconds`` or once ``batch_size`` records are waiting,
+    encodes the batch to JSON lines and writes it with a single call.
+    Successful requests are sampled at ``sample_rate``; errors (status >= 400)
+    are always logged. When the queue is full, the oldest records are dropped
+    and counted: ``dropped`` is the total so far, incremented only on the
+    request path; the writer thread reports the increase since its last
+    report without writing to it, so no update can be lost.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO = sys.stdout,
+        sample_rate: float = 1.0,
+        batch_size: int = 512,
+        max_queue_size: int = 10000,
+        flush_interval_seconds: float = 0.5,
+        service: str = "platform-api"
+    ):
+        self.stream = stream
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.service = service
+        self.dropped = 0
+
+        # Writer-thread side: drops already reported in the log
+        self._reported_dropped = 0
+        self._queue: "deque[AccessRecord]" = deque(maxlen=max_queue_size)
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def log(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        duration: float,
+        request_id: str,
+        tenant_id: Optional[str] = None,
+        client: Optional[str] = None
+    ) -> None:
+        """
+        Queue one access record (non-blocking)
+        """
+        if status < 400 and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self.dropped += 1
+        queue.append((time.time(), method, path, status, duration, request_id, tenant_id, client))
+
+        if len(queue) >= self.batch_size:
+            self._wake.set()
+
+    def start(self) -> None:
+        """
+        Start the background writer thread
+        """
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="access-log", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """
+        Stop the writer thread after writing everything still queued
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            self._flush()
+        self._flush()
+
+    def _flush(self) -> None:
+        queue = self._queue
+        while queue:
+            lines = []
+            while queue and len(lines) < self.batch_size:
+                lines.append(self._encode(queue.popleft()))
+
+            dropped = self.dropped - self._reported_dropped
+            if dropped:
+                self._reported_dropped += dropped
+                lines.append(json.dumps({
+                    "level": "warning",
+                    "service": self.service,
+                    "message": "access log records dropped",
+                    "dropped": dropped
+                }) + "\n")
+
+            try:
+                self.stream.write("".join(lines))
+                self.stream.flush()
+            except Exception as e:
+                print(f"Failed to write access log batch: {e}", file=sys.stderr)
+
+    def _encode(self, record: AccessRecord) -> str:
+        timestamp, method, path, status, duration, request_id, tenant_id, client = record
+        return json.dumps({
+            "timestamp": datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+            "level": "error" if status >= 500 else "warning" if status >= 400 else "info",
+            "service": self.service,
+            "request_id": request_id,
+            "tenant_id": tenant_id,
+            "method": method,
+            "path": path,
+            "status": status,
+            "duration_ms": round(duration * 1000, 3),
+            "client": client
+        }, separators=(",", ":")) + "\n"
+
+
+# Process-wide writer used by LoggingMiddleware; started in the app lifespan
+access_log = AccessLogWriter(
+    sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+    batch_size=settings.ACCESS_LOG_BATCH_SIZE,
+    max_queue_size=settings.ACCESS_LOG_QUEUE_SIZE,
+    flush_interval_seconds=settings.ACCESS_LOG_FLUSH_INTERVAL_SECONDS,
+    service=settings.SERVICE_NAME
+)
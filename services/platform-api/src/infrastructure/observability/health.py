@@ -0,0 +1,151 @@
+"""
+Dependency Health Monitor
+Probes dependencies concurrently in the background; health endpoints read the last results
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class HealthProbe:
+    """One dependency check; ``check`` raises (or times out) when unhealthy"""
+    name: str
+    check: Callable[[], Awaitable[None]]
+    timeout_seconds: float = 1.0
+    # Readiness fails while a critical dependency is unhealthy
+    critical: bool = True
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Outcome of one probe run"""
+    healthy: bool
+    critical: bool
+    latency_ms: float
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        result: Dict[str, object] = {
+            "status": "healthy" if self.healthy else "unhealthy",
+            "latency_ms": self.latency_ms
+        }
+        if self.error:
+            result["error"] = self.error
+        return result
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    """Results of one round of probes"""
+    results: Dict[str, ProbeResult]
+    checked_at: datetime
+
+    @property
+    def healthy(self) -> bool:
+        return all(result.healthy for result in self.results.values())
+
+    @property
+    def ready(self) -> bool:
+        return all(result.healthy for result in self.results.values() if result.critical)
+
+
+class HealthMonitor:
+    """
+    Runs every probe concurrently (each under its own timeout) every
+    ``interval_seconds`` and keeps the latest snapshot
+
+    Health and readiness requests only read that snapshot, so probe traffic
+    to the dependencies stays at one round per interval however often
+    Kubernetes polls, and a slow dependency delays the next snapshot by at
+    most its timeout instead of queueing requests behind it.
+    """
+
+    def __init__(self, probes: Sequence[HealthProbe], interval_seconds: float = 5.0):
+        self.probes = list(probes)
+        self.interval_seconds = interval_seconds
+
+        self._snapshot: Optional[HealthSnapshot] = None
+        self._first_round: Optional[asyncio.Task] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def snapshot(self) -> HealthSnapshot:
+        """
+        Latest probe results (waits for the first round only)
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+        if self._first_round is None:
+            self._first_round = asyncio.create_task(self.refresh())
+        return await asyncio.shield(self._first_round)
+
+    async def refresh(self) -> HealthSnapshot:
+        """
+        Run every probe now and store the results
+        """
+        results = await asyncio.gather(*(self._run(probe) for probe in self.probes))
+        self._snapshot = HealthSnapshot(
+            results={probe.name: result for probe, result in zip(self.probes, results)},
+            checked_at=datetime.utcnow()
+        )
+        return self._snapshot
+
+    async def start(self) -> None:
+        """
+        Start probing in the background
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """
+        Stop probing
+        """
+        for task in (self._worker, self._first_round):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._worker = None
+
+    async def _run(self, probe: HealthProbe) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe.check(), probe.timeout_seconds)
+        except asyncio.TimeoutError:
+            error = f"timed out after {probe.timeout_seconds}s"
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        else:
+            error = None
+        latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        return ProbeResult(healthy=error is None, critical=probe.critical, latency_ms=latency_ms, error=error)
+
+    async def _loop(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval_seconds)
+
+
+def dependency_probes(database, redis, get_nats, timeout_seconds: float = 1.0) -> Sequence[HealthProbe]:
+    """
+    Probes for the platform-api dependencies
+
+    NATS is not critical: events wait in the outbox while it is unreachable.
+    """
+    async def check_nats() -> None:
+        nats = get_nats()
+        if nats is None or not nats.is_connected:
+            raise ConnectionError("not connected")
+        await nats.flush(timeout=timeout_seconds)
+
+    return [
+        HealthProbe("database", database.ping, timeout_seconds),
+        HealthProbe("redis", redis.ping, timeout_seconds),
+        HealthProbe("nats", check_nats, timeout_seconds, critical=False)
+    ]
@@ -0,0 +1,125 @@
+"""
+Prometheus Metrics
+HTTP and database pool metrics, with multi-process aggregation
+"""
+
+import os
+from typing import Dict, Optional, Sequence, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.infrastructure.config.settings import settings
+
+# Connection pool waits are usually sub-millisecond; the tail matters
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+# Route label for requests that matched no route (keeps 404 scans from adding series)
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class HttpMetrics:
+    """
+    HTTP request counter and latency histogram
+
+    Label children are cached per (method, route, status), so recording is a
+    dict lookup plus one inc() and one observe(). Routes are FastAPI path
+    templates, which keeps cardinality bounded by the number of endpoints.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[CollectorRegistry] = None,
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS
+    ):
+        registry = registry if registry is not None else REGISTRY
+
+        self.requests = Counter(
+            "http_requests_total",
+            "Total HTTP requests",
+            ["method", "route", "status"],
+            registry=registry
+        )
+        self.duration = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request duration in seconds",
+            ["method", "route", "status"],
+            buckets=buckets,
+            registry=registry
+        )
+        self._children: Dict[Tuple[str, str, int], Tuple] = {}
+
+    def record(self, method: str, route: str, status: int, duration: float) -> None:
+        """
+        Record one request
+        """
+        key = (method, route, status)
+        children = self._children.get(key)
+        if children is None:
+            labels = {"method": method, "route": route, "status": str(status)}
+            children = (self.requests.labels(**labels), self.duration.labels(**labels))
+            self._children[key] = children
+
+        counter, histogram = children
+        counter.inc()
+        histogram.observe(duration)
+
+
+class DatabaseMetrics:
+    """
+    Connection pool metrics: time spent waiting for a connection and
+    connections currently checked out
+    """
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None):
+        registry = registry if registry is not None else REGISTRY
+
+        self.pool_wait = Histogram(
+            "db_pool_wait_seconds",
+            "Time spent acquiring a database connection from the pool",
+            buckets=POOL_WAIT_BUCKETS,
+            registry=registry
+        )
+        self.connections_in_use = Gauge(
+            "db_pool_connections_in_use",
+            "Database connections currently checked out of the pool",
+            multiprocess_mode="livesum",
+            registry=registry
+        )
+        self.pool_timeouts = Counter(
+            "db_pool_timeouts_total",
+            "Connection acquisitions that hit the pool timeout",
+            registry=registry
+        )
+
+
+def metrics_endpoint(request: Request) -> Response:
+    """
+    Expose metrics in the Prometheus text format
+
+    With PROMETHEUS_MULTIPROC_DIR set (multi-worker uvicorn/gunicorn), samples
+    from every worker process are merged; otherwise the in-process registry
+    is served.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+# Process-wide instances used by MetricsMiddleware and the database engine
+http_metrics = HttpMetrics(buckets=settings.metrics_latency_buckets)
+database_metrics = DatabaseMetrics()
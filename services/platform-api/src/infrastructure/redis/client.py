@@ -0,0 +1,43 @@
+"""
+Redis Client
+Shared async Redis connection pool for caches, rate limits and counters
+"""
+
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from src.infrastructure.config.settings import settings
+
+_redis: Optional[Redis] = None
+
+
+async def init_redis() -> Redis:
+    """
+    Create the shared Redis client (connections are opened lazily)
+    """
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_POOL_SIZE,
+            decode_responses=True
+        )
+    return _redis
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client and its connection pool
+    """
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def get_redis() -> Optional[Redis]:
+    """
+    Return the shared Redis client, or None before init_redis()
+    """
+    return _redis
@@ -0,0 +1,45 @@
+"""
+JSON Serialization
+Compact JSON via orjson, with a stdlib fallback that produces the same output
+"""
+
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Union
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode the types orjson handles natively, the way it does"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode to compact JSON bytes
+
+    datetimes, UUIDs and enums are encoded as Tenant.to_dict() would, so
+    to_record() output can be encoded without converting it first.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -13,7 +13,24 @@ from fastapi.middleware.gzip import GZipMiddleware
 from src.infrastructure.config.settings import settings
 from src.infrastructure.fastapi.middleware.logging import LoggingMiddleware
 from src.infrastructure.fastapi.middleware.metrics import MetricsMiddleware
+from src.infrastructure.fastapi.middleware.quota import QuotaMiddleware
+from src.infrastructure.fastapi.middleware.rate_limit import RateLimitMiddleware
 from src.infrastructure.fastapi.middleware.tenant import TenantMiddleware
+from src.infrastructure.observability.access_log import access_log
+from src.infrastructure.observability.health import HealthMonitor, dependency_probes
+from src.infrastructure.observability.metrics import metrics_endpoint
+from src.infrastructure.database.engine import init_database, close_database
+from src.infrastructure.redis.client import init_redis, close_redis
+from src.infrastructure.nats.client import init_nats, close_nats, get_nats
+from src.adapters.outbound.auth.revocation import RevocationList
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier
+from src.adapters.outbound.cache.rate_limiter import build_rate_limiter
+from src.adapters.outbound.cache.tenant_resolver import TenantResolver
+from src.adapters.outbound.cache.usage_meter import UsageMeter
+from src.adapters.outbound.events.outbox_relay import OutboxRelay
+from src.adapters.outbound.persistence.outbox import OutboxStore
+from src.adapters.outbound.persistence.tenant_repository import SqlAlchemyTenantRepository
+from src.adapters.outbound.persistence.usage_repository import SqlAlchemyUsageRepository
 from src.adapters.inbound.rest.v1 import (
     health,
     tenants,
@@ -32,28 +49,128 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Startup
     print(f"Starting {settings.SERVICE_NAME} v{settings.SERVICE_VERSION}")
 
+    # Start the batched access log writer
+    if settings.ACCESS_LOG_ENABLED:
+        access_log.start()
+
     # Initialize database connections
-    # await init_database()
+    database = await init_database()
 
     # Initialize Redis
-    # await init_redis()
+    redis = await init_redis()
+
+    # Cached tenant lookups for TenantMiddleware
+    app.state.tenant_resolver = TenantResolver(
+        SqlAlchemyTenantRepository(database),
+        redis=redis,
+        ttl_seconds=settings.TENANT_CACHE_TTL_SECONDS,
+        max_entries=settings.TENANT_CACHE_MAX_ENTRIES,
+        redis_ttl_seconds=settings.TENANT_REDIS_TTL_SECONDS
+    )
+    await app.state.tenant_resolver.start()
+
+    # Bearer token verification (claims cached per token, JWKS and revocations kept in memory)
+    jwks = None
+    if settings.LOGTO_ENDPOINT:
+        from src.adapters.outbound.auth.jwks import JwksCache
+
+        jwks = JwksCache(
+            f"{settings.LOGTO_ENDPOINT.rstrip('/')}/oidc/jwks",
+            refresh_interval_seconds=settings.JWKS_REFRESH_INTERVAL_SECONDS
+        )
+        await jwks.start()
+    revocations = RevocationList(redis, sync_interval_seconds=settings.AUTH_REVOCATION_SYNC_SECONDS)
+    await revocations.start()
+    app.state.token_verifier = TokenVerifier(
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+        issuer=settings.SERVICE_NAME,
+        jwks=jwks,
+        jwks_issuer=f"{settings.LOGTO_ENDPOINT.rstrip('/')}/oidc" if settings.LOGTO_ENDPOINT else None,
+        audience=settings.LOGTO_AUDIENCE,
+        revocations=revocations,
+        max_entries=settings.AUTH_CLAIMS_CACHE_SIZE
+    )
+    app.state.token_issuer = TokenIssuer(
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.JWT_ALGORITHM,
+        issuer=settings.SERVICE_NAME,
+        access_ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        refresh_ttl_seconds=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+    )
+
+    # Distributed rate limiting for RateLimitMiddleware
+    app.state.rate_limiter = build_rate_limiter(
+        redis,
+        per_minute=settings.RATE_LIMIT_PER_MINUTE,
+        per_hour=settings.RATE_LIMIT_PER_HOUR,
+        lease_size=settings.RATE_LIMIT_LOCAL_LEASE_SIZE
+    ) if settings.RATE_LIMIT_ENABLED else None
+
+    # Usage counters (Redis) flushed to rollups (Postgres) by a background worker
+    app.state.usage_meter = None
+    if settings.USAGE_METERING_ENABLED:
+        app.state.usage_meter = UsageMeter(
+            redis,
+            SqlAlchemyUsageRepository(database),
+            sync_interval_seconds=settings.USAGE_SYNC_INTERVAL_SECONDS,
+            flush_interval_seconds=settings.USAGE_FLUSH_INTERVAL_SECONDS,
+            cache_ttl_seconds=settings.USAGE_CACHE_TTL_SECONDS
+        )
+        await app.state.usage_meter.start()
+
+    # Initialize NATS and relay outbox events to it
+    await init_nats()
+    app.state.outbox_relay = OutboxRelay(
+        OutboxStore(database),
+        get_nats,
+        stream=settings.NATS_TENANT_STREAM,
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval_seconds=settings.OUTBOX_POLL_INTERVAL_SECONDS
+    )
+    await app.state.outbox_relay.start()
 
-    # Initialize NATS
-    # await init_nats()
+    # Dependency probes run in the background; health endpoints read the last results
+    app.state.health_monitor = HealthMonitor(
+        dependency_probes(database, redis, get_nats, timeout_seconds=settings.HEALTH_PROBE_TIMEOUT_SECONDS),
+        interval_seconds=settings.HEALTH_CHECK_INTERVAL_SECONDS
+    )
+    await app.state.health_monitor.start()
 
     yield
 
     # Shutdown
     print(f"Shutting down {settings.SERVICE_NAME}")
 
+    # Stop probing dependencies
+    await app.state.health_monitor.stop()
+
+    # Stop relaying (unpublished events stay in the outbox)
+    await app.state.outbox_relay.stop()
+
+    # Flush remaining usage before the database and Redis go away
+    if app.state.usage_meter is not None:
+        await app.state.usage_meter.stop()
+
+    # Stop key rotation and revocation sync
+    if app.state.token_verifier.jwks is not None:
+        await app.state.token_verifier.jwks.stop()
+    await app.state.token_verifier.revocations.stop()
+
+    # Stop tenant invalidation listener
+    await app.state.tenant_resolver.stop()
+
     # Close database connections
-    # await close_database()
+    await close_database()
 
     # Close Redis
-    # await close_redis()
+    await close_redis()
 
     # Close NATS
-    # await close_nats()
+    await close_nats()
+
+    # Write out queued access log records
+    access_log.close()
 
 
 def create_app() -> FastAPI:
@@ -70,7 +187,19 @@ def create_app() -> FastAPI:
         lifespan=lifespan
     )
 
-    # Add middleware
+    # Add middleware. The last one added runs first, so tenant resolution
+    # runs before rate limiting and quotas, and CORS, logging and metrics
+    # wrap every response, including the 403/429s those layers return early.
+    app.add_middleware(QuotaMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(TenantMiddleware, base_domains=settings.TENANT_BASE_DOMAINS.split(","))
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    if settings.ENABLE_METRICS:
+        app.add_middleware(MetricsMiddleware)
+    app.add_middleware(
+        LoggingMiddleware,
+        writer=access_log if settings.ACCESS_LOG_ENABLED else None
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
@@ -79,10 +208,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
-    app.add_middleware(MetricsMiddleware)
-    app.add_middleware(LoggingMiddleware)
-    app.add_middleware(TenantMiddleware)
+    # Prometheus scrape endpoint
+    if settings.ENABLE_METRICS:
+        app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
 
     # Include routers
     app.include_router(
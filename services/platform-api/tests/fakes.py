@@ -0,0 +1,127 @@
+"""
+In-memory stand-ins for the outbound ports used by unit tests
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.domain.entities.tenant import UNLIMITED, Tenant
+from src.domain.entities.user import User
+from src.domain.events.tenant_events import TenantTierChanged
+
+
+class InMemoryTenantRepository:
+    """Tenant lookups from a dict; loads can be held open with ``gate``"""
+
+    def __init__(self, *tenants: Tenant):
+        self.tenants: Dict[UUID, Tenant] = {tenant.id: tenant for tenant in tenants}
+        self.tier_history: List[TenantTierChanged] = []
+        self._row_lock = asyncio.Lock()
+        self.loads = 0
+        self.gate: Optional[asyncio.Event] = None
+
+    async def get_by_id(self, tenant_id: UUID) -> Optional[Tenant]:
+        return await self._load(self.tenants.get(tenant_id))
+
+    async def get_by_slug(self, slug: str) -> Optional[Tenant]:
+        return await self._load(next((t for t in self.tenants.values() if t.slug == slug), None))
+
+    async def add(self, tenant: Tenant) -> None:
+        self.tenants[tenant.id] = tenant
+
+    async def update(self, tenant_id: UUID, change: Callable[[Tenant], None]) -> Optional[Tenant]:
+        # Changes take turns like transactions holding the row lock
+        async with self._row_lock:
+            tenant = await self._load(self.tenants.get(tenant_id))
+            if tenant is None:
+                return None
+            change(tenant)
+            self.tenants[tenant_id] = tenant
+            self.tier_history.extend(event for event in tenant.events if isinstance(event, TenantTierChanged))
+            return tenant
+
+    async def get_tier_history(self, tenant_id: UUID, limit: int = 100) -> List[TenantTierChanged]:
+        changes = [change for change in self.tier_history if change.tenant_id == tenant_id]
+        return changes[::-1][:limit]
+
+    async def _load(self, tenant: Optional[Tenant]) -> Optional[Tenant]:
+        self.loads += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        # Callers get their own copy, as from a database row
+        return Tenant.from_dict(tenant.to_dict()) if tenant is not None else None
+
+
+class InMemoryUsageRepository:
+    """Usage rollups in a dict, with applied batch ids remembered like the rollup table"""
+
+    def __init__(self):
+        self.rollups: Dict[tuple, int] = defaultdict(int)
+        self.batches: Set[str] = set()
+        self.reads = 0
+
+    async def get_usage(self, tenant_id: UUID, period: str) -> Dict[str, int]:
+        return (await self.get_usage_many([tenant_id], period)).get(tenant_id, {})
+
+    async def get_usage_many(self, tenant_ids: Iterable[UUID], period: str) -> Dict[UUID, Dict[str, int]]:
+        self.reads += 1
+        usage: Dict[UUID, Dict[str, int]] = {}
+        for (rollup_period, tenant_id, metric), amount in self.rollups.items():
+            if rollup_period == period and tenant_id in tenant_ids:
+                usage.setdefault(tenant_id, {})[metric] = amount
+        return usage
+
+    async def apply_deltas(self, batch_id: str, deltas) -> bool:
+        if batch_id in self.batches:
+            return False
+        self.batches.add(batch_id)
+        for key, amount in deltas.items():
+            self.rollups[key] += amount
+        return True
+
+
+class StaticTenantResolver:
+    """TenantResolver stand-in serving a fixed set of tenants by id or slug"""
+
+    def __init__(self, *tenants: Tenant):
+        self.tenants = {key: tenant for tenant in tenants for key in (str(tenant.id), tenant.slug)}
+
+    async def resolve(self, identifier: str) -> Optional[Tenant]:
+        return self.tenants.get(identifier)
+
+
+class InMemoryUserRepository:
+    """Users in a dict; inserts take turns on a lock, like the per-tenant advisory lock"""
+
+    def __init__(self, *users: User):
+        self.users: Dict[UUID, User] = {user.id: user for user in users}
+        self.chunks: List[int] = []
+        self._lock = asyncio.Lock()
+
+    async def add_many(self, users: List[User], max_users: int = UNLIMITED) -> Tuple[Set[UUID], Set[UUID]]:
+        async with self._lock:
+            self.chunks.append(len(users))
+            tenant_id = users[0].tenant_id
+            seen = {user.email for user in self.users.values() if user.tenant_id == tenant_id}
+            count = len(seen)
+            new_users = []
+            for user in users:
+                if user.email not in seen:
+                    seen.add(user.email)
+                    new_users.append(user)
+            # Yield while "holding the transaction open", as a database round trip would
+            await asyncio.sleep(0)
+
+            over_quota: Set[UUID] = set()
+            if max_users != UNLIMITED:
+                room = max(max_users - count, 0)
+                over_quota = {user.id for user in new_users[room:]}
+                new_users = new_users[:room]
+            for user in new_users:
+                self.users[user.id] = user
+            return {user.id for user in new_users}, over_quota
+
+    async def count(self, tenant_id: UUID) -> int:
+        return sum(1 for user in self.users.values() if user.tenant_id == tenant_id)
@@ -0,0 +1,120 @@
+"""
+Unit tests for the batched access log writer
+"""
+
+import io
+import json
+
+import pytest
+
+from src.infrastructure.observability import access_log as access_log_module
+from src.infrastructure.observability.access_log import AccessLogWriter, next_request_id
+
+
+class RecordingStream(io.StringIO):
+    """StringIO that remembers each write call"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def write(self, text):
+        self.writes.append(text)
+        return super().write(text)
+
+
+def _log(writer: AccessLogWriter, status: int = 200, path: str = "/v1/tenants") -> None:
+    writer.log("GET", path, status, 0.0125, next_request_id(), "tenant-1", "10.0.0.1")
+
+
+def _lines(stream: io.StringIO):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@pytest.mark.unit
+class TestAccessLogWriter:
+    """Sampling, batching and the bounded queue"""
+
+    def test_encodes_one_json_line_per_request(self):
+        stream = RecordingStream()
+        writer = AccessLogWriter(stream=stream, service="platform-api")
+
+        _log(writer, status=503)
+        writer._flush()
+
+        [line] = _lines(stream)
+        assert line["level"] == "error"
+        assert (line["method"], line["path"], line["status"]) == ("GET", "/v1/tenants", 503)
+        assert (line["tenant_id"], line["client"], line["service"]) == ("tenant-1", "10.0.0.1", "platform-api")
+        assert line["duration_ms"] == 12.5
+
+    def test_samples_successes_but_always_logs_errors(self, monkeypatch):
+        monkeypatch.setattr(access_log_module.random, "random", lambda: 0.5)
+        stream = RecordingStream()
+        writer = AccessLogWriter(stream=stream, sample_rate=0.25)
+
+        for status in (200, 201, 404, 500):
+            _log(writer, status=status)
+        writer._flush()
+
+        assert [line["status"] for line in _lines(stream)] == [404, 500]
+
+    def test_writes_each_batch_with_one_call(self):
+        stream = RecordingStream()
+        writer = AccessLogWriter(stream=stream, batch_size=3)
+
+        for _ in range(7):
+            _log(writer)
+        writer._flush()
+
+        assert [write.count("\n") for write in stream.writes] == [3, 3, 1]
+
+    def test_full_batch_wakes_the_writer(self):
+        writer = AccessLogWriter(stream=RecordingStream(), batch_size=2)
+
+        _log(writer)
+        assert not writer._wake.is_set()
+        _log(writer)
+        assert writer._wake.is_set()
+
+    def test_full_queue_drops_oldest_and_reports_once(self):
+        stream = RecordingStream()
+        writer = AccessLogWriter(stream=stream, max_queue_size=2)
+
+        for path in ("/a", "/b", "/c", "/d", "/e"):
+            _log(writer, path=path)
+        writer._flush()
+        _log(writer, path="/f")
+        writer._flush()
+
+        lines = _lines(stream)
+        assert [line.get("path") for line in lines] == ["/d", "/e", None, "/f"]
+        assert lines[2]["dropped"] == 3
+        assert writer.dropped == 3
+
+    def test_close_writes_everything_queued(self):
+        stream = RecordingStream()
+        writer = AccessLogWriter(stream=stream, flush_interval_seconds=60)
+        writer.start()
+
+        for _ in range(5):
+            _log(writer)
+        writer.close()
+
+        assert len(_lines(stream)) == 5
+        assert writer._thread is None
+
+    def test_write_failure_does_not_stop_the_writer(self):
+        class BrokenStream(RecordingStream):
+            def write(self, text):
+                raise OSError("disk full")
+
+        writer = AccessLogWriter(stream=BrokenStream())
+        _log(writer)
+
+        writer._flush()
+
+        assert not writer._queue
+
+    def test_request_ids_are_unique(self):
+        assert len({next_request_id() for _ in range(1000)}) == 1000
@@ -0,0 +1,210 @@
+"""
+Unit tests for bulk provisioning: record decoding, chunked inserts and the user quota
+"""
+
+import asyncio
+import json
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.adapters.inbound.rest.bulk import MalformedRecord, iter_records, provision
+from src.adapters.inbound.rest.dependencies import get_user_repository
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier
+from src.domain.entities.tenant import TIER_POLICIES, Tenant, TenantStatus, TenantTier
+from src.domain.entities.user import User
+from src.infrastructure.config.settings import settings
+from src.main import create_app
+from tests.fakes import InMemoryUserRepository, StaticTenantResolver
+
+SECRET = "test-secret"
+
+NDJSON = "application/x-ndjson"
+
+
+async def _collect(stream):
+    lines = []
+    async for chunk in stream:
+        lines.extend(json.loads(line) for line in chunk.splitlines())
+    return lines
+
+
+@pytest.mark.unit
+class TestIterRecords:
+    """Records decoded one at a time from NDJSON or a JSON array"""
+
+    def test_malformed_ndjson_line_does_not_stop_decoding(self):
+        records = list(iter_records(b'{"a": 1}\n{oops\n\n{"a": 2}\n', NDJSON))
+
+        assert records[0] == {"a": 1}
+        assert isinstance(records[1], MalformedRecord)
+        assert records[2] == {"a": 2}
+        assert len(records) == 3
+
+    def test_decodes_json_array(self):
+        records = list(iter_records(b' [ {"a": 1} , {"a": 2} ] ', "application/json"))
+
+        assert records == [{"a": 1}, {"a": 2}]
+
+    def test_json_array_syntax_error_is_the_last_record(self):
+        records = list(iter_records(b'[{"a": 1}, {"a": ', "application/json; charset=utf-8"))
+
+        assert records[0] == {"a": 1}
+        assert isinstance(records[1], MalformedRecord)
+        assert len(records) == 2
+
+    def test_missing_separator_is_malformed(self):
+        records = list(iter_records(b'[{"a": 1} {"a": 2}]', "application/json"))
+
+        assert records[0] == {"a": 1}
+        assert isinstance(records[1], MalformedRecord)
+
+    @pytest.mark.parametrize("body", [b'{"a": 1}', b"\xff\xfe"])
+    def test_rejects_body_that_is_not_an_array(self, body):
+        [record] = iter_records(body, "application/json")
+
+        assert isinstance(record, MalformedRecord)
+
+
+@pytest.mark.unit
+class TestProvision:
+    """Validation, chunking and per-record results"""
+
+    async def test_results_in_record_order_with_summary(self):
+        existing = "taken@example.com"
+        inserted_chunks = []
+
+        def build(record):
+            if "email" not in record:
+                raise ValueError("email: Field required")
+            return User(tenant_id=uuid4(), email=record["email"])
+
+        async def insert(users):
+            inserted_chunks.append([user.email for user in users])
+            return {user.id for user in users if user.email != existing}
+
+        records = [
+            {"email": "a@example.com"},
+            MalformedRecord("Invalid JSON"),
+            {"name": "no email"},
+            {"email": existing},
+            {"email": "b@example.com"},
+        ]
+
+        lines = await _collect(provision(iter(records), build, insert, chunk_size=2))
+
+        statuses = [line.get("status") for line in lines[:-1]]
+        assert statuses == ["created", "invalid", "invalid", "exists", "created"]
+        assert [line["index"] for line in lines[:-1]] == [0, 1, 2, 3, 4]
+        assert lines[-1] == {"summary": {"created": 2, "exists": 1, "invalid": 2}}
+        assert inserted_chunks == [["a@example.com"], [existing], ["b@example.com"]]
+
+    async def test_rejected_entities_are_invalid(self):
+        async def insert(users):
+            return {users[0].id}
+
+        lines = await _collect(provision(
+            iter([{"email": f"{i}@example.com"} for i in range(3)]),
+            lambda record: User(tenant_id=uuid4(), email=record["email"]),
+            insert,
+            chunk_size=10,
+            rejection=lambda user: "User quota exceeded" if user.email != "2@example.com" else None
+        ))
+
+        assert [line.get("status") for line in lines[:-1]] == ["created", "invalid", "exists"]
+        assert lines[1]["error"] == "User quota exceeded"
+
+
+@pytest.fixture
+def tenant():
+    return Tenant(name="Acme", status=TenantStatus.ACTIVE, tier=TenantTier.FREE)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryUserRepository()
+
+
+@pytest.fixture
+async def client(tenant, repository, monkeypatch):
+    monkeypatch.setattr(settings, "BULK_CHUNK_SIZE", 4)
+    app = create_app()
+    app.state.token_verifier = TokenVerifier(SECRET)
+    app.state.tenant_resolver = StaticTenantResolver(tenant)
+    app.dependency_overrides[get_user_repository] = lambda: repository
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def _headers(tenant, **claims):
+    token = TokenIssuer(SECRET).issue("user-1", claims)["access_token"]
+    return {"Authorization": f"Bearer {token}", "X-Tenant-ID": str(tenant.id), "Content-Type": NDJSON}
+
+
+def _body(emails):
+    return "\n".join(json.dumps({"email": email}) for email in emails)
+
+
+@pytest.mark.unit
+class TestBulkUsers:
+    """POST /v1/users/bulk authorization and quota accounting"""
+
+    async def test_requires_token(self, client, tenant):
+        headers = _headers(tenant)
+        del headers["Authorization"]
+
+        response = await client.post("/v1/users/bulk", content=_body(["a@example.com"]), headers=headers)
+
+        assert response.status_code == 401
+
+    async def test_rejects_member_of_another_tenant(self, client, tenant):
+        response = await client.post(
+            "/v1/users/bulk",
+            content=_body(["a@example.com"]),
+            headers=_headers(tenant, tenant_id=str(uuid4()))
+        )
+
+        assert response.status_code == 403
+
+    async def test_admin_may_provision_any_tenant(self, client, tenant):
+        response = await client.post(
+            "/v1/users/bulk",
+            content=_body(["a@example.com"]),
+            headers=_headers(tenant, scope="platform:admin")
+        )
+
+        assert response.status_code == 200
+
+    async def test_existing_users_do_not_use_up_the_quota(self, client, tenant, repository):
+        max_users = TIER_POLICIES[TenantTier.FREE].max_users
+        emails = [f"user{i}@example.com" for i in range(max_users)]
+        # The first half twice: those come back as exists and must not count
+        body = _body(emails[:5] + emails[:5] + emails[5:] + ["over@example.com"])
+
+        headers = _headers(tenant, tenant_id=str(tenant.id))
+
+        response = await client.post("/v1/users/bulk", content=body, headers=headers)
+
+        summary = json.loads(response.text.splitlines()[-1])["summary"]
+        assert summary == {"created": max_users, "exists": 5, "invalid": 1}
+        assert await repository.count(tenant.id) == max_users
+        assert repository.chunks == [4, 4, 4, 4]
+
+    async def test_concurrent_requests_share_the_quota(self, client, tenant, repository):
+        max_users = TIER_POLICIES[TenantTier.FREE].max_users
+        headers = _headers(tenant, tenant_id=str(tenant.id))
+
+        responses = await asyncio.gather(*(
+            client.post(
+                "/v1/users/bulk",
+                content=_body([f"r{request}-{i}@example.com" for i in range(max_users)]),
+                headers=headers
+            )
+            for request in range(3)
+        ))
+
+        summaries = [json.loads(response.text.splitlines()[-1])["summary"] for response in responses]
+        created = sum(summary["created"] for summary in summaries)
+        assert created == max_users
+        assert await repository.count(tenant.id) == max_users
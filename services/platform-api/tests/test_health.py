@@ -0,0 +1,154 @@
+"""
+Unit tests for the background dependency health monitor and the health endpoints
+"""
+
+import asyncio
+import time
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.infrastructure.observability.health import HealthMonitor, HealthProbe, dependency_probes
+from src.main import create_app
+
+
+class FakeDependency:
+    """Ping target that counts calls and can fail or hang"""
+
+    def __init__(self, error: Exception = None, delay: float = 0.0):
+        self.error = error
+        self.delay = delay
+        self.pings = 0
+
+    async def ping(self) -> None:
+        self.pings += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+
+class FakeNats:
+    def __init__(self, is_connected: bool = True):
+        self.is_connected = is_connected
+
+    async def flush(self, timeout: float) -> None:
+        pass
+
+
+def _client(monitor: HealthMonitor) -> TestClient:
+    app = create_app()
+    app.state.health_monitor = monitor
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestHealthMonitor:
+    """Concurrent probes with timeouts, stored as a snapshot"""
+
+    async def test_slow_probe_times_out(self):
+        slow = FakeDependency(delay=1.0)
+        monitor = HealthMonitor([HealthProbe("slow", slow.ping, timeout_seconds=0.05)])
+
+        snapshot = await monitor.refresh()
+
+        result = snapshot.results["slow"]
+        assert not result.healthy
+        assert result.error == "timed out after 0.05s"
+        assert result.latency_ms < 500
+
+    async def test_probes_run_concurrently(self):
+        probes = [HealthProbe(f"dep-{i}", FakeDependency(delay=0.1).ping) for i in range(5)]
+        monitor = HealthMonitor(probes)
+
+        start = time.perf_counter()
+        snapshot = await monitor.refresh()
+
+        assert time.perf_counter() - start < 0.3
+        assert snapshot.healthy
+
+    async def test_failure_is_reported_by_message_or_type(self):
+        monitor = HealthMonitor([
+            HealthProbe("message", FakeDependency(ConnectionError("refused")).ping),
+            HealthProbe("bare", FakeDependency(ConnectionError()).ping)
+        ])
+
+        snapshot = await monitor.refresh()
+
+        assert snapshot.results["message"].to_dict()["error"] == "refused"
+        assert snapshot.results["bare"].to_dict()["error"] == "ConnectionError"
+
+    async def test_snapshot_reuses_stored_results(self):
+        database = FakeDependency(delay=0.01)
+        monitor = HealthMonitor([HealthProbe("database", database.ping)])
+
+        first = await asyncio.gather(*(monitor.snapshot() for _ in range(5)))
+        again = await monitor.snapshot()
+
+        assert database.pings == 1
+        assert all(snapshot is again for snapshot in first)
+
+    async def test_background_loop_refreshes_snapshot(self):
+        database = FakeDependency()
+        monitor = HealthMonitor([HealthProbe("database", database.ping)], interval_seconds=0.01)
+
+        await monitor.start()
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert database.pings > 1
+
+    async def test_nats_is_not_critical(self):
+        database, redis = FakeDependency(), FakeDependency()
+        monitor = HealthMonitor(dependency_probes(database, redis, lambda: FakeNats(is_connected=False)))
+
+        snapshot = await monitor.refresh()
+
+        assert not snapshot.results["nats"].healthy
+        assert not snapshot.healthy
+        assert snapshot.ready
+
+
+@pytest.mark.unit
+class TestHealthEndpoints:
+    """Endpoints answer from the snapshot"""
+
+    def test_ready_while_only_nats_is_down(self):
+        monitor = HealthMonitor(dependency_probes(FakeDependency(), FakeDependency(), lambda: None))
+        client = _client(monitor)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+        assert response.json()["checks"]["nats"]["status"] == "unhealthy"
+        assert client.get("/health/").json()["status"] == "degraded"
+
+    def test_not_ready_while_database_is_down(self):
+        database = FakeDependency(ConnectionError("database unreachable"))
+        monitor = HealthMonitor(dependency_probes(database, FakeDependency(), lambda: FakeNats()))
+        client = _client(monitor)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        assert response.json()["checks"]["database"]["error"] == "database unreachable"
+
+    def test_requests_do_not_probe(self):
+        database = FakeDependency()
+        monitor = HealthMonitor(dependency_probes(database, FakeDependency(), lambda: FakeNats()))
+        client = _client(monitor)
+
+        for path in ("/health/", "/health/ready", "/health/ready", "/health/"):
+            assert client.get(path).status_code == 200
+
+        assert database.pings == 1
+
+    def test_liveness_does_not_touch_the_monitor(self):
+        app = create_app()
+        app.state.health_monitor = None
+
+        response = TestClient(app).get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive"}
@@ -0,0 +1,169 @@
+"""
+Unit tests for the pure ASGI tenant, logging and metrics middlewares
+"""
+
+import asyncio
+import io
+import json
+
+import pytest
+from fastapi import FastAPI
+from prometheus_client import CollectorRegistry
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.testclient import TestClient
+
+from src.infrastructure.fastapi.middleware.logging import LoggingMiddleware
+from src.infrastructure.fastapi.middleware.metrics import MetricsMiddleware
+from src.infrastructure.fastapi.middleware.tenant import TenantMiddleware
+from src.infrastructure.observability.access_log import AccessLogWriter
+from src.infrastructure.observability.metrics import UNMATCHED_ROUTE, HttpMetrics
+
+
+async def _state(request):
+    return JSONResponse({
+        "tenant_id": request.state.tenant_id,
+        "request_id": request.state.request_id
+    })
+
+
+def _client(writer: AccessLogWriter = None) -> TestClient:
+    app = Starlette()
+    app.add_route("/state", _state)
+    app.add_middleware(TenantMiddleware)
+    app.add_middleware(LoggingMiddleware, writer=writer)
+    return TestClient(app)
+
+
+async def _call(app, on_send=None):
+    """Drive an ASGI app directly, returning the messages passed to send"""
+    messages = []
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream",
+        "query_string": b"", "headers": [(b"x-tenant-id", b"acme")], "client": ("10.0.0.1", 1234),
+        "server": ("test", 80), "scheme": "http", "root_path": "", "http_version": "1.1"
+    }
+
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        # The client stays connected until the response is complete
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+        if on_send is not None:
+            on_send(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+@pytest.mark.unit
+class TestRequestHeaders:
+    """Request ID, timing and tenant headers"""
+
+    def test_adds_response_headers(self):
+        response = _client().get("/state", headers={"X-Tenant-ID": "acme"})
+
+        assert response.headers["x-tenant-id"] == "acme"
+        assert response.headers["x-request-id"] == response.json()["request_id"]
+        assert float(response.headers["x-process-time"]) >= 0
+
+    def test_keeps_caller_request_id(self):
+        response = _client().get("/state", headers={"X-Request-Id": "req-1"})
+
+        assert response.headers["x-request-id"] == "req-1"
+        assert response.json()["request_id"] == "req-1"
+
+    def test_scope_state_reaches_request_state(self):
+        response = _client().get("/state", headers={"X-Tenant-ID": "acme", "X-Request-Id": "req-1"})
+
+        assert response.json() == {"tenant_id": "acme", "request_id": "req-1"}
+
+    def test_no_tenant_header_without_tenant(self):
+        response = _client().get("/state")
+
+        assert "x-tenant-id" not in response.headers
+        assert response.json()["tenant_id"] is None
+
+    def test_access_record_has_tenant_and_status(self):
+        stream = io.StringIO()
+        writer = AccessLogWriter(stream=stream)
+
+        _client(writer).get("/missing", headers={"X-Tenant-ID": "acme", "X-Request-Id": "req-1"})
+        writer._flush()
+
+        line = json.loads(stream.getvalue())
+        assert (line["path"], line["status"]) == ("/missing", 404)
+        assert (line["tenant_id"], line["request_id"]) == ("acme", "req-1")
+
+
+@pytest.mark.unit
+class TestStreaming:
+    """Response bodies pass through without buffering"""
+
+    async def test_chunk_is_sent_before_generator_finishes(self):
+        first_chunk_sent = asyncio.Event()
+
+        async def body():
+            yield b"first"
+            # Only completes once the first chunk has reached the client
+            await asyncio.wait_for(first_chunk_sent.wait(), timeout=1)
+            yield b"second"
+
+        async def endpoint(request):
+            return StreamingResponse(body())
+
+        inner = Starlette()
+        inner.add_route("/stream", endpoint)
+        app = MetricsMiddleware(
+            LoggingMiddleware(TenantMiddleware(inner), writer=None),
+            metrics=HttpMetrics(CollectorRegistry())
+        )
+
+        def signal_first_chunk(message):
+            if message.get("body") == b"first":
+                first_chunk_sent.set()
+
+        messages = await _call(app, signal_first_chunk)
+
+        start = messages[0]
+        assert start["type"] == "http.response.start"
+        assert (b"x-tenant-id", b"acme") in start["headers"]
+        assert [m.get("body") for m in messages[1:] if m.get("body")] == [b"first", b"second"]
+
+
+@pytest.mark.unit
+class TestMetricsLabels:
+    """Requests are labeled with the route template"""
+
+    def _client(self, registry: CollectorRegistry) -> TestClient:
+        app = FastAPI()
+
+        @app.get("/v1/tenants/{tenant_id}")
+        async def get_tenant(tenant_id: str):
+            return {"id": tenant_id}
+
+        app.add_middleware(MetricsMiddleware, metrics=HttpMetrics(registry))
+        return TestClient(app)
+
+    def test_matched_route_uses_template(self):
+        registry = CollectorRegistry()
+
+        self._client(registry).get("/v1/tenants/acme")
+
+        labels = {"method": "GET", "route": "/v1/tenants/{tenant_id}", "status": "200"}
+        assert registry.get_sample_value("http_requests_total", labels) == 1
+
+    def test_unknown_path_uses_unmatched_label(self):
+        registry = CollectorRegistry()
+        client = self._client(registry)
+
+        for path in ("/nope/1", "/nope/2"):
+            client.get(path)
+
+        labels = {"method": "GET", "route": UNMATCHED_ROUTE, "status": "404"}
+        assert registry.get_sample_value("http_requests_total", labels) == 2
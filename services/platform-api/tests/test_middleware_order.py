@@ -0,0 +1,29 @@
+"""
+Unit tests for the middleware stack assembled by create_app
+"""
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.adapters.outbound.cache.tenant_resolver import TenantResolver
+from src.main import create_app
+from tests.fakes import InMemoryTenantRepository
+
+
+@pytest.mark.unit
+class TestMiddlewareOrder:
+    """Observability and CORS wrap responses returned early by tenant checks"""
+
+    def test_rejected_tenant_response_has_cors_and_request_id(self):
+        app = create_app()
+        app.state.tenant_resolver = TenantResolver(InMemoryTenantRepository())
+        client = TestClient(app)
+
+        response = client.get(
+            "/v1/quotas",
+            headers={"X-Tenant-ID": "unknown", "Origin": "http://localhost:3000", "X-Request-Id": "req-1"}
+        )
+
+        assert response.status_code == 403
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+        assert response.headers["x-request-id"] == "req-1"
@@ -0,0 +1,154 @@
+"""
+Unit tests for relaying outbox events to NATS JetStream
+"""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.adapters.outbound.events.outbox_relay import OutboxRelay
+from src.adapters.outbound.persistence.outbox import ClaimedEvent, outbox_rows
+from src.domain.entities.tenant import Tenant, TenantStatus
+
+
+class InMemoryOutboxStore:
+    """Outbox rows in a list, claimed without the per-tenant exclusion of the SQL store"""
+
+    def __init__(self, events):
+        self.events = {event.id: event for event in events}
+        self.claimed = set()
+        self.sent = []
+
+    async def claim(self, limit, claim_seconds):
+        events = sorted(
+            (event for event in self.events.values() if event.id not in self.claimed),
+            key=lambda event: event.id
+        )[:limit]
+        self.claimed.update(event.id for event in events)
+        return events
+
+    async def mark_sent(self, ids):
+        for event_id in ids:
+            del self.events[event_id]
+            self.claimed.discard(event_id)
+        self.sent.extend(ids)
+
+    async def release(self, ids):
+        self.claimed.difference_update(ids)
+
+
+class FakeJetStream:
+    """Records published subjects; publishes of event ids in ``failing`` raise"""
+
+    def __init__(self):
+        self.published = []
+        self.failing = set()
+        self.in_flight = set()
+
+    async def add_stream(self, **kwargs):
+        pass
+
+    async def publish(self, subject, payload, timeout=None, headers=None):
+        event_id = headers["Nats-Msg-Id"]
+        self.in_flight.add(event_id)
+        await asyncio.sleep(0.001)
+        self.in_flight.discard(event_id)
+        if event_id in self.failing:
+            raise TimeoutError("nats: timeout")
+        self.published.append((subject, event_id))
+
+
+class FakeNats:
+    is_connected = True
+
+    def __init__(self, jetstream):
+        self._jetstream = jetstream
+
+    def jetstream(self):
+        return self._jetstream
+
+
+def _claimed(tenant_id, index, action="activated"):
+    return ClaimedEvent(index, uuid4(), tenant_id, f"tenant.{action}", {"n": index})
+
+
+@pytest.fixture
+def jetstream():
+    return FakeJetStream()
+
+
+@pytest.mark.unit
+class TestOutboxRelay:
+    """Claim, publish, then mark sent"""
+
+    async def test_publishes_and_deletes_batch(self, jetstream):
+        tenant_a, tenant_b = uuid4(), uuid4()
+        store = InMemoryOutboxStore([_claimed(tenant_a, 1), _claimed(tenant_b, 2), _claimed(tenant_a, 3)])
+        relay = OutboxRelay(store, lambda: FakeNats(jetstream))
+
+        assert await relay.relay_once() == 3
+
+        assert sorted(store.sent) == [1, 2, 3]
+        assert not store.events
+
+    async def test_tenant_events_publish_in_id_order(self, jetstream):
+        tenant_id = uuid4()
+        events = [_claimed(tenant_id, index) for index in range(1, 6)]
+        store = InMemoryOutboxStore(events)
+        relay = OutboxRelay(store, lambda: FakeNats(jetstream))
+
+        await relay.relay_once()
+
+        assert [event_id for _, event_id in jetstream.published] == [str(event.event_id) for event in events]
+
+    async def test_failure_stops_tenant_and_releases_the_rest(self, jetstream):
+        tenant_a, tenant_b = uuid4(), uuid4()
+        first, second = _claimed(tenant_a, 1), _claimed(tenant_a, 2)
+        other = _claimed(tenant_b, 3)
+        store = InMemoryOutboxStore([first, second, other])
+        jetstream.failing.add(str(first.event_id))
+        relay = OutboxRelay(store, lambda: FakeNats(jetstream))
+
+        assert await relay.relay_once() == 1
+
+        # The later event of the failed tenant was not published out of order
+        assert store.sent == [3]
+        assert set(store.events) == {1, 2} and not store.claimed
+
+        jetstream.failing.clear()
+        assert await relay.relay_once() == 2
+        assert [event_id for _, event_id in jetstream.published[1:]] == [str(first.event_id), str(second.event_id)]
+
+    async def test_waits_for_nats(self):
+        store = InMemoryOutboxStore([_claimed(uuid4(), 1)])
+        relay = OutboxRelay(store, lambda: None)
+
+        assert await relay.relay_once() == 0
+        assert store.events and not store.claimed
+
+
+@pytest.mark.unit
+class TestOutboxRows:
+    """Events raised by the tenant become outbox rows"""
+
+    def test_update_details_raises_tenant_updated(self):
+        tenant = Tenant(name="Acme", status=TenantStatus.ACTIVE, billing_email="old@acme.test")
+
+        tenant.update_details(name="Acme Corp", billing_email="old@acme.test")
+
+        [row] = outbox_rows(tenant.pull_events())
+        assert row["subject"] == "tenant.updated"
+        assert row["tenant_id"] == tenant.id
+        assert row["envelope"]["payload"] == {"slug": "acme", "changes": {"name": "Acme Corp"}}
+
+    def test_update_without_changes_raises_nothing(self):
+        tenant = Tenant(name="Acme")
+
+        tenant.update_details(name="Acme")
+
+        assert tenant.pull_events() == []
+
+    def test_rejects_fields_outside_details(self):
+        with pytest.raises(ValueError):
+            Tenant(name="Acme").update_details(tier="enterprise")
@@ -0,0 +1,120 @@
+"""
+Unit tests for keyset pagination cursors, page queries, row estimates and NDJSON streaming
+"""
+
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.adapters.inbound.rest.pagination import decode_cursor, encode_cursor, ndjson_lines
+from src.adapters.outbound.persistence.keyset import estimate_rows, keyset_page
+from src.adapters.outbound.persistence.models import UserModel
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+
+class FakeSession:
+    """Records executed SQL and answers with a canned EXPLAIN plan"""
+
+    def __init__(self, plan):
+        self.plan = plan
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement))
+        return FakeResult(self.plan)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+async def _items(items):
+    for item in items:
+        yield item
+
+
+@pytest.mark.unit
+class TestCursor:
+    """Opaque (created_at, id) cursors"""
+
+    def test_round_trip(self):
+        created_at, item_id = datetime(2024, 5, 17, 12, 30, 45, 123456), uuid4()
+
+        cursor = encode_cursor(created_at, item_id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == (created_at, item_id)
+
+    def test_missing_cursor_is_the_first_page(self):
+        assert decode_cursor(None) is None
+        assert decode_cursor("") is None
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "!!!", encode_cursor(datetime(2024, 1, 1), uuid4())[:-6]])
+    def test_malformed_cursor_is_a_400(self, cursor):
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(cursor)
+
+        assert error.value.status_code == 400
+
+
+@pytest.mark.unit
+class TestKeysetPage:
+    """Page queries seek the (created_at, id) index"""
+
+    def test_first_page_orders_and_limits(self):
+        sql = _sql(keyset_page(select(UserModel), UserModel, 50))
+
+        assert "ORDER BY users.created_at, users.id" in sql
+        assert "LIMIT" in sql
+        assert "OFFSET" not in sql
+        assert "(users.created_at, users.id) >" not in sql
+
+    def test_next_page_uses_row_value_comparison(self):
+        sql = _sql(keyset_page(select(UserModel), UserModel, 50, (datetime(2024, 1, 1), uuid4())))
+
+        assert "(users.created_at, users.id) > (" in sql
+        assert "OFFSET" not in sql
+
+
+@pytest.mark.unit
+class TestEstimateRows:
+    """Totals come from the planner, not a COUNT"""
+
+    @pytest.mark.parametrize("plan", [
+        [{"Plan": {"Plan Rows": 1234}}],
+        json.dumps([{"Plan": {"Plan Rows": 1234}}]),
+    ])
+    async def test_reads_plan_rows(self, plan):
+        session = FakeSession(plan)
+        tenant_id = uuid4()
+
+        rows = await estimate_rows(session, select(UserModel.id).where(UserModel.tenant_id == tenant_id))
+
+        assert rows == 1234
+        [sql] = session.statements
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert str(tenant_id) in sql
+
+
+@pytest.mark.unit
+class TestNdjsonLines:
+    """Streaming serialization in bounded chunks"""
+
+    async def test_yields_one_chunk_per_chunk_size_lines(self):
+        chunks = [chunk async for chunk in ndjson_lines(_items(range(5)), lambda i: {"i": i}, chunk_size=2)]
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+        lines = b"".join(chunks).splitlines()
+        assert [json.loads(line)["i"] for line in lines] == [0, 1, 2, 3, 4]
@@ -0,0 +1,114 @@
+"""
+Unit tests for monthly request quota enforcement
+"""
+
+import fakeredis
+import httpx
+import pytest
+
+from src.adapters.inbound.rest.dependencies import get_usage_repository
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier
+from src.adapters.outbound.cache.usage_meter import UsageMeter, current_period
+from src.domain.entities.tenant import TIER_POLICIES, Tenant, TenantStatus, TenantTier
+from src.main import create_app
+from tests.fakes import InMemoryUsageRepository, StaticTenantResolver
+
+SECRET = "test-secret"
+
+LIMIT = TIER_POLICIES[TenantTier.FREE].max_requests_per_month
+
+
+class FailingMeter:
+    """Usage meter whose quota reads fail, counting recorded requests"""
+
+    def __init__(self):
+        self.recorded = 0
+
+    async def is_quota_exceeded(self, tenant, quota_type):
+        raise ConnectionError("Redis connection lost")
+
+    def record(self, tenant_id, metric, amount=1):
+        self.recorded += amount
+
+
+@pytest.fixture
+def tenant():
+    return Tenant(name="Acme", status=TenantStatus.ACTIVE, tier=TenantTier.FREE)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryUsageRepository()
+
+
+@pytest.fixture
+def meter(repository):
+    return UsageMeter(fakeredis.FakeAsyncRedis(decode_responses=True), repository)
+
+
+def _app(tenant, meter, repository):
+    app = create_app()
+    app.state.token_verifier = TokenVerifier(SECRET)
+    app.state.tenant_resolver = StaticTenantResolver(tenant)
+    app.state.usage_meter = meter
+    app.dependency_overrides[get_usage_repository] = lambda: repository
+    return app
+
+
+@pytest.fixture
+async def client(tenant, meter, repository):
+    transport = httpx.ASGITransport(app=_app(tenant, meter, repository))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def _headers(tenant):
+    token = TokenIssuer(SECRET).issue("user-1", {"tenant_id": str(tenant.id)})["access_token"]
+    return {"Authorization": f"Bearer {token}", "X-Tenant-ID": str(tenant.id)}
+
+
+@pytest.mark.unit
+class TestQuotaEnforcement:
+    """Requests are rejected with 429 once the tier limit is reached"""
+
+    async def test_rejects_requests_at_tier_limit(self, client, tenant, meter, repository):
+        repository.rollups[(current_period(), tenant.id, "requests")] = LIMIT - 1
+        await meter.usage(tenant.id)
+
+        admitted = await client.get("/v1/unknown", headers=_headers(tenant))
+        rejected = await client.get("/v1/unknown", headers=_headers(tenant))
+
+        assert admitted.status_code == 404
+        assert rejected.status_code == 429
+        assert rejected.json() == {"detail": "Monthly request quota exceeded"}
+        assert await meter.current(tenant.id, "requests") == LIMIT
+
+    async def test_quotas_stay_reachable_when_exceeded(self, client, tenant, meter, repository):
+        repository.rollups[(current_period(), tenant.id, "requests")] = LIMIT
+        await meter.usage(tenant.id)
+
+        assert (await client.get("/v1/unknown", headers=_headers(tenant))).status_code == 429
+        response = await client.get("/v1/quotas/", headers=_headers(tenant))
+
+        assert response.status_code == 200
+        assert response.json()["quotas"]["requests"] == {"used": LIMIT + 1, "limit": LIMIT}
+
+    async def test_unlimited_tier_is_never_rejected(self, client, tenant, meter, repository):
+        tenant.tier = TenantTier.ENTERPRISE
+        repository.rollups[(current_period(), tenant.id, "requests")] = LIMIT * 10
+        await meter.usage(tenant.id)
+
+        response = await client.get("/v1/unknown", headers=_headers(tenant))
+
+        assert response.status_code == 404
+
+    async def test_meter_failure_admits_requests(self, tenant, repository, capsys):
+        meter = FailingMeter()
+        transport = httpx.ASGITransport(app=_app(tenant, meter, repository))
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [await client.get("/v1/unknown", headers=_headers(tenant)) for _ in range(2)]
+
+        assert [response.status_code for response in responses] == [404, 404]
+        assert meter.recorded == 2
+        assert capsys.readouterr().out.count("Usage meter unavailable") == 1
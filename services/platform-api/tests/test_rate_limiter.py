@@ -0,0 +1,142 @@
+"""
+Unit tests for the GCRA rate limiter and the identities it is keyed by
+"""
+
+import fakeredis
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier
+from src.adapters.outbound.cache.rate_limiter import RateLimit, RateLimiter, RateLimitResult
+from src.infrastructure.fastapi.middleware.rate_limit import RateLimitMiddleware
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.mark.unit
+class TestGcraScript:
+    """The Lua script against a real Redis command implementation"""
+
+    async def test_admits_burst_up_to_limit_then_rejects(self, redis):
+        limiter = RateLimiter(redis, [RateLimit(5, 60)], lease_size=0)
+
+        results = [await limiter.check(["tenant:a"]) for _ in range(6)]
+
+        assert [result.allowed for result in results] == [True] * 5 + [False]
+        assert [result.remaining for result in results[:5]] == [4, 3, 2, 1, 0]
+        assert 0 < results[5].retry_after_seconds <= 12
+
+    async def test_every_identity_must_allow(self, redis):
+        limiter = RateLimiter(redis, [RateLimit(2, 60)], lease_size=0)
+        await limiter.check(["tenant:a"])
+        await limiter.check(["tenant:a"])
+
+        result = await limiter.check(["tenant:a", "sub:user-1"])
+
+        assert not result.allowed
+        # A rejected request does not spend the other identity's budget
+        assert (await limiter.check(["sub:user-1"])).remaining == 1
+
+    async def test_tightest_limit_binds(self, redis):
+        limiter = RateLimiter(redis, [RateLimit(100, 60), RateLimit(3, 3600)], lease_size=0)
+
+        result = await limiter.check(["tenant:a"])
+
+        assert result.limit == RateLimit(3, 3600)
+        assert result.remaining == 2
+
+
+@pytest.mark.unit
+class TestLocalLeases:
+    """Tokens reserved in Redis and spent in-process"""
+
+    async def test_leased_tokens_skip_redis(self, redis):
+        limiter = RateLimiter(redis, [RateLimit(1000, 60)], lease_size=10)
+        calls = 0
+        script = limiter._script
+
+        async def counting_script(**kwargs):
+            nonlocal calls
+            calls += 1
+            return await script(**kwargs)
+
+        limiter._script = counting_script
+
+        results = [await limiter.check(["tenant:a"]) for _ in range(12)]
+
+        assert all(result.allowed for result in results)
+        # First call learns the remaining budget, second leases 10 more tokens
+        assert calls == 2
+
+    async def test_lease_never_over_admits(self, redis):
+        limiter = RateLimiter(redis, [RateLimit(50, 60)], lease_size=10)
+        other_replica = RateLimiter(redis, [RateLimit(50, 60)], lease_size=10)
+
+        admitted = 0
+        for _ in range(40):
+            for replica in (limiter, other_replica):
+                admitted += (await replica.check(["tenant:a"])).allowed
+
+        assert admitted <= 50
+
+    async def test_rejection_is_cached_until_retry_after(self, redis):
+        limiter = RateLimiter(redis, [RateLimit(1, 60)], lease_size=0)
+        await limiter.check(["tenant:a"])
+        assert not (await limiter.check(["tenant:a"])).allowed
+        await redis.flushall()
+
+        assert not (await limiter.check(["tenant:a"])).allowed
+
+
+class RecordingLimiter:
+    """Admits everything and records the identities of each check"""
+
+    def __init__(self):
+        self.checks = []
+
+    async def check(self, identities):
+        self.checks.append(list(identities))
+        return RateLimitResult(True, RateLimit(10, 60), 9, 6.0)
+
+    def policy_header(self):
+        return "10;w=60"
+
+
+def _client(limiter):
+    app = Starlette()
+    app.add_route("/", lambda request: PlainTextResponse("ok"))
+    app.add_middleware(RateLimitMiddleware)
+    app.state.rate_limiter = limiter
+    app.state.token_verifier = TokenVerifier("test-secret")
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestRateLimitIdentity:
+    """Only verified credentials get their own budget"""
+
+    def test_verified_token_is_keyed_by_subject(self):
+        limiter = RecordingLimiter()
+        token = TokenIssuer("test-secret").issue("user-1")["access_token"]
+
+        _client(limiter).get("/", headers={"Authorization": f"Bearer {token}"})
+
+        assert limiter.checks == [["sub:user-1"]]
+
+    @pytest.mark.parametrize("headers", [
+        {"Authorization": "Bearer forged-1"},
+        {"Authorization": "Bearer forged-2"},
+        {"X-API-Key": "anything"},
+        {},
+    ])
+    def test_unverified_credentials_are_keyed_by_client_address(self, headers):
+        limiter = RecordingLimiter()
+
+        _client(limiter).get("/", headers=headers)
+
+        assert limiter.checks == [["ip:testclient"]]
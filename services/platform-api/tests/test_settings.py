@@ -0,0 +1,30 @@
+"""
+Unit tests for settings parsed from the environment
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.infrastructure.config.settings import Settings
+
+
+@pytest.mark.unit
+class TestMetricsLatencyBuckets:
+    """METRICS_LATENCY_BUCKETS from a comma-separated environment variable"""
+
+    def test_comma_separated_env_value_is_sorted(self, monkeypatch):
+        monkeypatch.setenv("METRICS_LATENCY_BUCKETS", "1, 0.25,0.5,0.25")
+
+        assert Settings().metrics_latency_buckets == [0.25, 0.5, 1.0]
+
+    def test_default(self):
+        buckets = Settings().metrics_latency_buckets
+
+        assert buckets == sorted(buckets) and buckets[0] == 0.005
+
+    @pytest.mark.parametrize("value", ["0,1", "-0.5,1", "fast,slow", ""])
+    def test_rejects_invalid_buckets(self, monkeypatch, value):
+        monkeypatch.setenv("METRICS_LATENCY_BUCKETS", value)
+
+        with pytest.raises(ValidationError):
+            Settings()
@@ -0,0 +1,137 @@
+"""
+Unit tests for authorization and concurrent changes of the tenant administration endpoints
+"""
+
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+
+from src.adapters.inbound.rest.dependencies import get_tenant_repository
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier
+from src.domain.entities.tenant import Tenant, TenantStatus
+from src.main import create_app
+from tests.fakes import InMemoryTenantRepository
+
+SECRET = "test-secret"
+
+TENANT_ID = uuid4()
+
+ADMIN_ROUTES = [
+    ("GET", "/v1/tenants/", None),
+    ("GET", "/v1/tenants/export", None),
+    ("POST", "/v1/tenants/", {"name": "Acme", "organization_name": "Acme", "primary_contact_email": "a@acme.test"}),
+    ("POST", "/v1/tenants/bulk", None),
+    ("PATCH", f"/v1/tenants/{TENANT_ID}", {"name": "Renamed"}),
+    ("DELETE", f"/v1/tenants/{TENANT_ID}", None),
+    ("POST", f"/v1/tenants/{TENANT_ID}/activate", None),
+    ("POST", f"/v1/tenants/{TENANT_ID}/suspend", None),
+    ("POST", f"/v1/tenants/{TENANT_ID}/reactivate", None),
+    ("PUT", f"/v1/tenants/{TENANT_ID}/tier", {"tier": "pro"}),
+    ("PUT", f"/v1/tenants/{TENANT_ID}/features/sso", None),
+    ("DELETE", f"/v1/tenants/{TENANT_ID}/features/sso", None),
+]
+
+
+@pytest.fixture
+def repository():
+    return InMemoryTenantRepository(Tenant(id=TENANT_ID, name="Acme", status=TenantStatus.ACTIVE))
+
+
+@pytest.fixture
+def client(repository):
+    app = create_app()
+    app.state.token_verifier = TokenVerifier(SECRET)
+    app.dependency_overrides[get_tenant_repository] = lambda: repository
+    return TestClient(app)
+
+
+def _bearer(**claims) -> dict:
+    token = TokenIssuer(SECRET).issue("user-1", claims)["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.unit
+class TestTenantAdminAuthorization:
+    """Mutating and export routes require the admin scope"""
+
+    @pytest.mark.parametrize("method,path,body", ADMIN_ROUTES)
+    def test_rejects_missing_token(self, client, method, path, body):
+        response = client.request(method, path, json=body)
+
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("method,path,body", ADMIN_ROUTES)
+    def test_rejects_token_without_admin_scope(self, client, method, path, body):
+        response = client.request(method, path, json=body, headers=_bearer(scope="tenant:read"))
+
+        assert response.status_code == 403
+
+    def test_rejects_invalid_token(self, client):
+        response = client.post(
+            f"/v1/tenants/{TENANT_ID}/suspend",
+            headers={"Authorization": "Bearer not-a-token"}
+        )
+
+        assert response.status_code == 401
+
+    def test_admin_can_suspend(self, client, repository):
+        response = client.post(
+            f"/v1/tenants/{TENANT_ID}/suspend",
+            json={"reason": "billing"},
+            headers=_bearer(scope="openid platform:admin")
+        )
+
+        assert response.status_code == 200
+        assert repository.tenants[TENANT_ID].status == TenantStatus.SUSPENDED
+
+
+@pytest.mark.unit
+class TestConcurrentTenantChanges:
+    """Changes to one tenant are applied one after another, none is lost"""
+
+    async def test_concurrent_changes_both_apply(self, client, repository):
+        headers = _bearer(scope="platform:admin")
+        repository.gate = asyncio.Event()
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=client.app), base_url="http://test") as http:
+            pending = asyncio.gather(
+                http.put(f"/v1/tenants/{TENANT_ID}/features/sso", headers=headers),
+                http.post(f"/v1/tenants/{TENANT_ID}/suspend", json={"reason": "billing"}, headers=headers)
+            )
+            await asyncio.sleep(0.05)
+            repository.gate.set()
+            responses = await pending
+
+        assert [response.status_code for response in responses] == [200, 200]
+        tenant = repository.tenants[TENANT_ID]
+        assert tenant.status == TenantStatus.SUSPENDED
+        assert tenant.has_feature("sso")
+
+    def test_unknown_tenant_is_a_404(self, client):
+        response = client.post(f"/v1/tenants/{uuid4()}/activate", headers=_bearer(scope="platform:admin"))
+
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+class TestTenantMemberAuthorization:
+    """Reading a tenant requires membership or the admin scope"""
+
+    def test_member_can_read_own_tenant(self, client):
+        response = client.get(f"/v1/tenants/{TENANT_ID}", headers=_bearer(tenant_id=str(TENANT_ID)))
+
+        assert response.status_code == 200
+
+    def test_rejects_member_of_another_tenant(self, client):
+        for path in (f"/v1/tenants/{TENANT_ID}", f"/v1/tenants/{TENANT_ID}/tier/history"):
+            response = client.get(path, headers=_bearer(tenant_id=str(uuid4())))
+
+            assert response.status_code == 403
+
+    def test_admin_can_read_any_tenant(self, client):
+        response = client.get(f"/v1/tenants/{TENANT_ID}", headers=_bearer(scope="platform:admin"))
+
+        assert response.status_code == 200
@@ -0,0 +1,160 @@
+"""
+Unit tests for the layered tenant cache and tenant extraction
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.testclient import TestClient
+
+from src.adapters.outbound.cache.tenant_resolver import REDIS_KEY_PREFIX, TenantResolver
+from src.domain.entities.tenant import Tenant, TenantStatus
+from src.infrastructure.fastapi.middleware.tenant import TenantMiddleware
+from tests.fakes import InMemoryTenantRepository
+
+
+def _tenant(slug: str = "acme") -> Tenant:
+    return Tenant(name=slug.title(), slug=slug, status=TenantStatus.ACTIVE)
+
+
+@pytest.mark.unit
+class TestTenantResolver:
+    """Single-flight loading and invalidation"""
+
+    async def test_concurrent_misses_share_one_load(self):
+        tenant = _tenant()
+        repository = InMemoryTenantRepository(tenant)
+        resolver = TenantResolver(repository)
+
+        results = await asyncio.gather(*[resolver.resolve(str(tenant.id)) for _ in range(10)])
+
+        assert repository.loads == 1
+        assert {result.id for result in results} == {tenant.id}
+        assert (await resolver.resolve(str(tenant.id))).id == tenant.id
+        assert repository.loads == 1
+
+    async def test_unknown_tenant_is_cached_negatively(self):
+        repository = InMemoryTenantRepository()
+        resolver = TenantResolver(repository)
+
+        assert await resolver.resolve("missing") is None
+        assert await resolver.resolve("missing") is None
+        assert repository.loads == 1
+
+    async def test_invalidate_drops_local_and_redis_entries(self):
+        tenant = _tenant()
+        repository = InMemoryTenantRepository(tenant)
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        resolver = TenantResolver(repository, redis=redis)
+        await resolver.resolve(tenant.slug)
+        assert await redis.exists(REDIS_KEY_PREFIX + tenant.slug)
+
+        await resolver.invalidate(tenant.id, tenant.slug)
+
+        assert not await redis.exists(REDIS_KEY_PREFIX + tenant.slug)
+        await resolver.resolve(tenant.slug)
+        assert repository.loads == 2
+
+    async def test_load_overtaken_by_invalidation_is_not_cached(self):
+        tenant = _tenant()
+        repository = InMemoryTenantRepository(tenant)
+        redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+        resolver = TenantResolver(repository, redis=redis)
+        repository.gate = asyncio.Event()
+
+        # The load reads the tenant, then the tenant is suspended and invalidated
+        load = asyncio.ensure_future(resolver.resolve(tenant.slug))
+        await asyncio.sleep(0.01)
+        stale = repository.tenants[tenant.id]
+        repository.tenants[tenant.id] = Tenant.from_dict({**stale.to_dict(), "status": "suspended"})
+        await resolver.invalidate(tenant.id, tenant.slug)
+        repository.gate.set()
+
+        assert (await load).status == TenantStatus.ACTIVE
+        assert not await redis.exists(REDIS_KEY_PREFIX + tenant.slug)
+        assert (await resolver.resolve(tenant.slug)).status == TenantStatus.SUSPENDED
+        assert repository.loads == 2
+
+    async def test_failed_load_reaches_every_waiter(self):
+        class BrokenRepository(InMemoryTenantRepository):
+            async def get_by_slug(self, slug):
+                await asyncio.sleep(0.01)
+                raise RuntimeError("database down")
+
+        resolver = TenantResolver(BrokenRepository())
+
+        results = await asyncio.gather(
+            *[resolver.resolve("acme") for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not resolver._inflight and not resolver._generations
+
+    async def test_cancelled_caller_does_not_cancel_other_waiters(self):
+        tenant = _tenant()
+        repository = InMemoryTenantRepository(tenant)
+        repository.gate = asyncio.Event()
+        resolver = TenantResolver(repository)
+
+        owner = asyncio.ensure_future(resolver.resolve(tenant.slug))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(resolver.resolve(tenant.slug))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        await asyncio.sleep(0.01)
+        repository.gate.set()
+
+        assert (await waiter).id == tenant.id
+        assert owner.cancelled()
+        assert repository.loads == 1
+        assert (await resolver.resolve(tenant.slug)).id == tenant.id
+        assert repository.loads == 1
+
+
+def _client(base_domains=()) -> TestClient:
+    async def endpoint(request):
+        return JSONResponse({"tenant_id": request.state.tenant_id})
+
+    app = Starlette()
+    app.add_route("/whoami", endpoint)
+    app.add_middleware(TenantMiddleware, base_domains=base_domains)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestTenantExtraction:
+    """Header and subdomain tenant extraction"""
+
+    def test_header_wins(self):
+        response = _client(["dcoder.example.com"]).get(
+            "/whoami", headers={"Host": "acme.dcoder.example.com", "X-Tenant-ID": "other"}
+        )
+
+        assert response.json() == {"tenant_id": "other"}
+        assert response.headers["x-tenant-id"] == "other"
+
+    def test_subdomain_of_base_domain(self):
+        response = _client(["dcoder.example.com"]).get("/whoami", headers={"Host": "Acme.dcoder.example.com:8443"})
+
+        assert response.json() == {"tenant_id": "acme"}
+
+    @pytest.mark.parametrize("host", [
+        "acme.attacker.test",
+        "dcoder.example.com",
+        "a.b.dcoder.example.com",
+        "acmedcoder.example.com",
+        "10.0.0.1",
+    ])
+    def test_other_hosts_have_no_tenant(self, host):
+        response = _client(["dcoder.example.com"]).get("/whoami", headers={"Host": host})
+
+        assert response.json() == {"tenant_id": None}
+
+    def test_no_subdomain_lookup_without_base_domains(self):
+        response = _client(["", " "]).get("/whoami", headers={"Host": "acme.dcoder.example.com"})
+
+        assert response.json() == {"tenant_id": None}
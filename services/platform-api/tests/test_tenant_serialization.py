@@ -0,0 +1,92 @@
+"""
+Unit tests for Tenant entity serialization (to_dict / to_record / from_dict, orjson encoding)
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from src.domain.entities.tenant import Tenant, TenantStatus, TenantTier
+from src.infrastructure import serialization
+from src.infrastructure.serialization import dumps, loads
+
+
+def _tenant(**overrides) -> Tenant:
+    values = dict(
+        name="Acme Corp",
+        status=TenantStatus.SUSPENDED,
+        tier=TenantTier.PRO,
+        organization_name="Acme Corporation",
+        organization_domain="acme.test",
+        primary_contact_email="ops@acme.test",
+        settings={"region": "eu", "limits": {"burst": 5}},
+        features=["sso", "audit-log"],
+        max_users=50,
+        created_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+        updated_at=datetime(2024, 2, 3, 4, 5, 6),
+        activated_at=datetime(2024, 1, 3, 0, 0, 0, 1),
+        suspended_at=None
+    )
+    values.update(overrides)
+    return Tenant(**values)
+
+
+@pytest.mark.unit
+class TestTenantSerialization:
+    """Record encoding matches to_dict() and round-trips through from_dict()"""
+
+    def test_record_round_trips_through_from_dict(self):
+        tenant = _tenant()
+
+        restored = Tenant.from_dict(loads(dumps(tenant.to_record())))
+
+        assert restored == tenant
+        assert restored.status is TenantStatus.SUSPENDED
+        assert restored.tier is TenantTier.PRO
+        assert restored.created_at == datetime(2024, 1, 2, 3, 4, 5, 678901)
+        assert restored.features == ["sso", "audit-log"]
+        assert restored.suspended_at is None
+
+    def test_orjson_output_matches_to_dict(self):
+        tenant = _tenant()
+
+        encoded = dumps(tenant.to_record())
+
+        assert serialization.orjson is not None
+        assert loads(encoded) == tenant.to_dict()
+        assert encoded == json.dumps(tenant.to_dict(), separators=(",", ":")).encode()
+
+    def test_stdlib_fallback_matches_orjson(self, monkeypatch):
+        tenant = _tenant()
+        expected = dumps(tenant.to_record())
+
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert dumps(tenant.to_record()) == expected
+        assert loads(expected) == tenant.to_dict()
+
+    def test_pending_events_are_not_serialized(self):
+        tenant = _tenant(status=TenantStatus.ACTIVE)
+        tenant.add_feature("webhooks")
+        assert tenant.events
+
+        record = tenant.to_record()
+        restored = Tenant.from_dict(loads(dumps(record)))
+
+        assert "events" not in record
+        assert "events" not in tenant.to_dict()
+        assert restored.events == []
+        assert restored.features == ["sso", "audit-log", "webhooks"]
+
+    def test_record_fields_follow_to_dict(self):
+        tenant = _tenant()
+
+        assert list(tenant.to_record()) == list(tenant.to_dict())
+
+    def test_entity_is_slotted(self):
+        tenant = _tenant()
+
+        assert not hasattr(tenant, "__dict__")
+        with pytest.raises(AttributeError):
+            tenant.unknown_field = 1
@@ -0,0 +1,120 @@
+"""
+Unit tests for the tier policy table and the tier history
+"""
+
+from uuid import uuid4
+
+import pytest
+from starlette.testclient import TestClient
+
+from src.adapters.inbound.rest.dependencies import get_tenant_repository
+from src.adapters.outbound.auth.tokens import TokenIssuer, TokenVerifier
+from src.adapters.outbound.persistence.tier_history import tier_history_rows
+from src.domain.entities.tenant import QUOTA_TYPES, TIER_POLICIES, UNLIMITED, Tenant, TenantStatus, TenantTier
+from src.domain.events.tenant_events import TenantFeatureAdded, TenantTierChanged
+from src.main import create_app
+from tests.fakes import InMemoryTenantRepository
+
+SECRET = "test-secret"
+
+
+def _active_tenant(tier: TenantTier = TenantTier.FREE) -> Tenant:
+    return Tenant(name="Acme", status=TenantStatus.ACTIVE, tier=tier)
+
+
+@pytest.mark.unit
+class TestTierPolicies:
+    """Quotas come from the shared, read-only policy table"""
+
+    def test_every_tier_has_a_policy_for_every_quota(self):
+        for tier in TenantTier:
+            for quota_type in QUOTA_TYPES:
+                assert isinstance(TIER_POLICIES[tier].limit(quota_type), int)
+
+    def test_policy_table_is_read_only(self):
+        with pytest.raises(TypeError):
+            TIER_POLICIES[TenantTier.FREE] = TIER_POLICIES[TenantTier.PRO]
+        with pytest.raises(AttributeError):
+            TIER_POLICIES[TenantTier.FREE].max_users = 1000
+
+    def test_quota_check_follows_the_tier(self):
+        tenant = _active_tenant()
+        free_users = TIER_POLICIES[TenantTier.FREE].max_users
+
+        assert tenant.is_quota_exceeded("users", free_users)
+        tenant.update_tier(TenantTier.PRO)
+        assert not tenant.is_quota_exceeded("users", free_users)
+        tenant.update_tier(TenantTier.ENTERPRISE)
+        assert TIER_POLICIES[TenantTier.ENTERPRISE].max_users == UNLIMITED
+        assert not tenant.is_quota_exceeded("users", 10 ** 9)
+
+    def test_unknown_quota_type_allows_nothing(self):
+        assert _active_tenant(TenantTier.ENTERPRISE).is_quota_exceeded("gpus", 0)
+
+    def test_update_tier_applies_policy_quotas(self):
+        tenant = _active_tenant()
+
+        tenant.update_tier(TenantTier.PRO)
+
+        policy = TIER_POLICIES[TenantTier.PRO]
+        assert (tenant.max_users, tenant.max_requests_per_month, tenant.max_storage_gb) == (
+            policy.max_users, policy.max_requests_per_month, policy.max_storage_gb
+        )
+        [event] = tenant.pull_events()
+        assert (event.old_tier, event.new_tier) == ("free", "pro")
+
+    def test_update_to_current_tier_is_a_no_op(self):
+        tenant = _active_tenant(TenantTier.PRO)
+        updated_at = tenant.updated_at
+
+        tenant.update_tier(TenantTier.PRO)
+
+        assert tenant.pull_events() == []
+        assert tenant.updated_at == updated_at
+
+    def test_tier_history_stays_out_of_the_entity(self):
+        tenant = _active_tenant()
+        before = tenant.to_dict()
+
+        for tier in (TenantTier.PRO, TenantTier.ENTERPRISE, TenantTier.PRO, TenantTier.FREE):
+            tenant.update_tier(tier)
+
+        after = tenant.to_dict()
+        assert after.keys() == before.keys()
+        assert after["settings"] == before["settings"] == {}
+
+
+@pytest.mark.unit
+class TestTierHistory:
+    """Tier changes are appended to the audit store by the repository"""
+
+    def test_rows_only_for_tier_changes(self):
+        tenant_id = uuid4()
+        events = [
+            TenantFeatureAdded(tenant_id=tenant_id, slug="acme", feature="sso"),
+            TenantTierChanged(tenant_id=tenant_id, slug="acme", old_tier="free", new_tier="pro")
+        ]
+
+        [row] = tier_history_rows(events)
+
+        assert (row["tenant_id"], row["old_tier"], row["new_tier"]) == (tenant_id, "free", "pro")
+        assert row["event_id"] == events[1].event_id
+
+    def test_tier_changes_are_listed_newest_first(self):
+        tenant = _active_tenant()
+        repository = InMemoryTenantRepository(tenant)
+        app = create_app()
+        app.state.token_verifier = TokenVerifier(SECRET)
+        app.dependency_overrides[get_tenant_repository] = lambda: repository
+        client = TestClient(app)
+        token = TokenIssuer(SECRET).issue("admin", {"scope": "platform:admin"})["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for tier in ("pro", "pro", "enterprise"):
+            response = client.put(f"/v1/tenants/{tenant.id}/tier", json={"tier": tier}, headers=headers)
+            assert response.status_code == 200
+
+        response = client.get(f"/v1/tenants/{tenant.id}/tier/history", headers=headers)
+
+        history = response.json()["history"]
+        assert [(change["from"], change["to"]) for change in history] == [("pro", "enterprise"), ("free", "pro")]
@@ -0,0 +1,268 @@
+"""
+Unit tests for token verification, JWKS key rotation, revocation and the auth endpoints
+"""
+
+import time
+
+import fakeredis
+import httpx
+import pytest
+import rsa
+from jose import jwk, jwt
+
+from src.adapters.outbound.auth.jwks import JwksCache
+from src.adapters.outbound.auth.revocation import RevocationList
+from src.adapters.outbound.auth.tokens import InvalidToken, TokenIssuer, TokenVerifier
+from src.main import create_app
+
+SECRET = "test-secret"
+
+IDP_ISSUER = "https://idp.test/oidc"
+
+JWKS_URL = "https://idp.test/oidc/jwks"
+
+
+def _signing_key(kid: str):
+    """Private key PEM and public JWK (with kid) of a fresh RSA key"""
+    _, private_key = rsa.newkeys(1024)
+    pem = private_key.save_pkcs1().decode()
+    public = jwk.construct(pem, "RS256").public_key().to_dict()
+    public["kid"] = kid
+    return pem, public
+
+
+OLD_KEY = _signing_key("old")
+NEW_KEY = _signing_key("new")
+
+
+def _identity_token(key, subject: str = "user-1", **claims) -> str:
+    pem, public = key
+    claims = {"sub": subject, "iss": IDP_ISSUER, "exp": time.time() + 300, **claims}
+    return jwt.encode(claims, pem, algorithm="RS256", headers={"kid": public["kid"]})
+
+
+class FakeIdentityProvider:
+    """JWKS endpoint publishing a mutable key set, counting fetches"""
+
+    def __init__(self, *keys):
+        self.keys = [public for _, public in keys]
+        self.fetches = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.fetches += 1
+        return httpx.Response(200, json={"keys": self.keys})
+
+
+def _jwks(provider: FakeIdentityProvider, **kwargs) -> JwksCache:
+    cache = JwksCache(JWKS_URL, **kwargs)
+    cache._client = httpx.AsyncClient(transport=httpx.MockTransport(provider.handler))
+    return cache
+
+
+@pytest.fixture
+def revocations():
+    return RevocationList(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+@pytest.mark.unit
+class TestTokenVerifier:
+    """Claims cache and revocation checks"""
+
+    async def test_repeat_verification_is_served_from_cache(self, monkeypatch):
+        verifier = TokenVerifier(SECRET)
+        token = TokenIssuer(SECRET).issue("user-1")["access_token"]
+        decodes = []
+        decode = verifier._decode
+
+        async def counting_decode(token):
+            decodes.append(token)
+            return await decode(token)
+
+        monkeypatch.setattr(verifier, "_decode", counting_decode)
+
+        first = await verifier.verify(token)
+        second = await verifier.verify(token)
+
+        assert first == second
+        assert len(decodes) == 1
+
+    async def test_evicts_least_recently_used_token(self):
+        verifier = TokenVerifier(SECRET, max_entries=2)
+        issuer = TokenIssuer(SECRET)
+        first, second, third = (issuer.issue(f"user-{i}")["access_token"] for i in range(3))
+
+        await verifier.verify(first)
+        await verifier.verify(second)
+        await verifier.verify(first)
+        await verifier.verify(third)
+
+        assert len(verifier._claims) == 2
+        cached = {claims["sub"] for _, claims in verifier._claims.values()}
+        assert cached == {"user-0", "user-2"}
+
+    async def test_rejects_wrong_token_type(self):
+        verifier = TokenVerifier(SECRET)
+        refresh = TokenIssuer(SECRET).issue("user-1")["refresh_token"]
+
+        with pytest.raises(InvalidToken):
+            await verifier.verify(refresh)
+
+    async def test_rejects_revoked_token_after_caching(self, revocations):
+        verifier = TokenVerifier(SECRET, revocations=revocations)
+        token = TokenIssuer(SECRET).issue("user-1")["access_token"]
+        claims = await verifier.verify(token)
+
+        await revocations.revoke(claims["jti"], claims["exp"])
+
+        with pytest.raises(InvalidToken):
+            await verifier.verify(token)
+
+    async def test_rejects_every_token_of_revoked_family(self, revocations):
+        verifier = TokenVerifier(SECRET, revocations=revocations)
+        issuer = TokenIssuer(SECRET)
+        tokens = [issuer.issue("user-1", {"fam": "family-1"})["access_token"] for _ in range(2)]
+        other = issuer.issue("user-1", {"fam": "family-2"})["access_token"]
+
+        await revocations.revoke_family("family-1", time.time() + 60)
+
+        for token in tokens:
+            with pytest.raises(InvalidToken):
+                await verifier.verify(token)
+        assert (await verifier.verify(other))["fam"] == "family-2"
+
+
+@pytest.mark.unit
+class TestRevocationList:
+    """Revocations shared through Redis"""
+
+    async def test_revoke_once_has_a_single_winner(self, revocations):
+        replica = RevocationList(revocations.redis)
+
+        results = [
+            await revocations.revoke_once("jti-1", time.time() + 60),
+            await replica.revoke_once("jti-1", time.time() + 60)
+        ]
+
+        assert results == [True, False]
+
+    async def test_sync_picks_up_other_replicas_and_drops_expired(self, revocations):
+        replica = RevocationList(revocations.redis)
+        await revocations.revoke("live", time.time() + 60)
+        await revocations.revoke("expired", time.time() - 1)
+
+        await replica.sync()
+
+        assert replica.is_revoked("live")
+        assert not replica.is_revoked("expired")
+
+
+@pytest.mark.unit
+class TestJwksRotation:
+    """Identity provider keys are re-fetched for unknown key ids"""
+
+    async def test_verifies_token_signed_with_rotated_key(self):
+        provider = FakeIdentityProvider(OLD_KEY)
+        jwks = _jwks(provider, min_refresh_interval_seconds=0)
+        verifier = TokenVerifier(SECRET, jwks=jwks, jwks_issuer=IDP_ISSUER)
+        await jwks._refresh()
+
+        assert (await verifier.verify(_identity_token(OLD_KEY), "identity"))["sub"] == "user-1"
+
+        provider.keys = [NEW_KEY[1]]
+        claims = await verifier.verify(_identity_token(NEW_KEY, "user-2"), "identity")
+
+        assert claims["sub"] == "user-2"
+        assert provider.fetches == 2
+
+    async def test_unknown_key_refetch_is_throttled(self):
+        provider = FakeIdentityProvider(OLD_KEY)
+        jwks = _jwks(provider, min_refresh_interval_seconds=60)
+        verifier = TokenVerifier(SECRET, jwks=jwks, jwks_issuer=IDP_ISSUER)
+        await jwks._refresh()
+
+        for _ in range(3):
+            with pytest.raises(InvalidToken):
+                await verifier.verify(_identity_token(NEW_KEY), "identity")
+
+        assert provider.fetches == 1
+
+    async def test_failed_fetch_keeps_cached_keys(self):
+        provider = FakeIdentityProvider(OLD_KEY)
+        jwks = _jwks(provider, min_refresh_interval_seconds=0)
+        await jwks._refresh()
+        provider.handler = lambda request: httpx.Response(503)
+        jwks._client = httpx.AsyncClient(transport=httpx.MockTransport(provider.handler))
+
+        await jwks._refresh()
+
+        assert await jwks.get_key("old") is not None
+
+
+@pytest.fixture
+async def auth_client(revocations):
+    app = create_app()
+    provider = FakeIdentityProvider(OLD_KEY)
+    jwks = _jwks(provider)
+    await jwks._refresh()
+    app.state.token_verifier = TokenVerifier(
+        SECRET, jwks=jwks, jwks_issuer=IDP_ISSUER, revocations=revocations
+    )
+    app.state.token_issuer = TokenIssuer(SECRET)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.unit
+class TestAuthEndpoints:
+    """Login tenant binding and refresh token rotation"""
+
+    async def test_login_takes_tenant_from_identity_claims(self, auth_client):
+        token = _identity_token(OLD_KEY, tenant_id="acme")
+
+        response = await auth_client.post("/v1/auth/login", json={"token": token})
+
+        assert response.status_code == 200
+        claims = jwt.get_unverified_claims(response.json()["access_token"])
+        assert claims["tenant_id"] == "acme"
+
+    async def test_login_rejects_tenant_header_of_another_tenant(self, auth_client):
+        token = _identity_token(OLD_KEY, tenant_id="acme")
+
+        response = await auth_client.post(
+            "/v1/auth/login", json={"token": token}, headers={"X-Tenant-ID": "globex"}
+        )
+
+        assert response.status_code == 403
+
+    async def test_login_rejects_tenant_header_without_tenant_claim(self, auth_client):
+        response = await auth_client.post(
+            "/v1/auth/login", json={"token": _identity_token(OLD_KEY)}, headers={"X-Tenant-ID": "acme"}
+        )
+
+        assert response.status_code == 403
+
+    async def test_refresh_token_is_single_use(self, auth_client):
+        login = await auth_client.post("/v1/auth/login", json={"token": _identity_token(OLD_KEY)})
+        refresh = login.json()["refresh_token"]
+
+        first = await auth_client.post("/v1/auth/refresh", json={"refresh_token": refresh})
+        second = await auth_client.post("/v1/auth/refresh", json={"refresh_token": refresh})
+
+        assert first.status_code == 200
+        assert second.status_code == 401
+
+    async def test_refresh_token_reuse_revokes_the_family(self, auth_client):
+        login = (await auth_client.post("/v1/auth/login", json={"token": _identity_token(OLD_KEY)})).json()
+        rotated = (await auth_client.post(
+            "/v1/auth/refresh", json={"refresh_token": login["refresh_token"]}
+        )).json()
+
+        await auth_client.post("/v1/auth/refresh", json={"refresh_token": login["refresh_token"]})
+
+        for token in (login["access_token"], rotated["access_token"]):
+            response = await auth_client.post(
+                "/v1/auth/logout", headers={"Authorization": f"Bearer {token}"}
+            )
+            assert response.status_code == 401
+        response = await auth_client.post("/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+        assert response.status_code == 401
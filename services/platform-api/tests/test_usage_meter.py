@@ -0,0 +1,104 @@
+"""
+Unit tests for usage metering through Redis into Postgres rollups
+"""
+
+import asyncio
+from uuid import uuid4
+
+import fakeredis
+import pytest
+
+from src.adapters.outbound.cache.usage_meter import FLUSHING_KEY, UsageMeter, current_period
+from tests.fakes import InMemoryUsageRepository
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryUsageRepository()
+
+
+@pytest.fixture
+def meter(redis, repository):
+    return UsageMeter(redis, repository, cache_ttl_seconds=60.0)
+
+
+@pytest.mark.unit
+class TestUsageFlush:
+    """Deltas move from Redis to the rollups exactly once"""
+
+    async def test_flush_moves_pending_deltas_to_rollups(self, meter, repository):
+        tenant_id = uuid4()
+        for _ in range(3):
+            meter.record(tenant_id, "requests")
+        await meter.sync()
+
+        assert await meter.flush() == 1
+        assert repository.rollups[(current_period(), tenant_id, "requests")] == 3
+        assert await meter.flush() == 0
+
+    async def test_retried_flush_does_not_double_count(self, meter, redis, repository):
+        tenant_id = uuid4()
+        meter.record(tenant_id, "requests", 5)
+        await meter.sync()
+
+        # First attempt applies the batch but dies before clearing it from Redis
+        original_delete = redis.delete
+
+        async def failing_delete(*keys):
+            if FLUSHING_KEY in keys:
+                raise ConnectionError("Redis connection lost")
+            return await original_delete(*keys)
+
+        redis.delete = failing_delete
+        with pytest.raises(ConnectionError):
+            await meter.flush()
+        redis.delete = original_delete
+
+        await meter.flush()
+
+        assert repository.rollups[(current_period(), tenant_id, "requests")] == 5
+        assert len(repository.batches) == 1
+
+
+@pytest.mark.unit
+class TestUsageTotals:
+    """Quota reads never wait on Redis or Postgres"""
+
+    async def test_miss_fails_open_and_loads_in_background(self, meter, repository):
+        tenant_id = uuid4()
+        repository.rollups[(current_period(), tenant_id, "requests")] = 7
+
+        assert await meter.current(tenant_id, "requests") == 0
+        await asyncio.sleep(0.01)
+
+        assert await meter.current(tenant_id, "requests") == 7
+
+    async def test_usage_waits_for_totals(self, meter, repository):
+        tenant_id = uuid4()
+        repository.rollups[(current_period(), tenant_id, "requests")] = 7
+        meter.record(tenant_id, "requests")
+
+        assert await meter.usage(tenant_id) == {"requests": 8}
+
+    async def test_reseed_includes_unflushed_deltas(self, redis, repository):
+        tenant_id = uuid4()
+        period = current_period()
+        repository.rollups[(period, tenant_id, "requests")] = 10
+        replica = UsageMeter(redis, repository)
+        replica.record(tenant_id, "requests", 4)
+        await replica.sync()
+
+        # Redis loses the totals hash; 4 requests are still only in the pending deltas
+        await redis.delete(UsageMeter._totals_key(period, tenant_id))
+        meter = UsageMeter(redis, repository)
+
+        assert await meter.usage(tenant_id) == {"requests": 14}
+
+        meter.record(tenant_id, "requests")
+        await meter.sync()
+        assert await redis.hget(UsageMeter._totals_key(period, tenant_id), "requests") == "15"